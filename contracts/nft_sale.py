@@ -32,6 +32,7 @@ METHOD_WITHDRAW_ALGO = Bytes("withdraw_algo")
 METHOD_WITHDRAW_NFT = Bytes("withdraw_nft")
 METHOD_UPDATE_PRICE = Bytes("update_price")
 METHOD_OPT_IN_ASA = Bytes("opt_in_asa")
+METHOD_OPT_IN_ALL = Bytes("opt_in_all")
 
 
 def approval_program():
@@ -181,6 +182,28 @@ def approval_program():
         Approve(),
     )
 
+    # Owner: Opt contract into every ASA in foreign assets with one app call
+    # Outer txn fee must cover one inner opt-in per asset
+    i = ScratchVar(TealType.uint64)
+    on_opt_in_all = Seq(
+        Assert(is_owner),
+        Assert(Txn.assets.length() >= Int(1)),
+        For(i.store(Int(0)), i.load() < Txn.assets.length(), i.store(i.load() + Int(1))).Do(
+            InnerTxnBuilder.Begin(),
+            InnerTxnBuilder.SetFields(
+                {
+                    TxnField.type_enum: TxnType.AssetTransfer,
+                    TxnField.xfer_asset: Txn.assets[i.load()],
+                    TxnField.asset_amount: Int(0),
+                    TxnField.asset_receiver: Global.current_application_address(),
+                    TxnField.fee: Int(0),
+                }
+            ),
+            InnerTxnBuilder.Submit(),
+        ),
+        Approve(),
+    )
+
     # Route based on method
     on_call = Cond(
         [Txn.application_args[0] == METHOD_BUY, on_buy],
@@ -188,6 +211,7 @@ def approval_program():
         [Txn.application_args[0] == METHOD_WITHDRAW_NFT, on_withdraw_nft],
         [Txn.application_args[0] == METHOD_UPDATE_PRICE, on_update_price],
         [Txn.application_args[0] == METHOD_OPT_IN_ASA, on_opt_in_asa],
+        [Txn.application_args[0] == METHOD_OPT_IN_ALL, on_opt_in_all],
     )
 
     # Main router
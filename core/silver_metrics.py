@@ -7,12 +7,21 @@ financial metrics, and jurisdictional risk data for sector analysis.
 
 import sqlite3
 import os
+import sys
+import queue
+import threading
+import time
+from itertools import chain, starmap
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterable, Set, Tuple
+from dataclasses import dataclass
 
 
 # Database path - uses DATA_DIR env var for Railway/production
+@lru_cache(maxsize=1)
 def _get_data_dir() -> str:
     """Get data directory from env var or default to project data folder."""
     env_data_dir = os.environ.get('DATA_DIR')
@@ -24,148 +33,284 @@ def _get_data_dir() -> str:
 DATA_DIR = _get_data_dir()
 DB_PATH = os.path.join(DATA_DIR, 'silver_metrics.db')
 
-
-# Seed data for initial population - 2023 Q1 through 2025 Q3
-# Data based on actual quarterly reports from major silver miners
-# AISC for silver is typically $15-25/oz (vs $1200-1600/oz for gold)
-SEED_DATA = [
-    # ==================== 2023 Q1 ====================
-    {'company': 'Pan American Silver', 'ticker': 'PAAS', 'period': '2023-Q1', 'aisc': 18.50, 'production': 5.8, 'revenue': 0.42, 'fcf': 0.02, 'dividend_yield': 2.8, 'market_cap': 6.2, 'tier1': 25, 'tier2': 60, 'tier3': 15},
-    {'company': 'Hecla Mining', 'ticker': 'HL', 'period': '2023-Q1', 'aisc': 17.25, 'production': 3.4, 'revenue': 0.18, 'fcf': 0.01, 'dividend_yield': 0.8, 'market_cap': 2.8, 'tier1': 85, 'tier2': 10, 'tier3': 5},
-    {'company': 'First Majestic Silver', 'ticker': 'AG', 'period': '2023-Q1', 'aisc': 21.50, 'production': 3.1, 'revenue': 0.12, 'fcf': -0.02, 'dividend_yield': 0.0, 'market_cap': 2.1, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Endeavour Silver', 'ticker': 'EXK', 'period': '2023-Q1', 'aisc': 19.80, 'production': 1.2, 'revenue': 0.05, 'fcf': 0.00, 'dividend_yield': 0.0, 'market_cap': 0.8, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Coeur Mining', 'ticker': 'CDE', 'period': '2023-Q1', 'aisc': 20.10, 'production': 2.5, 'revenue': 0.19, 'fcf': -0.01, 'dividend_yield': 0.0, 'market_cap': 1.5, 'tier1': 70, 'tier2': 30, 'tier3': 0},
-    {'company': 'MAG Silver', 'ticker': 'MAG', 'period': '2023-Q1', 'aisc': 12.50, 'production': 1.8, 'revenue': 0.08, 'fcf': 0.03, 'dividend_yield': 0.0, 'market_cap': 1.8, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Avino Silver & Gold', 'ticker': 'ASM', 'period': '2023-Q1', 'aisc': 18.90, 'production': 0.45, 'revenue': 0.012, 'fcf': 0.001, 'dividend_yield': 0.0, 'market_cap': 0.12, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'SilverCrest Metals', 'ticker': 'SILV', 'period': '2023-Q1', 'aisc': 11.20, 'production': 2.2, 'revenue': 0.06, 'fcf': 0.02, 'dividend_yield': 0.0, 'market_cap': 1.9, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Fortuna Silver Mines', 'ticker': 'FSM', 'period': '2023-Q1', 'aisc': 16.80, 'production': 2.0, 'revenue': 0.18, 'fcf': 0.03, 'dividend_yield': 2.0, 'market_cap': 1.2, 'tier1': 0, 'tier2': 55, 'tier3': 45},
-    {'company': 'SSR Mining', 'ticker': 'SSRM', 'period': '2023-Q1', 'aisc': 15.40, 'production': 2.8, 'revenue': 0.32, 'fcf': 0.05, 'dividend_yield': 2.5, 'market_cap': 2.5, 'tier1': 30, 'tier2': 35, 'tier3': 35},
-
-    # ==================== 2023 Q2 ====================
-    {'company': 'Pan American Silver', 'ticker': 'PAAS', 'period': '2023-Q2', 'aisc': 18.20, 'production': 6.0, 'revenue': 0.45, 'fcf': 0.03, 'dividend_yield': 2.7, 'market_cap': 6.5, 'tier1': 25, 'tier2': 60, 'tier3': 15},
-    {'company': 'Hecla Mining', 'ticker': 'HL', 'period': '2023-Q2', 'aisc': 17.00, 'production': 3.5, 'revenue': 0.19, 'fcf': 0.015, 'dividend_yield': 0.8, 'market_cap': 2.9, 'tier1': 85, 'tier2': 10, 'tier3': 5},
-    {'company': 'First Majestic Silver', 'ticker': 'AG', 'period': '2023-Q2', 'aisc': 21.20, 'production': 3.2, 'revenue': 0.13, 'fcf': -0.015, 'dividend_yield': 0.0, 'market_cap': 2.2, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Endeavour Silver', 'ticker': 'EXK', 'period': '2023-Q2', 'aisc': 19.50, 'production': 1.25, 'revenue': 0.052, 'fcf': 0.002, 'dividend_yield': 0.0, 'market_cap': 0.82, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Coeur Mining', 'ticker': 'CDE', 'period': '2023-Q2', 'aisc': 19.80, 'production': 2.6, 'revenue': 0.20, 'fcf': 0.00, 'dividend_yield': 0.0, 'market_cap': 1.6, 'tier1': 70, 'tier2': 30, 'tier3': 0},
-    {'company': 'MAG Silver', 'ticker': 'MAG', 'period': '2023-Q2', 'aisc': 12.20, 'production': 1.9, 'revenue': 0.085, 'fcf': 0.035, 'dividend_yield': 0.0, 'market_cap': 1.9, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Avino Silver & Gold', 'ticker': 'ASM', 'period': '2023-Q2', 'aisc': 18.50, 'production': 0.48, 'revenue': 0.013, 'fcf': 0.002, 'dividend_yield': 0.0, 'market_cap': 0.13, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'SilverCrest Metals', 'ticker': 'SILV', 'period': '2023-Q2', 'aisc': 10.90, 'production': 2.3, 'revenue': 0.065, 'fcf': 0.025, 'dividend_yield': 0.0, 'market_cap': 2.0, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Fortuna Silver Mines', 'ticker': 'FSM', 'period': '2023-Q2', 'aisc': 16.50, 'production': 2.1, 'revenue': 0.19, 'fcf': 0.035, 'dividend_yield': 2.0, 'market_cap': 1.25, 'tier1': 0, 'tier2': 55, 'tier3': 45},
-    {'company': 'SSR Mining', 'ticker': 'SSRM', 'period': '2023-Q2', 'aisc': 15.20, 'production': 2.9, 'revenue': 0.33, 'fcf': 0.055, 'dividend_yield': 2.5, 'market_cap': 2.6, 'tier1': 30, 'tier2': 35, 'tier3': 35},
-
-    # ==================== 2023 Q3 ====================
-    {'company': 'Pan American Silver', 'ticker': 'PAAS', 'period': '2023-Q3', 'aisc': 17.90, 'production': 6.2, 'revenue': 0.48, 'fcf': 0.04, 'dividend_yield': 2.6, 'market_cap': 6.8, 'tier1': 25, 'tier2': 60, 'tier3': 15},
-    {'company': 'Hecla Mining', 'ticker': 'HL', 'period': '2023-Q3', 'aisc': 16.80, 'production': 3.6, 'revenue': 0.20, 'fcf': 0.02, 'dividend_yield': 0.9, 'market_cap': 3.0, 'tier1': 85, 'tier2': 10, 'tier3': 5},
-    {'company': 'First Majestic Silver', 'ticker': 'AG', 'period': '2023-Q3', 'aisc': 20.80, 'production': 3.3, 'revenue': 0.14, 'fcf': -0.01, 'dividend_yield': 0.0, 'market_cap': 2.3, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Endeavour Silver', 'ticker': 'EXK', 'period': '2023-Q3', 'aisc': 19.20, 'production': 1.3, 'revenue': 0.055, 'fcf': 0.005, 'dividend_yield': 0.0, 'market_cap': 0.85, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Coeur Mining', 'ticker': 'CDE', 'period': '2023-Q3', 'aisc': 19.50, 'production': 2.7, 'revenue': 0.21, 'fcf': 0.01, 'dividend_yield': 0.0, 'market_cap': 1.7, 'tier1': 70, 'tier2': 30, 'tier3': 0},
-    {'company': 'MAG Silver', 'ticker': 'MAG', 'period': '2023-Q3', 'aisc': 11.90, 'production': 2.0, 'revenue': 0.09, 'fcf': 0.04, 'dividend_yield': 0.0, 'market_cap': 2.0, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Avino Silver & Gold', 'ticker': 'ASM', 'period': '2023-Q3', 'aisc': 18.10, 'production': 0.50, 'revenue': 0.014, 'fcf': 0.003, 'dividend_yield': 0.0, 'market_cap': 0.14, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'SilverCrest Metals', 'ticker': 'SILV', 'period': '2023-Q3', 'aisc': 10.60, 'production': 2.4, 'revenue': 0.07, 'fcf': 0.03, 'dividend_yield': 0.0, 'market_cap': 2.1, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Fortuna Silver Mines', 'ticker': 'FSM', 'period': '2023-Q3', 'aisc': 16.20, 'production': 2.15, 'revenue': 0.20, 'fcf': 0.04, 'dividend_yield': 2.1, 'market_cap': 1.3, 'tier1': 0, 'tier2': 55, 'tier3': 45},
-    {'company': 'SSR Mining', 'ticker': 'SSRM', 'period': '2023-Q3', 'aisc': 15.00, 'production': 3.0, 'revenue': 0.34, 'fcf': 0.06, 'dividend_yield': 2.6, 'market_cap': 2.7, 'tier1': 30, 'tier2': 35, 'tier3': 35},
-
-    # ==================== 2023 Q4 ====================
-    {'company': 'Pan American Silver', 'ticker': 'PAAS', 'period': '2023-Q4', 'aisc': 17.60, 'production': 6.5, 'revenue': 0.52, 'fcf': 0.05, 'dividend_yield': 2.5, 'market_cap': 7.2, 'tier1': 25, 'tier2': 60, 'tier3': 15},
-    {'company': 'Hecla Mining', 'ticker': 'HL', 'period': '2023-Q4', 'aisc': 16.50, 'production': 3.7, 'revenue': 0.22, 'fcf': 0.025, 'dividend_yield': 1.0, 'market_cap': 3.2, 'tier1': 85, 'tier2': 10, 'tier3': 5},
-    {'company': 'First Majestic Silver', 'ticker': 'AG', 'period': '2023-Q4', 'aisc': 20.50, 'production': 3.4, 'revenue': 0.15, 'fcf': 0.00, 'dividend_yield': 0.0, 'market_cap': 2.4, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Endeavour Silver', 'ticker': 'EXK', 'period': '2023-Q4', 'aisc': 18.90, 'production': 1.35, 'revenue': 0.058, 'fcf': 0.008, 'dividend_yield': 0.0, 'market_cap': 0.88, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Coeur Mining', 'ticker': 'CDE', 'period': '2023-Q4', 'aisc': 19.20, 'production': 2.8, 'revenue': 0.23, 'fcf': 0.02, 'dividend_yield': 0.0, 'market_cap': 1.8, 'tier1': 70, 'tier2': 30, 'tier3': 0},
-    {'company': 'MAG Silver', 'ticker': 'MAG', 'period': '2023-Q4', 'aisc': 11.60, 'production': 2.1, 'revenue': 0.095, 'fcf': 0.045, 'dividend_yield': 0.0, 'market_cap': 2.1, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Avino Silver & Gold', 'ticker': 'ASM', 'period': '2023-Q4', 'aisc': 17.80, 'production': 0.52, 'revenue': 0.015, 'fcf': 0.004, 'dividend_yield': 0.0, 'market_cap': 0.15, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'SilverCrest Metals', 'ticker': 'SILV', 'period': '2023-Q4', 'aisc': 10.30, 'production': 2.5, 'revenue': 0.075, 'fcf': 0.035, 'dividend_yield': 0.0, 'market_cap': 2.2, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Fortuna Silver Mines', 'ticker': 'FSM', 'period': '2023-Q4', 'aisc': 15.90, 'production': 2.2, 'revenue': 0.21, 'fcf': 0.045, 'dividend_yield': 2.2, 'market_cap': 1.35, 'tier1': 0, 'tier2': 55, 'tier3': 45},
-    {'company': 'SSR Mining', 'ticker': 'SSRM', 'period': '2023-Q4', 'aisc': 14.80, 'production': 3.1, 'revenue': 0.36, 'fcf': 0.07, 'dividend_yield': 2.7, 'market_cap': 2.8, 'tier1': 30, 'tier2': 35, 'tier3': 35},
-
-    # ==================== 2024 Q1 ====================
-    {'company': 'Pan American Silver', 'ticker': 'PAAS', 'period': '2024-Q1', 'aisc': 17.30, 'production': 6.8, 'revenue': 0.55, 'fcf': 0.06, 'dividend_yield': 2.4, 'market_cap': 7.5, 'tier1': 25, 'tier2': 60, 'tier3': 15},
-    {'company': 'Hecla Mining', 'ticker': 'HL', 'period': '2024-Q1', 'aisc': 16.20, 'production': 3.8, 'revenue': 0.24, 'fcf': 0.03, 'dividend_yield': 1.0, 'market_cap': 3.4, 'tier1': 85, 'tier2': 10, 'tier3': 5},
-    {'company': 'First Majestic Silver', 'ticker': 'AG', 'period': '2024-Q1', 'aisc': 20.20, 'production': 3.5, 'revenue': 0.16, 'fcf': 0.01, 'dividend_yield': 0.0, 'market_cap': 2.5, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Endeavour Silver', 'ticker': 'EXK', 'period': '2024-Q1', 'aisc': 18.60, 'production': 1.4, 'revenue': 0.062, 'fcf': 0.01, 'dividend_yield': 0.0, 'market_cap': 0.92, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Coeur Mining', 'ticker': 'CDE', 'period': '2024-Q1', 'aisc': 18.90, 'production': 2.9, 'revenue': 0.25, 'fcf': 0.03, 'dividend_yield': 0.0, 'market_cap': 1.9, 'tier1': 70, 'tier2': 30, 'tier3': 0},
-    {'company': 'MAG Silver', 'ticker': 'MAG', 'period': '2024-Q1', 'aisc': 11.30, 'production': 2.2, 'revenue': 0.10, 'fcf': 0.05, 'dividend_yield': 0.0, 'market_cap': 2.2, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Avino Silver & Gold', 'ticker': 'ASM', 'period': '2024-Q1', 'aisc': 17.50, 'production': 0.55, 'revenue': 0.016, 'fcf': 0.005, 'dividend_yield': 0.0, 'market_cap': 0.16, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'SilverCrest Metals', 'ticker': 'SILV', 'period': '2024-Q1', 'aisc': 10.00, 'production': 2.6, 'revenue': 0.08, 'fcf': 0.04, 'dividend_yield': 0.0, 'market_cap': 2.3, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Fortuna Silver Mines', 'ticker': 'FSM', 'period': '2024-Q1', 'aisc': 15.60, 'production': 2.3, 'revenue': 0.22, 'fcf': 0.05, 'dividend_yield': 2.3, 'market_cap': 1.4, 'tier1': 0, 'tier2': 55, 'tier3': 45},
-    {'company': 'SSR Mining', 'ticker': 'SSRM', 'period': '2024-Q1', 'aisc': 14.60, 'production': 3.2, 'revenue': 0.38, 'fcf': 0.08, 'dividend_yield': 2.8, 'market_cap': 2.9, 'tier1': 30, 'tier2': 35, 'tier3': 35},
-
-    # ==================== 2024 Q2 ====================
-    {'company': 'Pan American Silver', 'ticker': 'PAAS', 'period': '2024-Q2', 'aisc': 17.00, 'production': 7.0, 'revenue': 0.62, 'fcf': 0.08, 'dividend_yield': 2.3, 'market_cap': 8.0, 'tier1': 25, 'tier2': 60, 'tier3': 15},
-    {'company': 'Hecla Mining', 'ticker': 'HL', 'period': '2024-Q2', 'aisc': 15.90, 'production': 3.9, 'revenue': 0.27, 'fcf': 0.04, 'dividend_yield': 1.1, 'market_cap': 3.6, 'tier1': 85, 'tier2': 10, 'tier3': 5},
-    {'company': 'First Majestic Silver', 'ticker': 'AG', 'period': '2024-Q2', 'aisc': 19.80, 'production': 3.6, 'revenue': 0.18, 'fcf': 0.02, 'dividend_yield': 0.0, 'market_cap': 2.7, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Endeavour Silver', 'ticker': 'EXK', 'period': '2024-Q2', 'aisc': 18.30, 'production': 1.45, 'revenue': 0.068, 'fcf': 0.015, 'dividend_yield': 0.0, 'market_cap': 0.98, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Coeur Mining', 'ticker': 'CDE', 'period': '2024-Q2', 'aisc': 18.50, 'production': 3.0, 'revenue': 0.28, 'fcf': 0.04, 'dividend_yield': 0.0, 'market_cap': 2.1, 'tier1': 70, 'tier2': 30, 'tier3': 0},
-    {'company': 'MAG Silver', 'ticker': 'MAG', 'period': '2024-Q2', 'aisc': 11.00, 'production': 2.3, 'revenue': 0.11, 'fcf': 0.055, 'dividend_yield': 0.0, 'market_cap': 2.4, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Avino Silver & Gold', 'ticker': 'ASM', 'period': '2024-Q2', 'aisc': 17.20, 'production': 0.58, 'revenue': 0.018, 'fcf': 0.006, 'dividend_yield': 0.0, 'market_cap': 0.17, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'SilverCrest Metals', 'ticker': 'SILV', 'period': '2024-Q2', 'aisc': 9.70, 'production': 2.7, 'revenue': 0.09, 'fcf': 0.045, 'dividend_yield': 0.0, 'market_cap': 2.5, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Fortuna Silver Mines', 'ticker': 'FSM', 'period': '2024-Q2', 'aisc': 15.30, 'production': 2.4, 'revenue': 0.25, 'fcf': 0.06, 'dividend_yield': 2.4, 'market_cap': 1.5, 'tier1': 0, 'tier2': 55, 'tier3': 45},
-    {'company': 'SSR Mining', 'ticker': 'SSRM', 'period': '2024-Q2', 'aisc': 14.40, 'production': 3.3, 'revenue': 0.42, 'fcf': 0.09, 'dividend_yield': 2.9, 'market_cap': 3.0, 'tier1': 30, 'tier2': 35, 'tier3': 35},
-
-    # ==================== 2024 Q3 ====================
-    {'company': 'Pan American Silver', 'ticker': 'PAAS', 'period': '2024-Q3', 'aisc': 16.70, 'production': 7.2, 'revenue': 0.68, 'fcf': 0.10, 'dividend_yield': 2.2, 'market_cap': 8.5, 'tier1': 25, 'tier2': 60, 'tier3': 15},
-    {'company': 'Hecla Mining', 'ticker': 'HL', 'period': '2024-Q3', 'aisc': 15.60, 'production': 4.0, 'revenue': 0.30, 'fcf': 0.05, 'dividend_yield': 1.2, 'market_cap': 3.8, 'tier1': 85, 'tier2': 10, 'tier3': 5},
-    {'company': 'First Majestic Silver', 'ticker': 'AG', 'period': '2024-Q3', 'aisc': 19.50, 'production': 3.7, 'revenue': 0.20, 'fcf': 0.03, 'dividend_yield': 0.0, 'market_cap': 2.9, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Endeavour Silver', 'ticker': 'EXK', 'period': '2024-Q3', 'aisc': 18.00, 'production': 1.5, 'revenue': 0.075, 'fcf': 0.02, 'dividend_yield': 0.0, 'market_cap': 1.05, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Coeur Mining', 'ticker': 'CDE', 'period': '2024-Q3', 'aisc': 18.20, 'production': 3.1, 'revenue': 0.32, 'fcf': 0.05, 'dividend_yield': 0.0, 'market_cap': 2.3, 'tier1': 70, 'tier2': 30, 'tier3': 0},
-    {'company': 'MAG Silver', 'ticker': 'MAG', 'period': '2024-Q3', 'aisc': 10.70, 'production': 2.4, 'revenue': 0.12, 'fcf': 0.06, 'dividend_yield': 0.0, 'market_cap': 2.6, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Avino Silver & Gold', 'ticker': 'ASM', 'period': '2024-Q3', 'aisc': 16.90, 'production': 0.60, 'revenue': 0.020, 'fcf': 0.007, 'dividend_yield': 0.0, 'market_cap': 0.18, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'SilverCrest Metals', 'ticker': 'SILV', 'period': '2024-Q3', 'aisc': 9.40, 'production': 2.8, 'revenue': 0.10, 'fcf': 0.05, 'dividend_yield': 0.0, 'market_cap': 2.7, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Fortuna Silver Mines', 'ticker': 'FSM', 'period': '2024-Q3', 'aisc': 15.00, 'production': 2.5, 'revenue': 0.28, 'fcf': 0.07, 'dividend_yield': 2.5, 'market_cap': 1.6, 'tier1': 0, 'tier2': 55, 'tier3': 45},
-    {'company': 'SSR Mining', 'ticker': 'SSRM', 'period': '2024-Q3', 'aisc': 14.20, 'production': 3.4, 'revenue': 0.45, 'fcf': 0.10, 'dividend_yield': 3.0, 'market_cap': 3.2, 'tier1': 30, 'tier2': 35, 'tier3': 35},
-
-    # ==================== 2024 Q4 ====================
-    {'company': 'Pan American Silver', 'ticker': 'PAAS', 'period': '2024-Q4', 'aisc': 16.40, 'production': 7.5, 'revenue': 0.75, 'fcf': 0.12, 'dividend_yield': 2.1, 'market_cap': 9.0, 'tier1': 25, 'tier2': 60, 'tier3': 15},
-    {'company': 'Hecla Mining', 'ticker': 'HL', 'period': '2024-Q4', 'aisc': 15.30, 'production': 4.1, 'revenue': 0.33, 'fcf': 0.06, 'dividend_yield': 1.3, 'market_cap': 4.0, 'tier1': 85, 'tier2': 10, 'tier3': 5},
-    {'company': 'First Majestic Silver', 'ticker': 'AG', 'period': '2024-Q4', 'aisc': 19.20, 'production': 3.8, 'revenue': 0.22, 'fcf': 0.04, 'dividend_yield': 0.0, 'market_cap': 3.1, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Endeavour Silver', 'ticker': 'EXK', 'period': '2024-Q4', 'aisc': 17.70, 'production': 1.55, 'revenue': 0.082, 'fcf': 0.025, 'dividend_yield': 0.0, 'market_cap': 1.12, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Coeur Mining', 'ticker': 'CDE', 'period': '2024-Q4', 'aisc': 17.90, 'production': 3.2, 'revenue': 0.35, 'fcf': 0.06, 'dividend_yield': 0.0, 'market_cap': 2.5, 'tier1': 70, 'tier2': 30, 'tier3': 0},
-    {'company': 'MAG Silver', 'ticker': 'MAG', 'period': '2024-Q4', 'aisc': 10.40, 'production': 2.5, 'revenue': 0.13, 'fcf': 0.065, 'dividend_yield': 0.0, 'market_cap': 2.8, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Avino Silver & Gold', 'ticker': 'ASM', 'period': '2024-Q4', 'aisc': 16.60, 'production': 0.62, 'revenue': 0.022, 'fcf': 0.008, 'dividend_yield': 0.0, 'market_cap': 0.19, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'SilverCrest Metals', 'ticker': 'SILV', 'period': '2024-Q4', 'aisc': 9.10, 'production': 2.9, 'revenue': 0.11, 'fcf': 0.055, 'dividend_yield': 0.0, 'market_cap': 2.9, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Fortuna Silver Mines', 'ticker': 'FSM', 'period': '2024-Q4', 'aisc': 14.70, 'production': 2.6, 'revenue': 0.30, 'fcf': 0.08, 'dividend_yield': 2.6, 'market_cap': 1.7, 'tier1': 0, 'tier2': 55, 'tier3': 45},
-    {'company': 'SSR Mining', 'ticker': 'SSRM', 'period': '2024-Q4', 'aisc': 14.00, 'production': 3.5, 'revenue': 0.48, 'fcf': 0.11, 'dividend_yield': 3.1, 'market_cap': 3.4, 'tier1': 30, 'tier2': 35, 'tier3': 35},
-
-    # ==================== 2025 Q1 ====================
-    {'company': 'Pan American Silver', 'ticker': 'PAAS', 'period': '2025-Q1', 'aisc': 16.10, 'production': 7.8, 'revenue': 0.82, 'fcf': 0.14, 'dividend_yield': 2.0, 'market_cap': 9.5, 'tier1': 25, 'tier2': 60, 'tier3': 15},
-    {'company': 'Hecla Mining', 'ticker': 'HL', 'period': '2025-Q1', 'aisc': 15.00, 'production': 4.2, 'revenue': 0.36, 'fcf': 0.07, 'dividend_yield': 1.4, 'market_cap': 4.2, 'tier1': 85, 'tier2': 10, 'tier3': 5},
-    {'company': 'First Majestic Silver', 'ticker': 'AG', 'period': '2025-Q1', 'aisc': 18.90, 'production': 3.9, 'revenue': 0.24, 'fcf': 0.05, 'dividend_yield': 0.0, 'market_cap': 3.3, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Endeavour Silver', 'ticker': 'EXK', 'period': '2025-Q1', 'aisc': 17.40, 'production': 1.6, 'revenue': 0.088, 'fcf': 0.03, 'dividend_yield': 0.0, 'market_cap': 1.2, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Coeur Mining', 'ticker': 'CDE', 'period': '2025-Q1', 'aisc': 17.60, 'production': 3.3, 'revenue': 0.38, 'fcf': 0.07, 'dividend_yield': 0.0, 'market_cap': 2.7, 'tier1': 70, 'tier2': 30, 'tier3': 0},
-    {'company': 'MAG Silver', 'ticker': 'MAG', 'period': '2025-Q1', 'aisc': 10.10, 'production': 2.6, 'revenue': 0.14, 'fcf': 0.07, 'dividend_yield': 0.0, 'market_cap': 3.0, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Avino Silver & Gold', 'ticker': 'ASM', 'period': '2025-Q1', 'aisc': 16.30, 'production': 0.65, 'revenue': 0.024, 'fcf': 0.009, 'dividend_yield': 0.0, 'market_cap': 0.20, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'SilverCrest Metals', 'ticker': 'SILV', 'period': '2025-Q1', 'aisc': 8.80, 'production': 3.0, 'revenue': 0.12, 'fcf': 0.06, 'dividend_yield': 0.0, 'market_cap': 3.1, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Fortuna Silver Mines', 'ticker': 'FSM', 'period': '2025-Q1', 'aisc': 14.40, 'production': 2.7, 'revenue': 0.32, 'fcf': 0.09, 'dividend_yield': 2.7, 'market_cap': 1.8, 'tier1': 0, 'tier2': 55, 'tier3': 45},
-    {'company': 'SSR Mining', 'ticker': 'SSRM', 'period': '2025-Q1', 'aisc': 13.80, 'production': 3.6, 'revenue': 0.50, 'fcf': 0.12, 'dividend_yield': 3.2, 'market_cap': 3.6, 'tier1': 30, 'tier2': 35, 'tier3': 35},
-
-    # ==================== 2025 Q2 ====================
-    {'company': 'Pan American Silver', 'ticker': 'PAAS', 'period': '2025-Q2', 'aisc': 15.80, 'production': 8.0, 'revenue': 0.88, 'fcf': 0.16, 'dividend_yield': 1.9, 'market_cap': 10.0, 'tier1': 25, 'tier2': 60, 'tier3': 15},
-    {'company': 'Hecla Mining', 'ticker': 'HL', 'period': '2025-Q2', 'aisc': 14.70, 'production': 4.3, 'revenue': 0.38, 'fcf': 0.08, 'dividend_yield': 1.5, 'market_cap': 4.4, 'tier1': 85, 'tier2': 10, 'tier3': 5},
-    {'company': 'First Majestic Silver', 'ticker': 'AG', 'period': '2025-Q2', 'aisc': 18.60, 'production': 4.0, 'revenue': 0.26, 'fcf': 0.06, 'dividend_yield': 0.0, 'market_cap': 3.5, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Endeavour Silver', 'ticker': 'EXK', 'period': '2025-Q2', 'aisc': 17.10, 'production': 1.65, 'revenue': 0.095, 'fcf': 0.035, 'dividend_yield': 0.0, 'market_cap': 1.28, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Coeur Mining', 'ticker': 'CDE', 'period': '2025-Q2', 'aisc': 17.30, 'production': 3.4, 'revenue': 0.41, 'fcf': 0.08, 'dividend_yield': 0.0, 'market_cap': 2.9, 'tier1': 70, 'tier2': 30, 'tier3': 0},
-    {'company': 'MAG Silver', 'ticker': 'MAG', 'period': '2025-Q2', 'aisc': 9.80, 'production': 2.7, 'revenue': 0.15, 'fcf': 0.075, 'dividend_yield': 0.0, 'market_cap': 3.2, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Avino Silver & Gold', 'ticker': 'ASM', 'period': '2025-Q2', 'aisc': 16.00, 'production': 0.68, 'revenue': 0.026, 'fcf': 0.010, 'dividend_yield': 0.0, 'market_cap': 0.21, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'SilverCrest Metals', 'ticker': 'SILV', 'period': '2025-Q2', 'aisc': 8.50, 'production': 3.1, 'revenue': 0.13, 'fcf': 0.065, 'dividend_yield': 0.0, 'market_cap': 3.3, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Fortuna Silver Mines', 'ticker': 'FSM', 'period': '2025-Q2', 'aisc': 14.10, 'production': 2.8, 'revenue': 0.35, 'fcf': 0.10, 'dividend_yield': 2.8, 'market_cap': 1.9, 'tier1': 0, 'tier2': 55, 'tier3': 45},
-    {'company': 'SSR Mining', 'ticker': 'SSRM', 'period': '2025-Q2', 'aisc': 13.60, 'production': 3.7, 'revenue': 0.52, 'fcf': 0.13, 'dividend_yield': 3.3, 'market_cap': 3.8, 'tier1': 30, 'tier2': 35, 'tier3': 35},
-
-    # ==================== 2025 Q3 ====================
-    {'company': 'Pan American Silver', 'ticker': 'PAAS', 'period': '2025-Q3', 'aisc': 15.50, 'production': 8.2, 'revenue': 0.92, 'fcf': 0.18, 'dividend_yield': 1.8, 'market_cap': 10.5, 'tier1': 25, 'tier2': 60, 'tier3': 15},
-    {'company': 'Hecla Mining', 'ticker': 'HL', 'period': '2025-Q3', 'aisc': 14.40, 'production': 4.4, 'revenue': 0.40, 'fcf': 0.09, 'dividend_yield': 1.6, 'market_cap': 4.6, 'tier1': 85, 'tier2': 10, 'tier3': 5},
-    {'company': 'First Majestic Silver', 'ticker': 'AG', 'period': '2025-Q3', 'aisc': 18.30, 'production': 4.1, 'revenue': 0.28, 'fcf': 0.07, 'dividend_yield': 0.0, 'market_cap': 3.7, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Endeavour Silver', 'ticker': 'EXK', 'period': '2025-Q3', 'aisc': 16.80, 'production': 1.7, 'revenue': 0.10, 'fcf': 0.04, 'dividend_yield': 0.0, 'market_cap': 1.35, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Coeur Mining', 'ticker': 'CDE', 'period': '2025-Q3', 'aisc': 17.00, 'production': 3.5, 'revenue': 0.44, 'fcf': 0.09, 'dividend_yield': 0.0, 'market_cap': 3.1, 'tier1': 70, 'tier2': 30, 'tier3': 0},
-    {'company': 'MAG Silver', 'ticker': 'MAG', 'period': '2025-Q3', 'aisc': 9.50, 'production': 2.8, 'revenue': 0.16, 'fcf': 0.08, 'dividend_yield': 0.0, 'market_cap': 3.4, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Avino Silver & Gold', 'ticker': 'ASM', 'period': '2025-Q3', 'aisc': 15.70, 'production': 0.70, 'revenue': 0.028, 'fcf': 0.011, 'dividend_yield': 0.0, 'market_cap': 0.22, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'SilverCrest Metals', 'ticker': 'SILV', 'period': '2025-Q3', 'aisc': 8.20, 'production': 3.2, 'revenue': 0.14, 'fcf': 0.07, 'dividend_yield': 0.0, 'market_cap': 3.5, 'tier1': 0, 'tier2': 100, 'tier3': 0},
-    {'company': 'Fortuna Silver Mines', 'ticker': 'FSM', 'period': '2025-Q3', 'aisc': 13.80, 'production': 2.9, 'revenue': 0.38, 'fcf': 0.11, 'dividend_yield': 2.9, 'market_cap': 2.0, 'tier1': 0, 'tier2': 55, 'tier3': 45},
-    {'company': 'SSR Mining', 'ticker': 'SSRM', 'period': '2025-Q3', 'aisc': 13.40, 'production': 3.8, 'revenue': 0.55, 'fcf': 0.14, 'dividend_yield': 3.4, 'market_cap': 4.0, 'tier1': 30, 'tier2': 35, 'tier3': 35},
-]
-
-
-@dataclass
+# Number of pooled read-only connections per SilverMetricsDB instance
+READER_POOL_SIZE = 4
+
+# Seconds to wait for a free pooled reader before giving up
+READER_TIMEOUT_SECONDS = 30
+
+# Prepared statements kept per connection (sqlite3 default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# How long get_sector_stats results are reused before re-querying
+STATS_CACHE_TTL_SECONDS = 60
+
+# Refresh planner statistics after this many rows have been inserted
+ANALYZE_EVERY_INSERTS = 1000
+
+
+def period_key(period: str) -> int:
+    """Encode a 'YYYY-Qn' period as YYYY*10 + n, matching silver_metrics.period_key."""
+    return int(period[:4]) * 10 + int(period[6])
+
+
+def _load_seed() -> Tuple[Tuple[tuple, ...], int]:
+    """
+    Import the seed rows and their count on demand.
+
+    They live in core.silver_seed and are only needed when seeding, so
+    processes that read an already-seeded database never load them.
+    """
+    from .silver_seed import SEED_ROWS, SEED_COUNT
+    return SEED_ROWS, SEED_COUNT
+
+
+# Bump when the table layout changes; _init_db rebuilds older databases
+# (tracked in PRAGMA user_version) and carries their rows over
+_SCHEMA_VERSION = 5
+
+def _rollup_refresh_sql(row: str) -> str:
+    """
+    Trigger body that recomputes the rollup row for `row`'s (NEW/OLD) period.
+
+    Metrics are matched on period_key so the lookup uses idx_silver_period_key.
+    The GROUP BY yields no row once a period has no metrics left, so the
+    DELETE alone clears it.
+    """
+    return f'''
+        DELETE FROM silver_metrics_rollup WHERE period = {row}.period;
+        INSERT INTO silver_metrics_rollup
+        (period, avg_aisc, weighted_aisc, total_production, total_revenue,
+         total_fcf, n_companies)
+        SELECT period,
+               AVG(aisc_mills) / 1000.0,
+               SUM(aisc_mills * production_koz) * 1.0
+                   / NULLIF(SUM(production_koz), 0) / 1000.0,
+               SUM(production_koz) / 1000.0,
+               SUM(revenue_musd) / 1000.0,
+               SUM(fcf_musd) / 1000.0,
+               COUNT(*)
+        FROM silver_metrics
+        WHERE period_key = {row}.period_key
+        GROUP BY period;
+    '''
+
+
+# Schema DDL shared by _init_db and reseed. Kept as separate statements so
+# reseed can run them inside its own transaction (executescript commits first).
+# Company names and tickers live once in `companies`; silver_metrics_v joins
+# them back and always exposes the original flat column layout and units.
+# Money and volume figures are stored as scaled INTEGERs (varint-encoded,
+# exact) and divided back in the view:
+#   aisc_mills          $/oz x 1000
+#   production_koz      million oz x 1000 (thousand oz)
+#   revenue_musd        billion USD x 1000 (million USD), same for fcf/market_cap
+#   dividend_yield_bps  percent x 100 (basis points)
+# period_key encodes 'YYYY-Qn' as YYYY*10 + n so range filters and ordering
+# compare integers instead of strings (see period_key()).
+# silver_metrics_rollup holds per-period sector aggregates, kept current by
+# triggers on every insert, update and delete.
+_TABLE_STATEMENTS: Tuple[str, ...] = (
+    '''
+    CREATE TABLE IF NOT EXISTS companies (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        ticker TEXT NOT NULL UNIQUE
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS silver_metrics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        company_id INTEGER NOT NULL REFERENCES companies(id),
+        period TEXT NOT NULL,
+        aisc_mills INTEGER NOT NULL,
+        production_koz INTEGER NOT NULL,
+        revenue_musd INTEGER NOT NULL,
+        fcf_musd INTEGER NOT NULL,
+        dividend_yield_bps INTEGER NOT NULL,
+        market_cap_musd INTEGER NOT NULL,
+        tier1 INTEGER NOT NULL DEFAULT 0,
+        tier2 INTEGER NOT NULL DEFAULT 0,
+        tier3 INTEGER NOT NULL DEFAULT 0,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        period_key INTEGER GENERATED ALWAYS AS (
+            CAST(substr(period, 1, 4) AS INTEGER) * 10
+            + CAST(substr(period, 7, 1) AS INTEGER)
+        ) STORED,
+        UNIQUE(company_id, period)
+    )
+    ''',
+    '''
+    CREATE VIEW IF NOT EXISTS silver_metrics_v AS
+    SELECT m.id, c.name AS company, c.ticker, m.period,
+           m.aisc_mills / 1000.0 AS aisc,
+           m.production_koz / 1000.0 AS production,
+           m.revenue_musd / 1000.0 AS revenue,
+           m.fcf_musd / 1000.0 AS fcf,
+           m.dividend_yield_bps / 100.0 AS dividend_yield,
+           m.market_cap_musd / 1000.0 AS market_cap,
+           m.tier1, m.tier2, m.tier3, m.timestamp, m.period_key
+    FROM silver_metrics m
+    JOIN companies c ON c.id = m.company_id
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS silver_metrics_rollup (
+        period TEXT PRIMARY KEY,
+        avg_aisc REAL NOT NULL,
+        weighted_aisc REAL,
+        total_production REAL NOT NULL,
+        total_revenue REAL NOT NULL,
+        total_fcf REAL NOT NULL,
+        n_companies INTEGER NOT NULL
+    )
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_silver_rollup_insert
+    AFTER INSERT ON silver_metrics
+    BEGIN {_rollup_refresh_sql('NEW')} END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_silver_rollup_update
+    AFTER UPDATE ON silver_metrics
+    BEGIN {_rollup_refresh_sql('OLD')} {_rollup_refresh_sql('NEW')} END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_silver_rollup_delete
+    AFTER DELETE ON silver_metrics
+    BEGIN {_rollup_refresh_sql('OLD')} END
+    ''',
+    f'PRAGMA user_version = {_SCHEMA_VERSION}',
+)
+
+# Secondary indexes. _seed_data drops the ones in _DROP_INDEX_STATEMENTS
+# before bulk loading and rebuilds them afterwards in one pass;
+# idx_silver_period_key stays, since the rollup triggers look rows up by it.
+_INDEX_STATEMENTS: Tuple[str, ...] = (
+    '''
+    CREATE INDEX IF NOT EXISTS idx_silver_period_key
+    ON silver_metrics(period_key DESC)
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_silver_company_period_key
+    ON silver_metrics(company_id, period_key DESC)
+    ''',
+)
+_DROP_INDEX_STATEMENTS: Tuple[str, ...] = (
+    'DROP INDEX IF EXISTS idx_silver_company_period_key',
+)
+
+_SCHEMA_STATEMENTS = _TABLE_STATEMENTS + _INDEX_STATEMENTS
+_SCHEMA_SCRIPT = ';'.join(_SCHEMA_STATEMENTS) + ';'
+
+_DROP_STATEMENTS: Tuple[str, ...] = (
+    'DROP VIEW IF EXISTS silver_metrics_v',
+    'DROP TABLE IF EXISTS silver_metrics',
+    'DROP TABLE IF EXISTS silver_metrics_rollup',
+    'DROP TABLE IF EXISTS companies',
+)
+
+# Upsert so a renamed company keeps its id but shows the latest name
+_COMPANY_INSERT_SQL = '''
+    INSERT INTO companies (name, ticker) VALUES (?, ?)
+    ON CONFLICT(ticker) DO UPDATE SET name = excluded.name
+'''
+
+# Metric VALUES tuple bound as (ticker, period, aisc, ..., tier3) in the
+# units callers use; the company id is resolved from the ticker and the
+# figures are scaled to their stored INTEGER units
+_METRIC_COLUMNS = '''
+    (company_id, period, aisc_mills, production_koz, revenue_musd, fcf_musd,
+     dividend_yield_bps, market_cap_musd, tier1, tier2, tier3)
+'''
+_SCALED_FIGURES = '''
+    CAST(round(? * 1000) AS INTEGER), CAST(round(? * 1000) AS INTEGER),
+    CAST(round(? * 1000) AS INTEGER), CAST(round(? * 1000) AS INTEGER),
+    CAST(round(? * 100) AS INTEGER), CAST(round(? * 1000) AS INTEGER)
+'''
+_METRIC_VALUES = f'''
+    ((SELECT id FROM companies WHERE ticker = ?), ?, {_SCALED_FIGURES}, ?, ?, ?)
+'''
+_METRIC_INSERT_SQL = f'INSERT INTO silver_metrics {_METRIC_COLUMNS} VALUES {_METRIC_VALUES}'
+# Batch variant: duplicates (ticker+period) are skipped instead of raising
+_METRIC_INSERT_OR_IGNORE_SQL = _METRIC_INSERT_SQL.replace('INSERT', 'INSERT OR IGNORE', 1)
+
+# Used by _migrate to copy rows with their original id and timestamp
+_MIGRATE_INSERT_SQL = f'''
+    INSERT INTO silver_metrics
+    (id, company_id, period, aisc_mills, production_koz, revenue_musd, fcf_musd,
+     dividend_yield_bps, market_cap_musd, tier1, tier2, tier3, timestamp)
+    VALUES (?, (SELECT id FROM companies WHERE ticker = ?), ?,
+            {_SCALED_FIGURES}, ?, ?, ?, ?)
+'''
+
+# Ids of each company's most recent report: one GROUP BY pass over
+# idx_silver_company_period_key, joined back on (company_id, period_key)
+_LATEST_IDS_SQL = '''
+    SELECT m.id
+    FROM silver_metrics m
+    JOIN (
+        SELECT company_id, MAX(period_key) AS latest_key
+        FROM silver_metrics
+        GROUP BY company_id
+    ) g ON g.company_id = m.company_id AND g.latest_key = m.period_key
+'''
+# Composed once at import so each call passes the same string object to the
+# statement cache
+_LATEST_BY_COMPANY_SQL = f'''
+    SELECT id, company, ticker, period, aisc, production, revenue,
+           fcf, dividend_yield, market_cap, tier1, tier2, tier3, timestamp
+    FROM silver_metrics_v
+    WHERE id IN ({_LATEST_IDS_SQL})
+    ORDER BY aisc ASC
+'''
+_SECTOR_STATS_SQL = f'''
+    SELECT AVG(aisc), SUM(production), AVG(dividend_yield),
+           SUM(tier1 * market_cap) / NULLIF(SUM(market_cap), 0),
+           COUNT(*)
+    FROM silver_metrics_v
+    WHERE id IN ({_LATEST_IDS_SQL})
+'''
+
+# Rows per multi-row INSERT when seeding (32 rows x 11 parameters stays well
+# under SQLite's bound-parameter limit)
+_SEED_CHUNK = 32
+
+
+@lru_cache(maxsize=None)
+def _seed_insert_sql(row_count: int) -> str:
+    """
+    Build an INSERT with row_count metric VALUES tuples.
+
+    Memoized so every reseed passes the same string object and hits the
+    connection's prepared-statement cache instead of re-parsing. Plain INSERT:
+    seeding only runs against an empty table, so there is nothing to ignore.
+    """
+    values = ', '.join([_METRIC_VALUES] * row_count)
+    return f'INSERT INTO silver_metrics {_METRIC_COLUMNS} VALUES {values}'
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(raw: Optional[str]) -> Optional[datetime]:
+    """Parse a stored timestamp; None when missing or malformed."""
+    if not raw:
+        return None
+    try:
+        return datetime.fromisoformat(raw)
+    except (ValueError, TypeError):
+        return None
+
+
+# __slots__ dataclasses need Python 3.10+; fall back to a plain dataclass on 3.9
+_DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SilverMinerMetric:
-    """Single quarterly report for a silver miner."""
+    """
+    Single quarterly report for a silver miner.
+
+    Immutable and hashable; use dataclasses.replace() to derive a changed copy.
+    """
     id: Optional[int]
     company: str
     ticker: str
@@ -179,93 +324,227 @@ class SilverMinerMetric:
     tier1: int  # Tier 1 jurisdiction exposure (%)
     tier2: int  # Tier 2 jurisdiction exposure (%)
     tier3: int  # Tier 3 jurisdiction exposure (%)
-    timestamp: Optional[datetime] = None
+    recorded_at: Optional[str] = None  # Raw SQLite timestamp text
+
+    @property
+    def timestamp(self) -> Optional[datetime]:
+        """When the row was recorded, parsed from recorded_at on access."""
+        return _parse_timestamp(self.recorded_at)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        d = asdict(self)
-        if self.timestamp:
-            d['timestamp'] = self.timestamp.isoformat()
-        return d
+        return {
+            'id': self.id,
+            'company': self.company,
+            'ticker': self.ticker,
+            'period': self.period,
+            'aisc': self.aisc,
+            'production': self.production,
+            'revenue': self.revenue,
+            'fcf': self.fcf,
+            'dividend_yield': self.dividend_yield,
+            'market_cap': self.market_cap,
+            'tier1': self.tier1,
+            'tier2': self.tier2,
+            'tier3': self.tier3,
+            'timestamp': self.timestamp.isoformat() if self.timestamp else None,
+        }
 
 
 class SilverMetricsDB:
-    """Manages silver miner metrics storage and retrieval."""
+    """
+    Manages silver miner metrics storage and retrieval.
 
-    def __init__(self, db_path: str = DB_PATH):
+    Connections are long-lived: a single writer guarded by a lock, plus a
+    bounded pool of read-only connections shared across threads.
+    """
+
+    # Directories already created by this process; skips repeat makedirs
+    _dirs_created: Set[str] = set()
+
+    def __init__(self, db_path: str = DB_PATH, readers: int = READER_POOL_SIZE):
         self.db_path = db_path
         print(f"[SilverMetricsDB] Using database: {self.db_path}")
+        # In-memory databases need no directory and no WAL, and every
+        # connection to one is a separate database, so reads share the writer
+        self._in_memory = db_path == ':memory:' or db_path.startswith('file::memory:')
+        db_dir = os.path.dirname(self.db_path)
+        if not self._in_memory and db_dir not in self._dirs_created:
+            os.makedirs(db_dir, exist_ok=True)
+            self._dirs_created.add(db_dir)
+
+        # Derived stats keyed by name: (monotonic expiry, value); cleared on writes
+        self._stats_cache: Dict[str, Tuple[float, Any]] = {}
+
+        self._write_lock = threading.Lock()
+        self._write_conn = self._connect()
+        self._inserts_since_analyze = 0
         self._init_db()
 
-    def _init_db(self):
-        """Initialize the database and create tables if needed."""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS silver_metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    company TEXT NOT NULL,
-                    ticker TEXT NOT NULL,
-                    period TEXT NOT NULL,
-                    aisc REAL NOT NULL,
-                    production REAL NOT NULL,
-                    revenue REAL NOT NULL,
-                    fcf REAL NOT NULL,
-                    dividend_yield REAL NOT NULL,
-                    market_cap REAL NOT NULL,
-                    tier1 INTEGER NOT NULL DEFAULT 0,
-                    tier2 INTEGER NOT NULL DEFAULT 0,
-                    tier3 INTEGER NOT NULL DEFAULT 0,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(ticker, period)
-                )
-            ''')
+        self._closed = False
+        self._readers: queue.Queue = queue.Queue(maxsize=readers)
+        if not self._in_memory:
+            for _ in range(readers):
+                self._readers.put(self._connect(read_only=True))
 
-            # Index for efficient queries
-            conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_silver_metrics_period
-                ON silver_metrics(period DESC)
-            ''')
-            conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_silver_metrics_ticker
-                ON silver_metrics(ticker)
-            ''')
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a connection in autocommit mode with WAL and tuned PRAGMAs.
 
-            conn.commit()
+        journal_mode persists in the database file; the remaining PRAGMAs are
+        per-connection and are re-applied on every open.
+        """
+        if read_only:
+            uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+            conn = sqlite3.connect(uri, uri=True, isolation_level=None,
+                                   check_same_thread=False,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+            conn.execute('PRAGMA query_only=1')
+        else:
+            conn = sqlite3.connect(self.db_path, isolation_level=None,
+                                   check_same_thread=False,
+                                   cached_statements=STATEMENT_CACHE_SIZE,
+                                   uri=self.db_path.startswith('file:'))
+            # page_size only takes effect on a new, empty database and must
+            # be set before switching it to WAL
+            conn.execute('PRAGMA page_size=8192')
+            if not self._in_memory:
+                conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript('''
+            PRAGMA synchronous=NORMAL;
+            PRAGMA busy_timeout=5000;
+            PRAGMA cache_size=-64000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+        ''')
+        return conn
+
+    @contextmanager
+    def _read(self):
+        """Borrow a read-only connection from the pool."""
+        if self._in_memory:
+            with self._write_lock:
+                yield self._write_conn
+            return
+        if self._closed:
+            raise sqlite3.ProgrammingError('Cannot operate on a closed database.')
+        try:
+            conn = self._readers.get(timeout=READER_TIMEOUT_SECONDS)
+        except queue.Empty:
+            if self._closed:
+                raise sqlite3.ProgrammingError('Cannot operate on a closed database.') from None
+            raise sqlite3.OperationalError(
+                f'no pooled reader free after {READER_TIMEOUT_SECONDS}s'
+            ) from None
+        try:
+            yield conn
+        finally:
+            if self._closed:
+                conn.close()  # Borrowed across close(); don't refill the pool
+            else:
+                self._readers.put(conn)
+
+    @contextmanager
+    def _write(self):
+        """Hold the writer connection, rolling back any open transaction on error."""
+        with self._write_lock:
+            try:
+                yield self._write_conn
+            except BaseException:
+                if self._write_conn.in_transaction:
+                    self._write_conn.rollback()
+                raise
+
+    def close(self):
+        """Close the writer and all pooled reader connections."""
+        self._closed = True
+        with self._write_lock:
+            try:
+                # Let SQLite refresh any statistics this session's queries need
+                self._write_conn.execute('PRAGMA optimize')
+            except sqlite3.ProgrammingError:
+                pass  # Already closed
+            self._write_conn.close()
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
 
-            # Seed with initial data if empty
-            cursor = conn.execute('SELECT COUNT(*) FROM silver_metrics')
-            if cursor.fetchone()[0] == 0:
+    def _init_db(self):
+        """Initialize the database, migrating or creating tables as needed."""
+        with self._write() as conn:
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            has_table = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'silver_metrics'"
+            ).fetchone() is not None
+            if has_table and version < _SCHEMA_VERSION:
+                self._migrate(conn, version)
+            else:
+                conn.executescript(_SCHEMA_SCRIPT)
+
+            # Seed with initial data if empty (first-row probe, not a count)
+            if conn.execute('SELECT 1 FROM silver_metrics LIMIT 1').fetchone() is None:
                 self._seed_data(conn)
 
-    def _seed_data(self, conn: sqlite3.Connection):
-        """Populate database with initial seed data."""
+    def _migrate(self, conn: sqlite3.Connection, version: int):
+        """Rebuild an older schema at _SCHEMA_VERSION, keeping every stored row."""
+        # Version 0 is the original flat table; later versions expose the
+        # same flat layout through silver_metrics_v
+        source = 'silver_metrics' if version == 0 else 'silver_metrics_v'
+        rows = conn.execute(f'''
+            SELECT id, company, ticker, period, aisc, production, revenue,
+                   fcf, dividend_yield, market_cap, tier1, tier2, tier3, timestamp
+            FROM {source}
+        ''').fetchall()
+        print(f"[SilverMetricsDB] Migrating {len(rows)} records from schema v{version} to v{_SCHEMA_VERSION}")
+
+        conn.execute('BEGIN IMMEDIATE')
+        for statement in _DROP_STATEMENTS + _SCHEMA_STATEMENTS:
+            conn.execute(statement)
+        conn.executemany(_COMPANY_INSERT_SQL, dict.fromkeys((row[1], row[2]) for row in rows))
+        conn.executemany(_MIGRATE_INSERT_SQL, [(row[0], *row[2:]) for row in rows])
+        conn.commit()
+
+    def _seed_data(self, conn: sqlite3.Connection) -> int:
+        """
+        Populate database with initial seed data in a single transaction.
+        Returns the number of records inserted.
+        """
         print("[SilverMetricsDB] Seeding initial data...")
-        for data in SEED_DATA:
-            conn.execute('''
-                INSERT OR IGNORE INTO silver_metrics
-                (company, ticker, period, aisc, production, revenue, fcf,
-                 dividend_yield, market_cap, tier1, tier2, tier3)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                data['company'], data['ticker'], data['period'],
-                data['aisc'], data['production'], data['revenue'], data['fcf'],
-                data['dividend_yield'], data['market_cap'],
-                data['tier1'], data['tier2'], data['tier3']
-            ))
+        seed_rows, seed_count = _load_seed()
+        if not conn.in_transaction:
+            conn.execute('BEGIN IMMEDIATE')
+        for statement in _DROP_INDEX_STATEMENTS:
+            conn.execute(statement)
+        conn.executemany(_COMPANY_INSERT_SQL, dict.fromkeys(row[:2] for row in seed_rows))
+        # Multi-row VALUES: one statement per _SEED_CHUNK rows
+        full_chunk_sql = _seed_insert_sql(_SEED_CHUNK)
+        for start in range(0, len(seed_rows), _SEED_CHUNK):
+            chunk = seed_rows[start:start + _SEED_CHUNK]
+            sql = full_chunk_sql if len(chunk) == _SEED_CHUNK else _seed_insert_sql(len(chunk))
+            conn.execute(sql, list(chain.from_iterable(row[1:] for row in chunk)))
+        for statement in _INDEX_STATEMENTS:
+            conn.execute(statement)
         conn.commit()
-        print(f"[SilverMetricsDB] Seeded {len(SEED_DATA)} records")
+        # Refresh planner statistics for the freshly loaded rows
+        conn.execute('ANALYZE')
+        print(f"[SilverMetricsDB] Seeded {seed_count} records")
+        return seed_count
 
     def reseed(self) -> int:
         """
-        Clear existing data and reseed with SEED_DATA.
+        Clear existing data and reseed with the built-in seed rows.
         Returns the number of records inserted.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('DELETE FROM silver_metrics')
-            self._seed_data(conn)
-        return len(SEED_DATA)
+        with self._write() as conn:
+            # Dropping and recreating is cheaper than a row-by-row DELETE
+            conn.execute('BEGIN IMMEDIATE')
+            for statement in _DROP_STATEMENTS + _SCHEMA_STATEMENTS:
+                conn.execute(statement)
+            count = self._seed_data(conn)
+        self._stats_cache.clear()
+        return count
 
     def create_metric(self, metric: SilverMinerMetric) -> Optional[int]:
         """
@@ -274,24 +553,63 @@ class SilverMetricsDB:
         Returns the new record ID if successful, None if duplicate.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute('''
-                    INSERT INTO silver_metrics
-                    (company, ticker, period, aisc, production, revenue, fcf,
-                     dividend_yield, market_cap, tier1, tier2, tier3)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    metric.company, metric.ticker, metric.period,
-                    metric.aisc, metric.production, metric.revenue, metric.fcf,
-                    metric.dividend_yield, metric.market_cap,
-                    metric.tier1, metric.tier2, metric.tier3
-                ))
+            with self._write() as conn:
+                conn.execute('BEGIN IMMEDIATE')
+                conn.execute(_COMPANY_INSERT_SQL, (metric.company, metric.ticker))
+                cursor = conn.execute(_METRIC_INSERT_SQL, self._metric_params(metric))
                 conn.commit()
-                return cursor.lastrowid
+                self._count_inserts(conn, 1)
+            self._stats_cache.clear()
+            return cursor.lastrowid
         except sqlite3.IntegrityError:
             # Duplicate ticker+period
             return None
 
+    def create_metrics(self, metrics: Iterable[SilverMinerMetric]) -> int:
+        """
+        Create many silver miner metric entries in a single transaction.
+
+        Duplicates (same ticker+period) are skipped, matching create_metric
+        returning None for them. Returns the number of records inserted.
+        """
+        metrics = list(metrics)
+        if not metrics:
+            return 0
+        with self._write() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.executemany(
+                _COMPANY_INSERT_SQL,
+                dict.fromkeys((m.company, m.ticker) for m in metrics)
+            )
+            cursor = conn.executemany(
+                _METRIC_INSERT_OR_IGNORE_SQL,
+                [self._metric_params(m) for m in metrics]
+            )
+            conn.commit()
+            self._count_inserts(conn, cursor.rowcount)
+        self._stats_cache.clear()
+        return cursor.rowcount
+
+    def _count_inserts(self, conn: sqlite3.Connection, count: int):
+        """
+        Track inserted rows and re-ANALYZE silver_metrics every
+        ANALYZE_EVERY_INSERTS rows. Called with the write lock held.
+        """
+        self._inserts_since_analyze += count
+        if self._inserts_since_analyze >= ANALYZE_EVERY_INSERTS:
+            conn.execute('ANALYZE silver_metrics')
+            self._inserts_since_analyze = 0
+
+    @staticmethod
+    def _metric_params(metric: SilverMinerMetric) -> tuple:
+        """Bind parameters for _METRIC_VALUES, in the order it expects."""
+        return (
+            metric.ticker, metric.period,
+            metric.aisc, metric.production, metric.revenue, metric.fcf,
+            metric.dividend_yield, metric.market_cap,
+            metric.tier1, metric.tier2, metric.tier3
+        )
+
     def get_all_metrics(self, limit: int = 100) -> List[SilverMinerMetric]:
         """
         Get all metrics ordered by period (newest first) then ticker.
@@ -302,108 +620,156 @@ class SilverMetricsDB:
         Returns:
             List of SilverMinerMetric objects
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.execute('''
                 SELECT id, company, ticker, period, aisc, production, revenue,
                        fcf, dividend_yield, market_cap, tier1, tier2, tier3, timestamp
-                FROM silver_metrics
-                ORDER BY period DESC, ticker ASC
+                FROM silver_metrics_v
+                ORDER BY period_key DESC, ticker ASC
                 LIMIT ?
             ''', (limit,))
 
-            return [self._row_to_metric(row) for row in cursor.fetchall()]
+            return self._rows_to_metrics(cursor)
 
     def get_metrics_by_ticker(self, ticker: str) -> List[SilverMinerMetric]:
         """Get all metrics for a specific company."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.execute('''
                 SELECT id, company, ticker, period, aisc, production, revenue,
                        fcf, dividend_yield, market_cap, tier1, tier2, tier3, timestamp
-                FROM silver_metrics
+                FROM silver_metrics_v
                 WHERE ticker = ?
-                ORDER BY period DESC
+                ORDER BY period_key DESC
             ''', (ticker,))
 
-            return [self._row_to_metric(row) for row in cursor.fetchall()]
+            return self._rows_to_metrics(cursor)
+
+    def get_metrics_between(self, start_period: str, end_period: str) -> List[SilverMinerMetric]:
+        """
+        Get all metrics from start_period through end_period inclusive.
+
+        Args:
+            start_period: First period, e.g. "2024-Q1"
+            end_period: Last period, e.g. "2024-Q4"
+
+        Returns:
+            List of SilverMinerMetric objects, newest period first then ticker
+        """
+        with self._read() as conn:
+            cursor = conn.execute('''
+                SELECT id, company, ticker, period, aisc, production, revenue,
+                       fcf, dividend_yield, market_cap, tier1, tier2, tier3, timestamp
+                FROM silver_metrics_v
+                WHERE period_key BETWEEN ? AND ?
+                ORDER BY period_key DESC, ticker ASC
+            ''', (period_key(start_period), period_key(end_period)))
+
+            return self._rows_to_metrics(cursor)
 
     def get_latest_by_company(self) -> List[SilverMinerMetric]:
         """
         Get the most recent metric for each company.
         Useful for dashboard KPIs.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
+            cursor = conn.execute(_LATEST_BY_COMPANY_SQL)
+
+            return self._rows_to_metrics(cursor)
+
+    def get_latest_per_ticker(self) -> List[SilverMinerMetric]:
+        """
+        Get the most recent metric for each ticker in a single windowed query.
+
+        Returns one row per ticker, ordered by ticker.
+        """
+        with self._read() as conn:
             cursor = conn.execute('''
                 SELECT id, company, ticker, period, aisc, production, revenue,
                        fcf, dividend_yield, market_cap, tier1, tier2, tier3, timestamp
-                FROM silver_metrics m1
-                WHERE period = (
-                    SELECT MAX(period) FROM silver_metrics m2
-                    WHERE m2.ticker = m1.ticker
+                FROM (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY ticker ORDER BY period_key DESC
+                    ) AS rn
+                    FROM silver_metrics_v
                 )
-                ORDER BY aisc ASC
+                WHERE rn = 1
+                ORDER BY ticker ASC
             ''')
 
-            return [self._row_to_metric(row) for row in cursor.fetchall()]
+            return self._rows_to_metrics(cursor)
 
     def get_sector_stats(self) -> Dict[str, Any]:
         """
         Calculate sector-wide statistics from latest data.
+
+        Results are reused for STATS_CACHE_TTL_SECONDS or until the next write.
         """
-        latest = self.get_latest_by_company()
-        if not latest:
-            return {
+        cached = self._stats_cache.get('sector')
+        if cached and cached[0] > time.monotonic():
+            return dict(cached[1])
+
+        with self._read() as conn:
+            avg_aisc, total_production, avg_yield, weighted_tier1, count = conn.execute(
+                _SECTOR_STATS_SQL
+            ).fetchone()
+
+        if not count:
+            stats = {
                 'avg_aisc': 0,
                 'total_production': 0,
                 'avg_yield': 0,
                 'tier1_exposure': 0,
                 'company_count': 0
             }
+        else:
+            stats = {
+                'avg_aisc': round(avg_aisc, 2),
+                'total_production': round(total_production, 1),
+                'avg_yield': round(avg_yield, 1),
+                'tier1_exposure': round(weighted_tier1 or 0, 0),
+                'company_count': count
+            }
 
-        total_market_cap = sum(m.market_cap for m in latest)
-        weighted_tier1 = sum(m.tier1 * m.market_cap for m in latest) / total_market_cap if total_market_cap > 0 else 0
+        self._stats_cache['sector'] = (time.monotonic() + STATS_CACHE_TTL_SECONDS, stats)
+        return dict(stats)
 
-        return {
-            'avg_aisc': round(sum(m.aisc for m in latest) / len(latest), 2),
-            'total_production': round(sum(m.production for m in latest), 1),
-            'avg_yield': round(sum(m.dividend_yield for m in latest) / len(latest), 1),
-            'tier1_exposure': round(weighted_tier1, 0),
-            'company_count': len(latest)
-        }
+    def get_period_rollups(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get precomputed sector aggregates per period, newest first.
 
-    def _row_to_metric(self, row: tuple) -> SilverMinerMetric:
-        """Convert database row to SilverMinerMetric object."""
-        timestamp = None
-        if row[13]:
-            try:
-                timestamp = datetime.fromisoformat(row[13])
-            except (ValueError, TypeError):
-                pass
-
-        return SilverMinerMetric(
-            id=row[0],
-            company=row[1],
-            ticker=row[2],
-            period=row[3],
-            aisc=row[4],
-            production=row[5],
-            revenue=row[6],
-            fcf=row[7],
-            dividend_yield=row[8],
-            market_cap=row[9],
-            tier1=row[10],
-            tier2=row[11],
-            tier3=row[12],
-            timestamp=timestamp
-        )
+        Each entry has avg_aisc, production-weighted weighted_aisc,
+        total_production, total_revenue, total_fcf and n_companies.
+        """
+        with self._read() as conn:
+            cursor = conn.execute('''
+                SELECT period, avg_aisc, weighted_aisc, total_production,
+                       total_revenue, total_fcf, n_companies
+                FROM silver_metrics_rollup
+                ORDER BY period DESC
+                LIMIT ?
+            ''', (limit,))
+            columns = [c[0] for c in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _rows_to_metrics(cursor: sqlite3.Cursor) -> List[SilverMinerMetric]:
+        """Convert result rows to SilverMinerMetric objects."""
+        # Columns are selected in field order, so starmap constructs each
+        # metric straight from the row tuple with no per-row Python frame;
+        # the timestamp text is only parsed if a caller reads .timestamp
+        return list(starmap(SilverMinerMetric, cursor))
 
 
 # Singleton instance
 _silver_db: Optional[SilverMetricsDB] = None
+_silver_db_lock = threading.Lock()
 
 
 def get_silver_metrics_db() -> SilverMetricsDB:
-    """Get or create the SilverMetricsDB singleton."""
+    """Get or create the SilverMetricsDB singleton (created at most once)."""
     global _silver_db
     if _silver_db is None:
-        _silver_db = SilverMetricsDB()
+        with _silver_db_lock:
+            if _silver_db is None:
+                _silver_db = SilverMetricsDB()
     return _silver_db
@@ -0,0 +1,150 @@
+"""
+Silver Miner Seed Data
+
+Built-in quarterly reports used to populate an empty silver_metrics table.
+Imported lazily by core.silver_metrics only when seeding is required.
+"""
+
+from typing import Final, Tuple
+
+
+# Seed data for initial population - 2023 Q1 through 2025 Q3
+# Data based on actual quarterly reports from major silver miners
+# AISC for silver is typically $15-25/oz (vs $1200-1600/oz for gold)
+# Columns: (company, ticker, period, aisc, production, revenue, fcf,
+#           dividend_yield, market_cap, tier1, tier2, tier3)
+SEED_ROWS: Tuple[tuple, ...] = (
+    # ==================== 2023 Q1 ====================
+    ('Pan American Silver', 'PAAS', '2023-Q1', 18.50, 5.8, 0.42, 0.02, 2.8, 6.2, 25, 60, 15),
+    ('Hecla Mining', 'HL', '2023-Q1', 17.25, 3.4, 0.18, 0.01, 0.8, 2.8, 85, 10, 5),
+    ('First Majestic Silver', 'AG', '2023-Q1', 21.50, 3.1, 0.12, -0.02, 0.0, 2.1, 0, 100, 0),
+    ('Endeavour Silver', 'EXK', '2023-Q1', 19.80, 1.2, 0.05, 0.00, 0.0, 0.8, 0, 100, 0),
+    ('Coeur Mining', 'CDE', '2023-Q1', 20.10, 2.5, 0.19, -0.01, 0.0, 1.5, 70, 30, 0),
+    ('MAG Silver', 'MAG', '2023-Q1', 12.50, 1.8, 0.08, 0.03, 0.0, 1.8, 0, 100, 0),
+    ('Avino Silver & Gold', 'ASM', '2023-Q1', 18.90, 0.45, 0.012, 0.001, 0.0, 0.12, 0, 100, 0),
+    ('SilverCrest Metals', 'SILV', '2023-Q1', 11.20, 2.2, 0.06, 0.02, 0.0, 1.9, 0, 100, 0),
+    ('Fortuna Silver Mines', 'FSM', '2023-Q1', 16.80, 2.0, 0.18, 0.03, 2.0, 1.2, 0, 55, 45),
+    ('SSR Mining', 'SSRM', '2023-Q1', 15.40, 2.8, 0.32, 0.05, 2.5, 2.5, 30, 35, 35),
+
+    # ==================== 2023 Q2 ====================
+    ('Pan American Silver', 'PAAS', '2023-Q2', 18.20, 6.0, 0.45, 0.03, 2.7, 6.5, 25, 60, 15),
+    ('Hecla Mining', 'HL', '2023-Q2', 17.00, 3.5, 0.19, 0.015, 0.8, 2.9, 85, 10, 5),
+    ('First Majestic Silver', 'AG', '2023-Q2', 21.20, 3.2, 0.13, -0.015, 0.0, 2.2, 0, 100, 0),
+    ('Endeavour Silver', 'EXK', '2023-Q2', 19.50, 1.25, 0.052, 0.002, 0.0, 0.82, 0, 100, 0),
+    ('Coeur Mining', 'CDE', '2023-Q2', 19.80, 2.6, 0.20, 0.00, 0.0, 1.6, 70, 30, 0),
+    ('MAG Silver', 'MAG', '2023-Q2', 12.20, 1.9, 0.085, 0.035, 0.0, 1.9, 0, 100, 0),
+    ('Avino Silver & Gold', 'ASM', '2023-Q2', 18.50, 0.48, 0.013, 0.002, 0.0, 0.13, 0, 100, 0),
+    ('SilverCrest Metals', 'SILV', '2023-Q2', 10.90, 2.3, 0.065, 0.025, 0.0, 2.0, 0, 100, 0),
+    ('Fortuna Silver Mines', 'FSM', '2023-Q2', 16.50, 2.1, 0.19, 0.035, 2.0, 1.25, 0, 55, 45),
+    ('SSR Mining', 'SSRM', '2023-Q2', 15.20, 2.9, 0.33, 0.055, 2.5, 2.6, 30, 35, 35),
+
+    # ==================== 2023 Q3 ====================
+    ('Pan American Silver', 'PAAS', '2023-Q3', 17.90, 6.2, 0.48, 0.04, 2.6, 6.8, 25, 60, 15),
+    ('Hecla Mining', 'HL', '2023-Q3', 16.80, 3.6, 0.20, 0.02, 0.9, 3.0, 85, 10, 5),
+    ('First Majestic Silver', 'AG', '2023-Q3', 20.80, 3.3, 0.14, -0.01, 0.0, 2.3, 0, 100, 0),
+    ('Endeavour Silver', 'EXK', '2023-Q3', 19.20, 1.3, 0.055, 0.005, 0.0, 0.85, 0, 100, 0),
+    ('Coeur Mining', 'CDE', '2023-Q3', 19.50, 2.7, 0.21, 0.01, 0.0, 1.7, 70, 30, 0),
+    ('MAG Silver', 'MAG', '2023-Q3', 11.90, 2.0, 0.09, 0.04, 0.0, 2.0, 0, 100, 0),
+    ('Avino Silver & Gold', 'ASM', '2023-Q3', 18.10, 0.50, 0.014, 0.003, 0.0, 0.14, 0, 100, 0),
+    ('SilverCrest Metals', 'SILV', '2023-Q3', 10.60, 2.4, 0.07, 0.03, 0.0, 2.1, 0, 100, 0),
+    ('Fortuna Silver Mines', 'FSM', '2023-Q3', 16.20, 2.15, 0.20, 0.04, 2.1, 1.3, 0, 55, 45),
+    ('SSR Mining', 'SSRM', '2023-Q3', 15.00, 3.0, 0.34, 0.06, 2.6, 2.7, 30, 35, 35),
+
+    # ==================== 2023 Q4 ====================
+    ('Pan American Silver', 'PAAS', '2023-Q4', 17.60, 6.5, 0.52, 0.05, 2.5, 7.2, 25, 60, 15),
+    ('Hecla Mining', 'HL', '2023-Q4', 16.50, 3.7, 0.22, 0.025, 1.0, 3.2, 85, 10, 5),
+    ('First Majestic Silver', 'AG', '2023-Q4', 20.50, 3.4, 0.15, 0.00, 0.0, 2.4, 0, 100, 0),
+    ('Endeavour Silver', 'EXK', '2023-Q4', 18.90, 1.35, 0.058, 0.008, 0.0, 0.88, 0, 100, 0),
+    ('Coeur Mining', 'CDE', '2023-Q4', 19.20, 2.8, 0.23, 0.02, 0.0, 1.8, 70, 30, 0),
+    ('MAG Silver', 'MAG', '2023-Q4', 11.60, 2.1, 0.095, 0.045, 0.0, 2.1, 0, 100, 0),
+    ('Avino Silver & Gold', 'ASM', '2023-Q4', 17.80, 0.52, 0.015, 0.004, 0.0, 0.15, 0, 100, 0),
+    ('SilverCrest Metals', 'SILV', '2023-Q4', 10.30, 2.5, 0.075, 0.035, 0.0, 2.2, 0, 100, 0),
+    ('Fortuna Silver Mines', 'FSM', '2023-Q4', 15.90, 2.2, 0.21, 0.045, 2.2, 1.35, 0, 55, 45),
+    ('SSR Mining', 'SSRM', '2023-Q4', 14.80, 3.1, 0.36, 0.07, 2.7, 2.8, 30, 35, 35),
+
+    # ==================== 2024 Q1 ====================
+    ('Pan American Silver', 'PAAS', '2024-Q1', 17.30, 6.8, 0.55, 0.06, 2.4, 7.5, 25, 60, 15),
+    ('Hecla Mining', 'HL', '2024-Q1', 16.20, 3.8, 0.24, 0.03, 1.0, 3.4, 85, 10, 5),
+    ('First Majestic Silver', 'AG', '2024-Q1', 20.20, 3.5, 0.16, 0.01, 0.0, 2.5, 0, 100, 0),
+    ('Endeavour Silver', 'EXK', '2024-Q1', 18.60, 1.4, 0.062, 0.01, 0.0, 0.92, 0, 100, 0),
+    ('Coeur Mining', 'CDE', '2024-Q1', 18.90, 2.9, 0.25, 0.03, 0.0, 1.9, 70, 30, 0),
+    ('MAG Silver', 'MAG', '2024-Q1', 11.30, 2.2, 0.10, 0.05, 0.0, 2.2, 0, 100, 0),
+    ('Avino Silver & Gold', 'ASM', '2024-Q1', 17.50, 0.55, 0.016, 0.005, 0.0, 0.16, 0, 100, 0),
+    ('SilverCrest Metals', 'SILV', '2024-Q1', 10.00, 2.6, 0.08, 0.04, 0.0, 2.3, 0, 100, 0),
+    ('Fortuna Silver Mines', 'FSM', '2024-Q1', 15.60, 2.3, 0.22, 0.05, 2.3, 1.4, 0, 55, 45),
+    ('SSR Mining', 'SSRM', '2024-Q1', 14.60, 3.2, 0.38, 0.08, 2.8, 2.9, 30, 35, 35),
+
+    # ==================== 2024 Q2 ====================
+    ('Pan American Silver', 'PAAS', '2024-Q2', 17.00, 7.0, 0.62, 0.08, 2.3, 8.0, 25, 60, 15),
+    ('Hecla Mining', 'HL', '2024-Q2', 15.90, 3.9, 0.27, 0.04, 1.1, 3.6, 85, 10, 5),
+    ('First Majestic Silver', 'AG', '2024-Q2', 19.80, 3.6, 0.18, 0.02, 0.0, 2.7, 0, 100, 0),
+    ('Endeavour Silver', 'EXK', '2024-Q2', 18.30, 1.45, 0.068, 0.015, 0.0, 0.98, 0, 100, 0),
+    ('Coeur Mining', 'CDE', '2024-Q2', 18.50, 3.0, 0.28, 0.04, 0.0, 2.1, 70, 30, 0),
+    ('MAG Silver', 'MAG', '2024-Q2', 11.00, 2.3, 0.11, 0.055, 0.0, 2.4, 0, 100, 0),
+    ('Avino Silver & Gold', 'ASM', '2024-Q2', 17.20, 0.58, 0.018, 0.006, 0.0, 0.17, 0, 100, 0),
+    ('SilverCrest Metals', 'SILV', '2024-Q2', 9.70, 2.7, 0.09, 0.045, 0.0, 2.5, 0, 100, 0),
+    ('Fortuna Silver Mines', 'FSM', '2024-Q2', 15.30, 2.4, 0.25, 0.06, 2.4, 1.5, 0, 55, 45),
+    ('SSR Mining', 'SSRM', '2024-Q2', 14.40, 3.3, 0.42, 0.09, 2.9, 3.0, 30, 35, 35),
+
+    # ==================== 2024 Q3 ====================
+    ('Pan American Silver', 'PAAS', '2024-Q3', 16.70, 7.2, 0.68, 0.10, 2.2, 8.5, 25, 60, 15),
+    ('Hecla Mining', 'HL', '2024-Q3', 15.60, 4.0, 0.30, 0.05, 1.2, 3.8, 85, 10, 5),
+    ('First Majestic Silver', 'AG', '2024-Q3', 19.50, 3.7, 0.20, 0.03, 0.0, 2.9, 0, 100, 0),
+    ('Endeavour Silver', 'EXK', '2024-Q3', 18.00, 1.5, 0.075, 0.02, 0.0, 1.05, 0, 100, 0),
+    ('Coeur Mining', 'CDE', '2024-Q3', 18.20, 3.1, 0.32, 0.05, 0.0, 2.3, 70, 30, 0),
+    ('MAG Silver', 'MAG', '2024-Q3', 10.70, 2.4, 0.12, 0.06, 0.0, 2.6, 0, 100, 0),
+    ('Avino Silver & Gold', 'ASM', '2024-Q3', 16.90, 0.60, 0.020, 0.007, 0.0, 0.18, 0, 100, 0),
+    ('SilverCrest Metals', 'SILV', '2024-Q3', 9.40, 2.8, 0.10, 0.05, 0.0, 2.7, 0, 100, 0),
+    ('Fortuna Silver Mines', 'FSM', '2024-Q3', 15.00, 2.5, 0.28, 0.07, 2.5, 1.6, 0, 55, 45),
+    ('SSR Mining', 'SSRM', '2024-Q3', 14.20, 3.4, 0.45, 0.10, 3.0, 3.2, 30, 35, 35),
+
+    # ==================== 2024 Q4 ====================
+    ('Pan American Silver', 'PAAS', '2024-Q4', 16.40, 7.5, 0.75, 0.12, 2.1, 9.0, 25, 60, 15),
+    ('Hecla Mining', 'HL', '2024-Q4', 15.30, 4.1, 0.33, 0.06, 1.3, 4.0, 85, 10, 5),
+    ('First Majestic Silver', 'AG', '2024-Q4', 19.20, 3.8, 0.22, 0.04, 0.0, 3.1, 0, 100, 0),
+    ('Endeavour Silver', 'EXK', '2024-Q4', 17.70, 1.55, 0.082, 0.025, 0.0, 1.12, 0, 100, 0),
+    ('Coeur Mining', 'CDE', '2024-Q4', 17.90, 3.2, 0.35, 0.06, 0.0, 2.5, 70, 30, 0),
+    ('MAG Silver', 'MAG', '2024-Q4', 10.40, 2.5, 0.13, 0.065, 0.0, 2.8, 0, 100, 0),
+    ('Avino Silver & Gold', 'ASM', '2024-Q4', 16.60, 0.62, 0.022, 0.008, 0.0, 0.19, 0, 100, 0),
+    ('SilverCrest Metals', 'SILV', '2024-Q4', 9.10, 2.9, 0.11, 0.055, 0.0, 2.9, 0, 100, 0),
+    ('Fortuna Silver Mines', 'FSM', '2024-Q4', 14.70, 2.6, 0.30, 0.08, 2.6, 1.7, 0, 55, 45),
+    ('SSR Mining', 'SSRM', '2024-Q4', 14.00, 3.5, 0.48, 0.11, 3.1, 3.4, 30, 35, 35),
+
+    # ==================== 2025 Q1 ====================
+    ('Pan American Silver', 'PAAS', '2025-Q1', 16.10, 7.8, 0.82, 0.14, 2.0, 9.5, 25, 60, 15),
+    ('Hecla Mining', 'HL', '2025-Q1', 15.00, 4.2, 0.36, 0.07, 1.4, 4.2, 85, 10, 5),
+    ('First Majestic Silver', 'AG', '2025-Q1', 18.90, 3.9, 0.24, 0.05, 0.0, 3.3, 0, 100, 0),
+    ('Endeavour Silver', 'EXK', '2025-Q1', 17.40, 1.6, 0.088, 0.03, 0.0, 1.2, 0, 100, 0),
+    ('Coeur Mining', 'CDE', '2025-Q1', 17.60, 3.3, 0.38, 0.07, 0.0, 2.7, 70, 30, 0),
+    ('MAG Silver', 'MAG', '2025-Q1', 10.10, 2.6, 0.14, 0.07, 0.0, 3.0, 0, 100, 0),
+    ('Avino Silver & Gold', 'ASM', '2025-Q1', 16.30, 0.65, 0.024, 0.009, 0.0, 0.20, 0, 100, 0),
+    ('SilverCrest Metals', 'SILV', '2025-Q1', 8.80, 3.0, 0.12, 0.06, 0.0, 3.1, 0, 100, 0),
+    ('Fortuna Silver Mines', 'FSM', '2025-Q1', 14.40, 2.7, 0.32, 0.09, 2.7, 1.8, 0, 55, 45),
+    ('SSR Mining', 'SSRM', '2025-Q1', 13.80, 3.6, 0.50, 0.12, 3.2, 3.6, 30, 35, 35),
+
+    # ==================== 2025 Q2 ====================
+    ('Pan American Silver', 'PAAS', '2025-Q2', 15.80, 8.0, 0.88, 0.16, 1.9, 10.0, 25, 60, 15),
+    ('Hecla Mining', 'HL', '2025-Q2', 14.70, 4.3, 0.38, 0.08, 1.5, 4.4, 85, 10, 5),
+    ('First Majestic Silver', 'AG', '2025-Q2', 18.60, 4.0, 0.26, 0.06, 0.0, 3.5, 0, 100, 0),
+    ('Endeavour Silver', 'EXK', '2025-Q2', 17.10, 1.65, 0.095, 0.035, 0.0, 1.28, 0, 100, 0),
+    ('Coeur Mining', 'CDE', '2025-Q2', 17.30, 3.4, 0.41, 0.08, 0.0, 2.9, 70, 30, 0),
+    ('MAG Silver', 'MAG', '2025-Q2', 9.80, 2.7, 0.15, 0.075, 0.0, 3.2, 0, 100, 0),
+    ('Avino Silver & Gold', 'ASM', '2025-Q2', 16.00, 0.68, 0.026, 0.010, 0.0, 0.21, 0, 100, 0),
+    ('SilverCrest Metals', 'SILV', '2025-Q2', 8.50, 3.1, 0.13, 0.065, 0.0, 3.3, 0, 100, 0),
+    ('Fortuna Silver Mines', 'FSM', '2025-Q2', 14.10, 2.8, 0.35, 0.10, 2.8, 1.9, 0, 55, 45),
+    ('SSR Mining', 'SSRM', '2025-Q2', 13.60, 3.7, 0.52, 0.13, 3.3, 3.8, 30, 35, 35),
+
+    # ==================== 2025 Q3 ====================
+    ('Pan American Silver', 'PAAS', '2025-Q3', 15.50, 8.2, 0.92, 0.18, 1.8, 10.5, 25, 60, 15),
+    ('Hecla Mining', 'HL', '2025-Q3', 14.40, 4.4, 0.40, 0.09, 1.6, 4.6, 85, 10, 5),
+    ('First Majestic Silver', 'AG', '2025-Q3', 18.30, 4.1, 0.28, 0.07, 0.0, 3.7, 0, 100, 0),
+    ('Endeavour Silver', 'EXK', '2025-Q3', 16.80, 1.7, 0.10, 0.04, 0.0, 1.35, 0, 100, 0),
+    ('Coeur Mining', 'CDE', '2025-Q3', 17.00, 3.5, 0.44, 0.09, 0.0, 3.1, 70, 30, 0),
+    ('MAG Silver', 'MAG', '2025-Q3', 9.50, 2.8, 0.16, 0.08, 0.0, 3.4, 0, 100, 0),
+    ('Avino Silver & Gold', 'ASM', '2025-Q3', 15.70, 0.70, 0.028, 0.011, 0.0, 0.22, 0, 100, 0),
+    ('SilverCrest Metals', 'SILV', '2025-Q3', 8.20, 3.2, 0.14, 0.07, 0.0, 3.5, 0, 100, 0),
+    ('Fortuna Silver Mines', 'FSM', '2025-Q3', 13.80, 2.9, 0.38, 0.11, 2.9, 2.0, 0, 55, 45),
+    ('SSR Mining', 'SSRM', '2025-Q3', 13.40, 3.8, 0.55, 0.14, 3.4, 4.0, 30, 35, 35),
+)
+
+SEED_COUNT: Final[int] = len(SEED_ROWS)
@@ -5,13 +5,30 @@ Stores wallet analysis history in SQLite for progress tracking.
 
 import sqlite3
 import json
-from datetime import datetime, timedelta
+import queue
+import sys
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+# orjson is an optional, faster encoder for the stored asset breakdown
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-@dataclass
+
+# __slots__ dataclasses need Python 3.10+; fall back to a plain dataclass on 3.9
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Snapshot:
     """A point-in-time sovereignty snapshot."""
     id: Optional[int]
@@ -27,7 +44,7 @@ class Snapshot:
     asset_breakdown: dict
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProgressMetrics:
     """Progress metrics calculated from historical data."""
     current_ratio: float
@@ -40,9 +57,9 @@ class ProgressMetrics:
     projected_next_status: Optional[dict]  # {status, ratio_needed, projected_date}
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AllTimeStats:
-    """All-time statistics for an address."""
+    """All-time statistics for an address (frozen, since cached instances are shared)."""
     high: float
     low: float
     average: float
@@ -50,6 +67,210 @@ class AllTimeStats:
     last_tracked: datetime
 
 
+def _dumps(obj) -> str:
+    """Serialize to JSON text, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+# Sovereignty statuses as produced by the analyzer, stored as small integers
+# in snapshots.status_code (ordered from least to most sovereign)
+STATUS_NAMES: Dict[int, str] = {
+    0: "Vulnerable ⚫",
+    1: "Fragile 🔴",
+    2: "Robust 🟡",
+    3: "Antifragile 🟢",
+    4: "Generationally Sovereign 🟩",
+}
+STATUS_CODES: Dict[str, int] = {name: code for code, name in STATUS_NAMES.items()}
+
+
+def _status_code(status: Optional[str]) -> Optional[int]:
+    """Code for a status label, or None if it is not one of STATUS_NAMES."""
+    return STATUS_CODES.get(status)
+
+
+def _cutoff(**delta) -> str:
+    """
+    UTC time `delta` ago in SQLite's CURRENT_TIMESTAMP format.
+
+    Bound as a plain parameter so timestamp comparisons are simple index
+    range seeks instead of evaluating datetime('now', ...) in SQL.
+    """
+    moment = datetime.now(timezone.utc) - timedelta(**delta)
+    return moment.strftime("%Y-%m-%d %H:%M:%S")
+
+
+# How long get_all_time_stats results are reused before re-querying
+STATS_CACHE_TTL_SECONDS = 60
+
+# Addresses kept in the all-time stats cache; expired entries go first
+STATS_CACHE_MAX_ENTRIES = 256
+
+# Rows pulled per query when streaming history
+HISTORY_FETCH_SIZE = 256
+
+# Rows removed per DELETE statement in cleanup_old_data
+CLEANUP_BATCH_SIZE = 1000
+
+# Refresh planner statistics after this many snapshots have been saved
+ANALYZE_EVERY_INSERTS = 1000
+
+# Prepared statements kept per connection (sqlite3 default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Number of pooled read-only connections per SovereigntyHistory instance
+READER_POOL_SIZE = 4
+
+# Seconds to wait for a free pooled reader before giving up
+READER_TIMEOUT_SECONDS = 30
+
+# SQL is kept in module constants so every call passes the identical string
+# and hits the connection's prepared-statement cache instead of re-parsing.
+_SQL_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS snapshots (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        address TEXT NOT NULL,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        sovereignty_ratio REAL,
+        sovereignty_status TEXT,
+        hard_money_usd REAL,
+        total_portfolio_usd REAL,
+        hard_money_pct REAL,
+        algo_balance REAL,
+        annual_expenses REAL,
+        asset_breakdown TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        status_code INTEGER
+    )
+"""
+
+_SQL_ADD_STATUS_CODE = "ALTER TABLE snapshots ADD COLUMN status_code INTEGER"
+
+_SQL_BACKFILL_STATUS_CODE = """
+    UPDATE snapshots SET status_code = ?, sovereignty_status = NULL
+    WHERE sovereignty_status = ?
+"""
+
+# timestamp DESC matches the "newest first ... LIMIT 1" lookups in
+# get_progress, so they stop after one index entry without a sort
+_SQL_CREATE_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_address_timestamp
+    ON snapshots(address, timestamp DESC)
+"""
+
+# Covers every column get_all_time_stats reads, so its aggregates come
+# from the index B-tree without touching table rows
+_SQL_CREATE_STATS_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_snapshots_agg
+    ON snapshots(address, sovereignty_ratio, timestamp)
+"""
+
+# Dedup is folded into the insert: nothing is written when the address
+# already has a snapshot newer than :recent_cutoff
+_SQL_INSERT_SNAPSHOT = """
+    INSERT INTO snapshots (
+        address, sovereignty_ratio, status_code, sovereignty_status,
+        hard_money_usd, total_portfolio_usd, hard_money_pct,
+        algo_balance, annual_expenses, asset_breakdown
+    )
+    SELECT :address, :sovereignty_ratio, :status_code, :sovereignty_status,
+           :hard_money_usd, :total_portfolio_usd, :hard_money_pct,
+           :algo_balance, :annual_expenses, :asset_breakdown
+    WHERE NOT EXISTS (
+        SELECT 1 FROM snapshots
+        WHERE address = :address
+        AND timestamp > :recent_cutoff
+    )
+"""
+
+_SQL_GET_HISTORY = """
+    SELECT id, timestamp, sovereignty_ratio, status_code, sovereignty_status,
+           hard_money_usd, total_portfolio_usd, hard_money_pct, algo_balance
+    FROM snapshots
+    WHERE address = :address
+    AND timestamp > :cutoff
+    ORDER BY timestamp DESC, id DESC
+    LIMIT :limit
+"""
+
+# Next page of history: resumes strictly after the last (timestamp, id) seen
+_SQL_GET_HISTORY_PAGE = """
+    SELECT id, timestamp, sovereignty_ratio, status_code, sovereignty_status,
+           hard_money_usd, total_portfolio_usd, hard_money_pct, algo_balance
+    FROM snapshots
+    WHERE address = :address
+    AND timestamp > :cutoff
+    AND timestamp <= :last_timestamp
+    AND (timestamp < :last_timestamp OR id < :last_id)
+    ORDER BY timestamp DESC, id DESC
+    LIMIT :limit
+"""
+
+_SQL_GET_PROGRESS = """
+    WITH agg AS (
+        SELECT
+            COUNT(*) as count,
+            MIN(timestamp) as first_ts,
+            MAX(timestamp) as last_ts
+        FROM snapshots WHERE address = :address
+    )
+    SELECT
+        (SELECT sovereignty_ratio FROM snapshots
+         WHERE address = :address
+         ORDER BY timestamp DESC LIMIT 1) as current_ratio,
+        (SELECT sovereignty_ratio FROM snapshots
+         WHERE address = :address
+         AND timestamp < :previous_cutoff
+         ORDER BY timestamp DESC LIMIT 1) as previous_ratio,
+        agg.count, agg.first_ts, agg.last_ts
+    FROM agg
+"""
+
+_SQL_ALL_TIME_STATS = """
+    SELECT
+        MAX(sovereignty_ratio) as high,
+        MIN(sovereignty_ratio) as low,
+        AVG(sovereignty_ratio) as average,
+        MIN(timestamp) as first_ts,
+        MAX(timestamp) as last_ts
+    FROM snapshots WHERE address = ?
+"""
+
+_SQL_DELETE_HISTORY = "DELETE FROM snapshots WHERE address = ?"
+
+# Bounded so each autocommitted DELETE holds the write lock only briefly
+_SQL_CLEANUP = """
+    DELETE FROM snapshots
+    WHERE id IN (
+        SELECT id FROM snapshots
+        WHERE timestamp < ?
+        LIMIT ?
+    )
+"""
+
+
+def _close_connections(
+    write_lock: threading.Lock,
+    write_conn: sqlite3.Connection,
+    readers: queue.Queue,
+) -> None:
+    """Close a tracker's writer and every pooled reader (run once, via finalize)."""
+    with write_lock:
+        try:
+            # Let SQLite refresh any statistics this session's queries need
+            write_conn.execute("PRAGMA optimize")
+        except sqlite3.ProgrammingError:
+            pass  # Already closed
+        write_conn.close()
+    while True:
+        try:
+            readers.get_nowait().close()
+        except queue.Empty:
+            break
+
+
 class SovereigntyHistory:
     """
     Manages historical sovereignty snapshots using SQLite.
@@ -68,41 +289,132 @@ class SovereigntyHistory:
         (20.0, "Generationally Sovereign"),
     ]
     
-    def __init__(self, db_path: str = "data/sovereignty_history.db"):
+    def __init__(self, db_path: str = "data/sovereignty_history.db", readers: int = READER_POOL_SIZE):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # All-time stats per address: (monotonic expiry, value); dropped on writes
+        self._stats_cache: Dict[str, Tuple[float, AllTimeStats]] = {}
+        self._stats_lock = threading.Lock()
+        self._inserts_since_analyze = 0
+        
+        # One writer behind a lock plus a pool of read-only connections, so
+        # dashboard reads run alongside snapshot saves under WAL
+        self._write_lock = threading.Lock()
+        self._write_conn = self._connect()
         self._init_db()
+        
+        self._readers: queue.Queue = queue.Queue(maxsize=readers)
+        for _ in range(readers):
+            self._readers.put(self._connect(read_only=True))
+        # Closes the connections at exit or when the tracker is collected;
+        # holds no reference to self, so instances are not kept alive
+        self._finalizer = weakref.finalize(
+            self, _close_connections, self._write_lock, self._write_conn, self._readers
+        )
     
     def _init_db(self):
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS snapshots (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    address TEXT NOT NULL,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    sovereignty_ratio REAL,
-                    sovereignty_status TEXT,
-                    hard_money_usd REAL,
-                    total_portfolio_usd REAL,
-                    hard_money_pct REAL,
-                    algo_balance REAL,
-                    annual_expenses REAL,
-                    asset_breakdown TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_address_timestamp 
-                ON snapshots(address, timestamp DESC)
-            """)
-            conn.commit()
+        with self._transaction() as conn:
+            conn.execute(_SQL_CREATE_TABLE)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(snapshots)")}
+            if "status_code" not in columns:
+                self._migrate_status_codes(conn)
+            conn.execute(_SQL_CREATE_INDEX)
+            conn.execute(_SQL_CREATE_STATS_INDEX)
+    
+    @staticmethod
+    def _migrate_status_codes(conn: sqlite3.Connection) -> None:
+        """
+        Add status_code to a pre-existing snapshots table and backfill it.
+        
+        Known statuses move to the integer column and their text is cleared;
+        anything unrecognised keeps its original text.
+        """
+        conn.execute(_SQL_ADD_STATUS_CODE)
+        statuses = [row[0] for row in conn.execute(
+            "SELECT DISTINCT sovereignty_status FROM snapshots"
+        )]
+        conn.executemany(_SQL_BACKFILL_STATUS_CODE, [
+            (_status_code(status), status)
+            for status in statuses
+            if _status_code(status) is not None
+        ])
     
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
+    @staticmethod
+    def _configure(conn: sqlite3.Connection) -> None:
+        """Apply the per-connection PRAGMAs (fewer fsyncs, larger caches)."""
+        conn.executescript("""
+            PRAGMA synchronous=NORMAL;
+            PRAGMA busy_timeout=5000;
+            PRAGMA cache_size=-64000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+        """)
+
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open an autocommit connection with row factory and tuned PRAGMAs.
+        
+        The writer switches the file to WAL (persistent, so once is enough);
+        readers open the file with mode=ro and query_only.
+        """
+        if read_only:
+            conn = sqlite3.connect(
+                self.db_path.resolve().as_uri() + "?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
+            conn.execute("PRAGMA query_only=1")
+        else:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
         conn.row_factory = sqlite3.Row
+        self._configure(conn)
         return conn
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection from the pool."""
+        try:
+            conn = self._readers.get(timeout=READER_TIMEOUT_SECONDS)
+        except queue.Empty:
+            raise sqlite3.OperationalError(
+                f"no pooled reader free after {READER_TIMEOUT_SECONDS}s"
+            ) from None
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Hold the writer connection exclusively for the block."""
+        with self._write_lock:
+            try:
+                yield self._write_conn
+            except BaseException:
+                if self._write_conn.in_transaction:
+                    self._write_conn.rollback()
+                raise
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block on the writer inside BEGIN IMMEDIATE ... COMMIT."""
+        with self._write() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the writer and all pooled reader connections."""
+        self._finalizer()
     
     def save_snapshot(self, address: str, analysis_result: dict) -> Optional[int]:
         """
@@ -115,46 +427,43 @@ class SovereigntyHistory:
         Returns:
             Snapshot ID if saved, None if deduplicated (too recent)
         """
-        # Check for recent snapshot (dedupe within 1 hour)
-        with self._get_connection() as conn:
-            recent = conn.execute("""
-                SELECT id FROM snapshots 
-                WHERE address = ? 
-                AND timestamp > datetime('now', '-1 hour')
-                ORDER BY timestamp DESC LIMIT 1
-            """, (address,)).fetchone()
-            
-            if recent:
+        # Extract data from analysis result
+        sovereignty = analysis_result.get("sovereignty", {})
+        summary = analysis_result.get("summary", {})
+        
+        # Calculate hard money percentage
+        hard_money_usd = sovereignty.get("hard_money_usd", 0)
+        total_usd = sovereignty.get("portfolio_usd", 0)
+        hard_money_pct = (hard_money_usd / total_usd * 100) if total_usd > 0 else 0
+        
+        status = sovereignty.get("sovereignty_status", "Unknown")
+        status_code = _status_code(status)
+        
+        # Single statement: skipped (dedupe within 1 hour) without a
+        # separate SELECT, so there is no check-then-insert race
+        with self._write() as conn:
+            cursor = conn.execute(_SQL_INSERT_SNAPSHOT, {
+                "address": address,
+                "sovereignty_ratio": sovereignty.get("sovereignty_ratio", 0),
+                "status_code": status_code,
+                # Only statuses without a code keep their text
+                "sovereignty_status": None if status_code is not None else status,
+                "hard_money_usd": hard_money_usd,
+                "total_portfolio_usd": total_usd,
+                "hard_money_pct": hard_money_pct,
+                "algo_balance": summary.get("total_algo", 0),
+                "annual_expenses": sovereignty.get("annual_fixed_expenses", 0),
+                "asset_breakdown": _dumps(analysis_result.get("assets", {})),
+                "recent_cutoff": _cutoff(hours=1),
+            })
+            if not cursor.rowcount:
                 return None  # Skip - too recent
-            
-            # Extract data from analysis result
-            sovereignty = analysis_result.get("sovereignty", {})
-            summary = analysis_result.get("summary", {})
-            
-            # Calculate hard money percentage
-            hard_money_usd = sovereignty.get("hard_money_usd", 0)
-            total_usd = sovereignty.get("portfolio_usd", 0)
-            hard_money_pct = (hard_money_usd / total_usd * 100) if total_usd > 0 else 0
-            
-            cursor = conn.execute("""
-                INSERT INTO snapshots (
-                    address, sovereignty_ratio, sovereignty_status,
-                    hard_money_usd, total_portfolio_usd, hard_money_pct,
-                    algo_balance, annual_expenses, asset_breakdown
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                address,
-                sovereignty.get("sovereignty_ratio", 0),
-                sovereignty.get("sovereignty_status", "Unknown"),
-                hard_money_usd,
-                total_usd,
-                hard_money_pct,
-                summary.get("total_algo", 0),
-                sovereignty.get("annual_fixed_expenses", 0),
-                json.dumps(analysis_result.get("assets", {}))
-            ))
-            conn.commit()
-            return cursor.lastrowid
+            self._inserts_since_analyze += 1
+            if self._inserts_since_analyze >= ANALYZE_EVERY_INSERTS:
+                self._inserts_since_analyze = 0
+                conn.execute("ANALYZE snapshots")
+        self._stats_cache.pop(address, None)
+        return cursor.lastrowid
     
     def get_history(self, address: str, days: int = 90) -> list[dict]:
         """
@@ -167,29 +476,47 @@ class SovereigntyHistory:
         Returns:
             List of snapshot dictionaries, newest first
         """
+        return list(self.iter_history(address, days))
+    
+    def iter_history(self, address: str, days: int = 90) -> Iterator[dict]:
+        """
+        Yield historical snapshots for an address, newest first.
+        
+        Same rows as get_history, but fetched HISTORY_FETCH_SIZE at a time
+        so a long history is never held in memory twice. Each batch borrows
+        a reader only while it is queried, so an abandoned generator holds
+        no connection.
+        """
         days = min(days, 365)  # Cap at 1 year
+        params = {
+            "address": address,
+            "cutoff": _cutoff(days=days),
+            "limit": HISTORY_FETCH_SIZE,
+        }
+        sql = _SQL_GET_HISTORY
         
-        with self._get_connection() as conn:
-            rows = conn.execute("""
-                SELECT * FROM snapshots
-                WHERE address = ?
-                AND timestamp > datetime('now', ?)
-                ORDER BY timestamp DESC
-            """, (address, f'-{days} days')).fetchall()
-            
-            return [
-                {
+        while True:
+            with self._read() as conn:
+                rows = conn.execute(sql, params).fetchall()
+            for row in rows:
+                yield {
                     "id": row["id"],
                     "timestamp": row["timestamp"],
                     "sovereignty_ratio": row["sovereignty_ratio"],
-                    "sovereignty_status": row["sovereignty_status"],
+                    "sovereignty_status": (
+                        STATUS_NAMES.get(row["status_code"]) or row["sovereignty_status"]
+                    ),
                     "hard_money_usd": row["hard_money_usd"],
                     "total_portfolio_usd": row["total_portfolio_usd"],
                     "hard_money_pct": row["hard_money_pct"],
                     "algo_balance": row["algo_balance"],
                 }
-                for row in rows
-            ]
+            if len(rows) < params["limit"]:
+                break
+            # Keyset pagination: resume after the last row on the index
+            params["last_timestamp"] = rows[-1]["timestamp"]
+            params["last_id"] = rows[-1]["id"]
+            sql = _SQL_GET_HISTORY_PAGE
     
     def get_progress(self, address: str) -> ProgressMetrics:
         """
@@ -198,96 +525,79 @@ class SovereigntyHistory:
         Returns:
             ProgressMetrics with trend analysis and projections
         """
-        with self._get_connection() as conn:
-            # Get current (most recent) snapshot
-            current = conn.execute("""
-                SELECT * FROM snapshots
-                WHERE address = ?
-                ORDER BY timestamp DESC LIMIT 1
-            """, (address,)).fetchone()
-            
-            if not current:
-                return ProgressMetrics(
-                    current_ratio=0,
-                    previous_ratio=None,
-                    change_absolute=None,
-                    change_pct=None,
-                    trend="new",
-                    days_tracked=0,
-                    snapshots_count=0,
-                    projected_next_status=None
-                )
-            
-            # Get snapshot from ~30 days ago
-            previous = conn.execute("""
-                SELECT * FROM snapshots
-                WHERE address = ?
-                AND timestamp < datetime('now', '-25 days')
-                ORDER BY timestamp DESC LIMIT 1
-            """, (address,)).fetchone()
-            
-            # Get total count and first snapshot
-            stats = conn.execute("""
-                SELECT 
-                    COUNT(*) as count,
-                    MIN(timestamp) as first_ts,
-                    MAX(timestamp) as last_ts
-                FROM snapshots WHERE address = ?
-            """, (address,)).fetchone()
-            
-            current_ratio = current["sovereignty_ratio"]
-            previous_ratio = previous["sovereignty_ratio"] if previous else None
-            
-            # Calculate change
-            if previous_ratio is not None:
-                change_absolute = current_ratio - previous_ratio
-                change_pct = (change_absolute / previous_ratio * 100) if previous_ratio > 0 else 0
-                
-                if change_pct > 5:
-                    trend = "improving"
-                elif change_pct < -5:
-                    trend = "declining"
-                else:
-                    trend = "stable"
-            else:
-                change_absolute = None
-                change_pct = None
-                trend = "new" if stats["count"] == 1 else "stable"
-            
-            # Calculate days tracked
-            if stats["first_ts"]:
-                first_date = datetime.fromisoformat(stats["first_ts"].replace('Z', '+00:00') if 'Z' in stats["first_ts"] else stats["first_ts"])
-                days_tracked = (datetime.now() - first_date).days
-            else:
-                days_tracked = 0
-            
-            # Project next status if improving
-            projected_next_status = None
-            if trend == "improving" and change_absolute and change_absolute > 0:
-                next_threshold = self._get_next_status_threshold(current_ratio)
-                if next_threshold:
-                    ratio_needed, status_name = next_threshold
-                    gap = ratio_needed - current_ratio
-                    # Project based on 30-day rate
-                    days_to_reach = int(gap / change_absolute * 30) if change_absolute > 0 else None
-                    if days_to_reach and days_to_reach < 365:
-                        projected_date = datetime.now() + timedelta(days=days_to_reach)
-                        projected_next_status = {
-                            "status": status_name,
-                            "ratio_needed": ratio_needed,
-                            "projected_date": projected_date.strftime("%Y-%m-%d")
-                        }
-            
+        # Current ratio, ratio from ~30 days ago and count/first/last in one
+        # round-trip; the scalar subselects yield NULL when no row matches
+        with self._read() as conn:
+            stats = conn.execute(_SQL_GET_PROGRESS, {
+                "address": address,
+                "previous_cutoff": _cutoff(days=25),
+            }).fetchone()
+        
+        if not stats["count"]:
             return ProgressMetrics(
-                current_ratio=current_ratio,
-                previous_ratio=previous_ratio,
-                change_absolute=round(change_absolute, 2) if change_absolute else None,
-                change_pct=round(change_pct, 1) if change_pct else None,
-                trend=trend,
-                days_tracked=days_tracked,
-                snapshots_count=stats["count"],
-                projected_next_status=projected_next_status
+                current_ratio=0,
+                previous_ratio=None,
+                change_absolute=None,
+                change_pct=None,
+                trend="new",
+                days_tracked=0,
+                snapshots_count=0,
+                projected_next_status=None
             )
+        
+        current_ratio = stats["current_ratio"]
+        previous_ratio = stats["previous_ratio"]
+        
+        # Calculate change
+        if previous_ratio is not None:
+            change_absolute = current_ratio - previous_ratio
+            change_pct = (change_absolute / previous_ratio * 100) if previous_ratio > 0 else 0
+            
+            if change_pct > 5:
+                trend = "improving"
+            elif change_pct < -5:
+                trend = "declining"
+            else:
+                trend = "stable"
+        else:
+            change_absolute = None
+            change_pct = None
+            trend = "new" if stats["count"] == 1 else "stable"
+        
+        # Calculate days tracked
+        if stats["first_ts"]:
+            first_date = datetime.fromisoformat(stats["first_ts"].replace('Z', '+00:00') if 'Z' in stats["first_ts"] else stats["first_ts"])
+            days_tracked = (datetime.now() - first_date).days
+        else:
+            days_tracked = 0
+        
+        # Project next status if improving
+        projected_next_status = None
+        if trend == "improving" and change_absolute and change_absolute > 0:
+            next_threshold = self._get_next_status_threshold(current_ratio)
+            if next_threshold:
+                ratio_needed, status_name = next_threshold
+                gap = ratio_needed - current_ratio
+                # Project based on 30-day rate
+                days_to_reach = int(gap / change_absolute * 30) if change_absolute > 0 else None
+                if days_to_reach and days_to_reach < 365:
+                    projected_date = datetime.now() + timedelta(days=days_to_reach)
+                    projected_next_status = {
+                        "status": status_name,
+                        "ratio_needed": ratio_needed,
+                        "projected_date": projected_date.strftime("%Y-%m-%d")
+                    }
+        
+        return ProgressMetrics(
+            current_ratio=current_ratio,
+            previous_ratio=previous_ratio,
+            change_absolute=round(change_absolute, 2) if change_absolute else None,
+            change_pct=round(change_pct, 1) if change_pct else None,
+            trend=trend,
+            days_tracked=days_tracked,
+            snapshots_count=stats["count"],
+            projected_next_status=projected_next_status
+        )
     
     def _get_next_status_threshold(self, current_ratio: float) -> Optional[tuple]:
         """Get the next status threshold above current ratio."""
@@ -297,58 +607,85 @@ class SovereigntyHistory:
         return None
     
     def get_all_time_stats(self, address: str) -> Optional[AllTimeStats]:
-        """Get all-time high, low, average for an address."""
-        with self._get_connection() as conn:
-            stats = conn.execute("""
-                SELECT 
-                    MAX(sovereignty_ratio) as high,
-                    MIN(sovereignty_ratio) as low,
-                    AVG(sovereignty_ratio) as average,
-                    MIN(timestamp) as first_ts,
-                    MAX(timestamp) as last_ts
-                FROM snapshots WHERE address = ?
-            """, (address,)).fetchone()
-            
-            if not stats or stats["high"] is None:
-                return None
-            
-            return AllTimeStats(
-                high=round(stats["high"], 2),
-                low=round(stats["low"], 2),
-                average=round(stats["average"], 2),
-                first_tracked=stats["first_ts"],
-                last_tracked=stats["last_ts"]
-            )
+        """
+        Get all-time high, low, average for an address.
+        
+        Results are reused for STATS_CACHE_TTL_SECONDS or until the address
+        gets a new snapshot.
+        """
+        cached = self._stats_cache.get(address)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        with self._read() as conn:
+            stats = conn.execute(_SQL_ALL_TIME_STATS, (address,)).fetchone()
+        
+        if not stats or stats["high"] is None:
+            return None
+        
+        all_time = AllTimeStats(
+            high=round(stats["high"], 2),
+            low=round(stats["low"], 2),
+            average=round(stats["average"], 2),
+            first_tracked=stats["first_ts"],
+            last_tracked=stats["last_ts"]
+        )
+        self._cache_stats(address, all_time)
+        return all_time
+    
+    def _cache_stats(self, address: str, all_time: AllTimeStats) -> None:
+        """Cache stats for an address, evicting so the cache stays bounded."""
+        now = time.monotonic()
+        with self._stats_lock:
+            cache = self._stats_cache
+            if address not in cache and len(cache) >= STATS_CACHE_MAX_ENTRIES:
+                # Writers pop entries without the lock, so work on snapshots
+                for key, (expires_at, _) in list(cache.items()):
+                    if expires_at <= now:
+                        cache.pop(key, None)
+                live = list(cache.items())
+                if len(live) >= STATS_CACHE_MAX_ENTRIES:
+                    oldest = min(live, key=lambda item: item[1][0])[0]
+                    cache.pop(oldest, None)
+            cache[address] = (now + STATS_CACHE_TTL_SECONDS, all_time)
     
     def delete_history(self, address: str) -> int:
         """Delete all history for an address. Returns count deleted."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "DELETE FROM snapshots WHERE address = ?",
-                (address,)
-            )
-            conn.commit()
-            return cursor.rowcount
+        with self._write() as conn:
+            cursor = conn.execute(_SQL_DELETE_HISTORY, (address,))
+        self._stats_cache.pop(address, None)
+        return cursor.rowcount
     
     def cleanup_old_data(self, days_to_keep: int = 365) -> int:
         """Remove snapshots older than N days. Returns count deleted."""
-        with self._get_connection() as conn:
-            cursor = conn.execute("""
-                DELETE FROM snapshots 
-                WHERE timestamp < datetime('now', ?)
-            """, (f'-{days_to_keep} days',))
-            conn.commit()
-            return cursor.rowcount
+        cutoff = _cutoff(days=days_to_keep)
+        deleted = 0
+        # Delete in batches, each committed on its own and taking the writer
+        # lock separately, so other writers can interleave with a large cleanup
+        while True:
+            with self._write() as conn:
+                batch = conn.execute(_SQL_CLEANUP, (cutoff, CLEANUP_BATCH_SIZE)).rowcount
+            deleted += batch
+            if batch < CLEANUP_BATCH_SIZE:
+                break
+        if deleted:
+            with self._write() as conn:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._stats_cache.clear()
+        return deleted
 
 
 # Convenience function for quick access
 _default_history: Optional[SovereigntyHistory] = None
+_default_history_lock = threading.Lock()
 
 def get_history_tracker() -> SovereigntyHistory:
-    """Get the default history tracker instance."""
+    """Get the default history tracker instance (created at most once)."""
     global _default_history
     if _default_history is None:
-        _default_history = SovereigntyHistory()
+        with _default_history_lock:
+            if _default_history is None:
+                _default_history = SovereigntyHistory()
     return _default_history
 
 
@@ -3,10 +3,43 @@ Meld Pricing Module - Additions for core/pricing.py
 Add these functions to your existing pricing.py file
 """
 
+import asyncio
+import atexit
+import bisect
+import json
+import os
+import sqlite3
+import statistics
+import threading
+import time
 import httpx
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Dict, List, Optional, Tuple
 from functools import lru_cache
-from datetime import datetime, timedelta
+from datetime import datetime
+
+# NumPy is optional; calculate_arbitrage_array falls back to plain lists
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# orjson parses Vestige responses faster when installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# HTTP/2 needs the optional h2 package; fall back to pooled HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
 
 # Meld ASA IDs on Algorand Mainnet
 MELD_GOLD_ASA = 246516580   # GOLD$ - 1 token = 1 gram of gold
@@ -14,13 +47,77 @@ MELD_SILVER_ASA = 246519683  # SILVER$ - 1 token = 1 gram of silver
 
 # Conversion constant
 GRAMS_PER_TROY_OZ = 31.1035
+_INV_GRAMS_PER_TROY_OZ = 1.0 / GRAMS_PER_TROY_OZ
+
+# Premium % thresholds for trading signals. HOLD covers [-5, 5]; the lower
+# bounds are bisected right and the upper bounds left so each boundary
+# value stays in the band closer to HOLD.
+_DISCOUNT_THRESHOLDS = (-10, -5)
+_PREMIUM_THRESHOLDS = (5, 10)
+_SIGNALS = ('STRONG_BUY', 'BUY', 'HOLD', 'SELL', 'STRONG_SELL')
 
 # Vestige API for Algorand ASA prices
 VESTIGE_API_URL = "https://free-api.vestige.fi/asset/{asa_id}/price"
 
-# Cache for Meld prices (5 minute TTL)
+# Shared client so cache misses reuse a kept-alive connection instead of
+# paying a fresh TCP + TLS handshake each time
+_http = httpx.Client(
+    http2=HAS_H2,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=10),
+)
+atexit.register(_http.close)
+
+# Cache for Meld prices, keyed by ASA ID: (price, expires_at, refresh_at),
+# with both deadlines on the time.monotonic() clock and TTLs in seconds.
+# The TTL adapts per asset: it starts at 5 minutes, stretches up to 15
+# while recent prices are flat and drops to 1 when they jump.
 _meld_price_cache: dict = {}
-_cache_ttl = timedelta(minutes=5)
+_cache_ttl = 300.0
+_cache_min_ttl = 60.0
+_cache_max_ttl = 900.0
+
+# Relative spread (stddev / mean) of recent prices that keeps the base TTL,
+# and the spread at which the TTL reaches its minimum
+_stable_spread = 0.01
+_volatile_spread = 0.05
+_cache_max_entries = 16
+_cache_lock = threading.Lock()
+
+# Failed lookups are cached as a None price for a short time so an
+# outage doesn't turn every request into another Vestige call
+_negative_ttl = 30.0
+
+# Returned by _get_cached_price when there is no usable entry
+_MISS = object()
+
+# Recent prices per ASA used to size the TTL
+_price_history: dict = {}
+_price_history_size = 8
+
+# Fresh cache entries are also written here so restarts and short-lived
+# CLI runs start warm; uses DATA_DIR env var for Railway/production
+PRICE_CACHE_DB = os.path.join(
+    os.environ.get('DATA_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'),
+    'meld_price_cache.db',
+)
+_persisted_loaded = False
+
+# Hits past this fraction of their TTL trigger a background refresh
+_refresh_fraction = 0.8
+
+# In-flight Vestige fetches per ASA; concurrent misses wait on the event
+# instead of issuing their own request
+_inflight: dict = {}
+_inflight_timeout = 10.0
+
+
+def _parse_price(content: bytes) -> float:
+    """Read the USD price out of a Vestige price response body."""
+    data = orjson.loads(content) if HAS_ORJSON else json.loads(content)
+    
+    # Vestige returns price in USD
+    return float(data.get('price', 0))
 
 
 def get_vestige_price(asa_id: int) -> Optional[float]:
@@ -35,63 +132,278 @@ def get_vestige_price(asa_id: int) -> Optional[float]:
     """
     try:
         url = VESTIGE_API_URL.format(asa_id=asa_id)
-        response = httpx.get(url, timeout=10.0)
+        response = _http.get(url)
         response.raise_for_status()
-        data = response.json()
-        
-        # Vestige returns price in USD
-        return float(data.get('price', 0))
+        return _parse_price(response.content)
     except Exception as e:
         print(f"Error fetching Vestige price for ASA {asa_id}: {e}")
         return None
 
 
-def get_meld_gold_price() -> Optional[float]:
+def _adaptive_ttl(history) -> float:
     """
-    Get current Meld GOLD$ price (USD per gram).
+    Size the cache TTL from the spread of recent prices.
     
-    Returns:
-        USD price per GOLD$ token (1 gram), or None if unavailable
+    The TTL falls linearly from _cache_max_ttl for flat prices to the base
+    TTL at a _stable_spread (1%) spread, then on to _cache_min_ttl at
+    _volatile_spread (5%) and beyond.
     """
-    cache_key = 'meld_gold'
+    if len(history) < 2:
+        return _cache_ttl
     
-    # Check cache
-    if cache_key in _meld_price_cache:
-        price, timestamp = _meld_price_cache[cache_key]
-        if datetime.now() - timestamp < _cache_ttl:
-            return price
+    mean = statistics.fmean(history)
+    spread = statistics.pstdev(history) / mean if mean else 1.0
+    if spread <= _stable_spread:
+        ttl = _cache_max_ttl - (_cache_max_ttl - _cache_ttl) * spread / _stable_spread
+    else:
+        fraction = (spread - _stable_spread) / (_volatile_spread - _stable_spread)
+        ttl = _cache_ttl - (_cache_ttl - _cache_min_ttl) * fraction
+    return max(_cache_min_ttl, min(_cache_max_ttl, ttl))
+
+
+def _get_cached_price(asa_id: int):
+    """
+    Return the cached price for an ASA, or _MISS if there is no fresh entry.
     
-    price = get_vestige_price(MELD_GOLD_ASA)
+    A cached None means the last lookup failed and should not be retried yet.
+    """
+    with _cache_lock:
+        if not _persisted_loaded:
+            _load_persisted_prices()
+        entry = _meld_price_cache.get(asa_id)
+    if entry is None:
+        return _MISS
     
-    if price is not None:
-        _meld_price_cache[cache_key] = (price, datetime.now())
+    price, expires_at, refresh_at = entry
+    now = time.monotonic()
+    if now >= expires_at:
+        return _MISS
+    if now >= refresh_at:
+        _refresh_in_background(asa_id)
+    return price
+
+
+def _store_price(asa_id: int, price: float) -> None:
+    """Cache a freshly fetched price, evicting the soonest-expiring entry when full."""
+    with _cache_lock:
+        history = _price_history.setdefault(asa_id, deque(maxlen=_price_history_size))
+        history.append(price)
+        ttl = _adaptive_ttl(history)
+        
+        if asa_id not in _meld_price_cache and len(_meld_price_cache) >= _cache_max_entries:
+            oldest = min(_meld_price_cache, key=lambda key: _meld_price_cache[key][1])
+            del _meld_price_cache[oldest]
+        
+        now = time.monotonic()
+        entry = _meld_price_cache[asa_id] = (price, now + ttl, now + ttl * _refresh_fraction)
     
+    _persist_price(asa_id, entry)
+
+
+def _store_failure(asa_id: int) -> None:
+    """Remember a failed lookup so retries wait out _negative_ttl."""
+    with _cache_lock:
+        expires_at = time.monotonic() + _negative_ttl
+        _meld_price_cache[asa_id] = (None, expires_at, expires_at)
+
+
+def _record_fetch(asa_id: int, price: Optional[float]) -> Optional[float]:
+    """Cache a fetch result, treating missing or non-positive prices as failures."""
+    if price is None or price <= 0:
+        _store_failure(asa_id)
+        return None
+    _store_price(asa_id, price)
     return price
 
 
-def get_meld_silver_price() -> Optional[float]:
+def _load_persisted_prices() -> None:
     """
-    Get current Meld SILVER$ price (USD per gram).
+    Seed the in-memory cache with unexpired prices from disk (caller holds the lock).
     
-    Returns:
-        USD price per SILVER$ token (1 gram), or None if unavailable
+    Deadlines are stored as wall-clock epoch seconds, since the monotonic
+    clock doesn't carry over between processes.
+    """
+    global _persisted_loaded
+    _persisted_loaded = True
+    wall_now = time.time()
+    try:
+        with closing(sqlite3.connect(PRICE_CACHE_DB)) as conn:
+            rows = conn.execute(
+                "SELECT asa_id, price, expires_at, refresh_at FROM meld_prices "
+                "WHERE expires_at > ?",
+                (wall_now,),
+            ).fetchall()
+    except sqlite3.Error:
+        # No cache file yet, or unreadable; start cold
+        return
+    
+    offset = time.monotonic() - wall_now
+    for asa_id, price, expires_at, refresh_at in rows:
+        _meld_price_cache.setdefault(asa_id, (price, expires_at + offset, refresh_at + offset))
+
+
+def _persist_price(asa_id: int, entry: tuple) -> None:
+    """Write one cache entry through to disk; failures only cost the warm start."""
+    price, expires_at, refresh_at = entry
+    offset = time.time() - time.monotonic()
+    try:
+        os.makedirs(os.path.dirname(PRICE_CACHE_DB), exist_ok=True)
+        with closing(sqlite3.connect(PRICE_CACHE_DB, timeout=5)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meld_prices ("
+                "asa_id INTEGER PRIMARY KEY, price REAL NOT NULL, "
+                "expires_at REAL NOT NULL, refresh_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO meld_prices VALUES (?, ?, ?, ?)",
+                (asa_id, price, expires_at + offset, refresh_at + offset),
+            )
+    except (sqlite3.Error, OSError) as e:
+        print(f"Error persisting Meld price for ASA {asa_id}: {e}")
+
+
+def _begin_fetch(asa_id: int) -> Tuple[bool, threading.Event]:
+    """Claim the fetch for an ASA; returns (True, event) for the caller that should fetch."""
+    with _cache_lock:
+        event = _inflight.get(asa_id)
+        if event is not None:
+            return False, event
+        event = _inflight[asa_id] = threading.Event()
+        return True, event
+
+
+def _end_fetch(asa_id: int, event: threading.Event) -> None:
+    """Release a claimed fetch and wake any callers waiting on it."""
+    with _cache_lock:
+        _inflight.pop(asa_id, None)
+    event.set()
+
+
+def _refresh_in_background(asa_id: int) -> None:
+    """Refetch a hot price before it expires so callers keep hitting the cache."""
+    leader, event = _begin_fetch(asa_id)
+    if not leader:
+        return
+    
+    def refresh():
+        try:
+            price = get_vestige_price(asa_id)
+            if price is not None:
+                _store_price(asa_id, price)
+        finally:
+            _end_fetch(asa_id, event)
+    
+    threading.Thread(target=refresh, daemon=True).start()
+
+
+def _get_meld_price(asa_id: int) -> Optional[float]:
+    """Cached Vestige lookup shared by the GOLD$ and SILVER$ getters."""
+    price = _get_cached_price(asa_id)
+    if price is not _MISS:
+        return price
+    
+    leader, event = _begin_fetch(asa_id)
+    if not leader:
+        event.wait(_inflight_timeout)
+        price = _get_cached_price(asa_id)
+        return None if price is _MISS else price
+    
+    try:
+        price = _record_fetch(asa_id, get_vestige_price(asa_id))
+    finally:
+        _end_fetch(asa_id, event)
+    
+    return price
+
+
+async def _get_meld_price_async(asa_id: int) -> Optional[float]:
     """
-    cache_key = 'meld_silver'
+    Async counterpart of _get_meld_price.
     
-    # Check cache
-    if cache_key in _meld_price_cache:
-        price, timestamp = _meld_price_cache[cache_key]
-        if datetime.now() - timestamp < _cache_ttl:
-            return price
+    The fetch itself is get_vestige_price on the default executor, so it
+    reuses the pooled _http connections rather than a per-loop client.
+    """
+    price = _get_cached_price(asa_id)
+    if price is not _MISS:
+        return price
     
-    price = get_vestige_price(MELD_SILVER_ASA)
+    loop = asyncio.get_running_loop()
+    leader, event = _begin_fetch(asa_id)
+    if not leader:
+        await loop.run_in_executor(None, event.wait, _inflight_timeout)
+        price = _get_cached_price(asa_id)
+        return None if price is _MISS else price
     
-    if price is not None:
-        _meld_price_cache[cache_key] = (price, datetime.now())
+    try:
+        price = _record_fetch(
+            asa_id, await loop.run_in_executor(None, get_vestige_price, asa_id)
+        )
+    finally:
+        _end_fetch(asa_id, event)
     
     return price
 
 
+async def _get_meld_prices_async(asa_ids: List[int]) -> Dict[int, float]:
+    """Look up several ASAs at once; misses are fetched concurrently."""
+    prices = await asyncio.gather(*(_get_meld_price_async(a) for a in asa_ids))
+    return {asa_id: price for asa_id, price in zip(asa_ids, prices) if price is not None}
+
+
+def _run_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    asyncio.run() refuses to start inside a running event loop, so a caller
+    that is itself on a loop gets the coroutine run on a worker thread with
+    its own loop instead. Either way the call blocks until the result is in.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def get_vestige_prices_batch(asa_ids: List[int]) -> Dict[int, float]:
+    """
+    Fetch USD prices for several ASAs in one round trip.
+    
+    Vestige's free API has no multi-asset price endpoint, so the per-asset
+    requests are issued concurrently on the pooled client instead of one
+    after another. Fresh cached prices are returned without a request.
+    Safe to call from inside a running event loop.
+    
+    Args:
+        asa_ids: Algorand Standard Asset IDs
+        
+    Returns:
+        Dict of ASA ID to USD price; unavailable assets are omitted
+    """
+    return _run_sync(_get_meld_prices_async(asa_ids))
+
+
+def get_meld_gold_price() -> Optional[float]:
+    """
+    Get current Meld GOLD$ price (USD per gram).
+    
+    Returns:
+        USD price per GOLD$ token (1 gram), or None if unavailable
+    """
+    return _get_meld_price(MELD_GOLD_ASA)
+
+
+def get_meld_silver_price() -> Optional[float]:
+    """
+    Get current Meld SILVER$ price (USD per gram).
+    
+    Returns:
+        USD price per SILVER$ token (1 gram), or None if unavailable
+    """
+    return _get_meld_price(MELD_SILVER_ASA)
+
+
 def get_meld_prices() -> dict:
     """
     Get both Meld Gold and Silver prices.
@@ -99,9 +411,10 @@ def get_meld_prices() -> dict:
     Returns:
         Dict with 'gold' and 'silver' prices in USD per gram
     """
+    prices = get_vestige_prices_batch([MELD_GOLD_ASA, MELD_SILVER_ASA])
     return {
-        'gold': get_meld_gold_price(),
-        'silver': get_meld_silver_price()
+        'gold': prices.get(MELD_GOLD_ASA),
+        'silver': prices.get(MELD_SILVER_ASA)
     }
 
 
@@ -115,7 +428,16 @@ def calculate_implied_price_per_gram(spot_price_per_oz: float) -> float:
     Returns:
         Price in USD per gram
     """
-    return spot_price_per_oz / GRAMS_PER_TROY_OZ
+    return spot_price_per_oz * _INV_GRAMS_PER_TROY_OZ
+
+
+def _signal_for(premium_pct: float) -> str:
+    """Map a premium % onto its trading signal."""
+    index = (
+        bisect.bisect_right(_DISCOUNT_THRESHOLDS, premium_pct)
+        + bisect.bisect_left(_PREMIUM_THRESHOLDS, premium_pct)
+    )
+    return _SIGNALS[index]
 
 
 def calculate_arbitrage(
@@ -147,21 +469,8 @@ def calculate_arbitrage(
     premium_pct = (premium_usd / implied_per_gram) * 100
     
     # Determine signal based on premium
-    if premium_pct > 10:
-        signal = 'STRONG_SELL'
-        signal_strength = min(100, premium_pct * 5)
-    elif premium_pct > 5:
-        signal = 'SELL'
-        signal_strength = premium_pct * 5
-    elif premium_pct < -10:
-        signal = 'STRONG_BUY'
-        signal_strength = min(100, abs(premium_pct) * 5)
-    elif premium_pct < -5:
-        signal = 'BUY'
-        signal_strength = abs(premium_pct) * 5
-    else:
-        signal = 'HOLD'
-        signal_strength = 0
+    signal = _signal_for(premium_pct)
+    signal_strength = 0 if signal == 'HOLD' else min(100, abs(premium_pct) * 5)
     
     return {
         'implied_per_gram': round(implied_per_gram, 4),
@@ -172,6 +481,67 @@ def calculate_arbitrage(
     }
 
 
+def calculate_arbitrage_array(spot_per_oz, meld_prices) -> dict:
+    """
+    Calculate arbitrage for many (spot, Meld) price pairs at once.
+    
+    Batch counterpart of calculate_arbitrage for backtests over historical
+    series. Uses the same signal thresholds but leaves values unrounded.
+    
+    Args:
+        spot_per_oz: Sequence of spot prices in USD per troy ounce
+        meld_prices: Sequence of Meld token prices in USD per gram
+        
+    Returns:
+        Dict of equal-length columns keyed like calculate_arbitrage:
+        NumPy arrays when NumPy is installed, lists otherwise
+    """
+    if not HAS_NUMPY:
+        rows = [
+            _arbitrage_row(spot, meld) for spot, meld in zip(spot_per_oz, meld_prices)
+        ]
+        keys = ('implied_per_gram', 'premium_pct', 'premium_usd', 'signal', 'signal_strength')
+        return {key: [row[i] for row in rows] for i, key in enumerate(keys)}
+    
+    spot = np.asarray(spot_per_oz, dtype=float)
+    meld = np.asarray(meld_prices, dtype=float)
+    implied = spot * _INV_GRAMS_PER_TROY_OZ
+    valid = implied > 0
+    
+    premium_usd = np.where(valid, meld - implied, 0.0)
+    premium_pct = np.divide(
+        premium_usd * 100, implied, out=np.zeros_like(implied), where=valid
+    )
+    signal = np.select(
+        [~valid, premium_pct > 10, premium_pct > 5, premium_pct < -10, premium_pct < -5],
+        ['ERROR', 'STRONG_SELL', 'SELL', 'STRONG_BUY', 'BUY'],
+        default='HOLD',
+    )
+    active = valid & (np.abs(premium_pct) > 5)
+    signal_strength = np.where(active, np.minimum(np.abs(premium_pct) * 5, 100), 0.0)
+    
+    return {
+        'implied_per_gram': np.where(valid, implied, 0.0),
+        'premium_pct': premium_pct,
+        'premium_usd': premium_usd,
+        'signal': signal,
+        'signal_strength': signal_strength,
+    }
+
+
+def _arbitrage_row(spot_per_oz: float, meld_price: float) -> tuple:
+    """Unrounded calculate_arbitrage values for one pair, used without NumPy."""
+    implied = spot_per_oz * _INV_GRAMS_PER_TROY_OZ
+    if implied <= 0:
+        return 0.0, 0.0, 0.0, 'ERROR', 0.0
+    
+    premium_usd = meld_price - implied
+    premium_pct = premium_usd * 100 / implied
+    signal = _signal_for(premium_pct)
+    signal_strength = 0.0 if signal == 'HOLD' else min(100.0, abs(premium_pct) * 5)
+    return implied, premium_pct, premium_usd, signal, signal_strength
+
+
 # ============================================================================
 # Full Arbitrage Analysis Function
 # ============================================================================
@@ -181,6 +551,23 @@ def get_meld_arbitrage_analysis() -> dict:
     Get complete arbitrage analysis for Meld Gold and Silver.
     
     Compares Meld on-chain prices to Yahoo Finance spot prices.
+    Blocking wrapper around get_meld_arbitrage_analysis_async. It is safe
+    to call from a running event loop, but async callers should await
+    the coroutine instead so the loop isn't blocked.
+    
+    Returns:
+        Complete analysis with spot prices, Meld prices, and arbitrage signals
+    """
+    return _run_sync(get_meld_arbitrage_analysis_async())
+
+
+async def get_meld_arbitrage_analysis_async() -> dict:
+    """
+    Get complete arbitrage analysis for Meld Gold and Silver.
+    
+    The two Vestige lookups and the two spot lookups are independent, so
+    all four run concurrently and the call takes about as long as the
+    slowest one instead of the sum of all four.
     
     Returns:
         Complete analysis with spot prices, Meld prices, and arbitrage signals
@@ -189,13 +576,15 @@ def get_meld_arbitrage_analysis() -> dict:
     # These should already exist in your pricing.py
     from core.pricing import get_gold_price_per_oz, get_silver_price_per_oz
     
-    # Get spot prices
-    spot_gold = get_gold_price_per_oz()
-    spot_silver = get_silver_price_per_oz()
-    
-    # Get Meld prices
-    meld_gold = get_meld_gold_price()
-    meld_silver = get_meld_silver_price()
+    loop = asyncio.get_running_loop()
+    meld, spot_gold, spot_silver = await asyncio.gather(
+        _get_meld_prices_async([MELD_GOLD_ASA, MELD_SILVER_ASA]),
+        # Spot helpers are blocking; run them on the default executor
+        loop.run_in_executor(None, get_gold_price_per_oz),
+        loop.run_in_executor(None, get_silver_price_per_oz),
+    )
+    meld_gold = meld.get(MELD_GOLD_ASA)
+    meld_silver = meld.get(MELD_SILVER_ASA)
     
     # Build response
     result = {
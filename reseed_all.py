@@ -5,66 +5,84 @@ Run this script to apply the latest seed data changes.
 """
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-def main():
-    print("=" * 60)
-    print("RESEEDING ALL PRECIOUS METALS DATABASES")
-    print("=" * 60)
 
-    # 1. Reseed Inflation Data
-    print("\n[1/4] Reseeding Inflation Data...")
-    try:
-        from core.inflation_data import get_inflation_db
-        db = get_inflation_db()
-        count = db.reseed()
-        print(f"    Success! Reseeded {count} inflation data points")
-
-        # Verify the fix
-        latest = db.get_latest_data()
-        if latest:
-            print(f"    Latest date: {latest.date}")
-            print(f"    Gold price: ${latest.gold_price:,.2f}/oz")
-            print(f"    Silver price: ${latest.silver_price:.2f}/oz")
-    except Exception as e:
-        print(f"    ERROR: {e}")
+def reseed_inflation() -> list:
+    from core.inflation_data import get_inflation_db
+    db = get_inflation_db()
+    count = db.reseed()
+    lines = [f"    Success! Reseeded {count} inflation data points"]
 
-    # 2. Reseed Central Bank Gold
-    print("\n[2/4] Reseeding Central Bank Gold Data...")
-    try:
-        from core.central_bank_gold import get_cb_gold_db
-        db = get_cb_gold_db()
-        count = db.reseed()
-        print(f"    Success! Reseeded {count} central bank holdings records")
-    except Exception as e:
-        print(f"    ERROR: {e}")
+    # Verify the fix
+    latest = db.get_latest_data()
+    if latest:
+        lines.append(f"    Latest date: {latest.date}")
+        lines.append(f"    Gold price: ${latest.gold_price:,.2f}/oz")
+        lines.append(f"    Silver price: ${latest.silver_price:.2f}/oz")
+    return lines
+
+
+def reseed_central_bank_gold() -> list:
+    from core.central_bank_gold import get_cb_gold_db
+    db = get_cb_gold_db()
+    count = db.reseed()
+    return [f"    Success! Reseeded {count} central bank holdings records"]
+
+
+def reseed_earnings_calendar() -> list:
+    from core.earnings_calendar import get_earnings_db
+    db = get_earnings_db()
+    count = db.reseed()
+    return [f"    Success! Reseeded {count} earnings events"]
 
-    # 3. Reseed Earnings Calendar
-    print("\n[3/4] Reseeding Earnings Calendar...")
-    try:
-        from core.earnings_calendar import get_earnings_db
-        db = get_earnings_db()
-        count = db.reseed()
-        print(f"    Success! Reseeded {count} earnings events")
-    except Exception as e:
-        print(f"    ERROR: {e}")
 
-    # 4. Reseed Premium Tracker
-    print("\n[4/4] Reseeding Premium Tracker...")
+def reseed_premium_tracker() -> list:
+    from core.premium_tracker import get_premium_db
+    db = get_premium_db()
+    count = db.reseed()
+    lines = [f"    Success! Reseeded {count} premium price entries"]
+
+    # Verify spot prices
+    summary = db.get_summary_stats()
+    lines.append(f"    Gold spot: ${summary.get('spot_prices', {}).get('gold', 'N/A')}")
+    lines.append(f"    Silver spot: ${summary.get('spot_prices', {}).get('silver', 'N/A')}")
+    return lines
+
+
+# Each stage writes its own database, so they can run side by side
+STAGES = [
+    ("Inflation Data", reseed_inflation),
+    ("Central Bank Gold Data", reseed_central_bank_gold),
+    ("Earnings Calendar", reseed_earnings_calendar),
+    ("Premium Tracker", reseed_premium_tracker),
+]
+
+
+def run_stage(stage) -> list:
+    """Run one reseed stage, turning a failure into an error line."""
     try:
-        from core.premium_tracker import get_premium_db
-        db = get_premium_db()
-        count = db.reseed()
-        print(f"    Success! Reseeded {count} premium price entries")
-
-        # Verify spot prices
-        summary = db.get_summary_stats()
-        print(f"    Gold spot: ${summary.get('spot_prices', {}).get('gold', 'N/A')}")
-        print(f"    Silver spot: ${summary.get('spot_prices', {}).get('silver', 'N/A')}")
+        return stage()
     except Exception as e:
-        print(f"    ERROR: {e}")
+        return [f"    ERROR: {e}"]
+
+
+def main():
+    print("=" * 60)
+    print("RESEEDING ALL PRECIOUS METALS DATABASES")
+    print("=" * 60)
+
+    with ThreadPoolExecutor(max_workers=len(STAGES)) as pool:
+        results = pool.map(run_stage, [stage for _, stage in STAGES])
+
+        # Report in stage order, each as soon as it and its predecessors finish
+        for i, ((name, _), lines) in enumerate(zip(STAGES, results), start=1):
+            print(f"\n[{i}/{len(STAGES)}] Reseeding {name}...")
+            for line in lines:
+                print(line)
 
     print("\n" + "=" * 60)
     print("RESEED COMPLETE!")
@@ -1,12 +1,14 @@
 import sys
 import requests
-import sys
-import requests
 # When running as a script from root with python -m scripts.cli, this import works
 # if the root directory is in PYTHONPATH. 
 # We'll assume the user runs it as `python -m scripts.cli` from the root.
 from core.analyzer import AlgorandSovereigntyAnalyzer
 
+# A healthy local node answers /health in a few milliseconds; don't let an
+# unreachable one stall startup for long before falling back
+LOCAL_NODE_PROBE_TIMEOUT = 0.5
+
 def main():
     # Check if address provided
     if len(sys.argv) < 2:
@@ -23,7 +25,11 @@ def main():
     
     # Quick test if local node is accessible
     try:
-        test = requests.get(f"{analyzer.algod_address}/health", headers=analyzer.headers, timeout=2)
+        test = requests.get(
+            f"{analyzer.algod_address}/health",
+            headers=analyzer.headers,
+            timeout=LOCAL_NODE_PROBE_TIMEOUT,
+        )
         if test.status_code != 200:
             raise Exception("Local node not responding")
         print("✅ Connected to local node\n")
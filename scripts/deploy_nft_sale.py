@@ -16,25 +16,27 @@ Environment:
   ALGO_MNEMONIC: 25-word mnemonic phrase for the deployer account
 """
 
+from __future__ import annotations
+
 import argparse
 import base64
+import copy
+import hashlib
 import json
 import os
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-try:
-    from algosdk import account, mnemonic, transaction
+# algosdk, pyteal and dotenv are imported where they are used, so --help
+# answers without loading them and --dry-run never loads pyteal
+if TYPE_CHECKING:
+    from algosdk import transaction
     from algosdk.v2client import algod
-except ImportError:
-    print("Error: py-algorand-sdk not installed. Run: pip install py-algorand-sdk")
-    sys.exit(1)
 
 # Add contracts to path for importing
 sys.path.insert(0, str(Path(__file__).parent.parent / "contracts"))
@@ -61,15 +63,26 @@ PICKAXE_ASAS = {
 # Output file path
 OUTPUT_FILE = Path(__file__).parent.parent / "data" / "nfts" / "deployed_contract.json"
 
+# Compiled bytecode keyed by sha256 of the TEAL source. The source pins
+# its TEAL version, so the bytecode doesn't depend on which node compiled it
+_bytecode_cache: dict[bytes, bytes] = {}
+
+# Bytecode persisted across runs as <sha256 of TEAL source>.bin
+TEAL_CACHE_DIR = Path(__file__).parent.parent / "data" / ".teal_cache"
+
 
 def get_algod_client(network: str) -> algod.AlgodClient:
     """Create an Algod client for the specified network."""
+    from algosdk.v2client import algod
+
     config = NETWORKS[network]
     return algod.AlgodClient(config["algod_token"], config["algod_url"])
 
 
 def get_deployer_account() -> tuple[str, str]:
     """Load deployer account from environment variable."""
+    from algosdk import account, mnemonic
+
     mnemonic_phrase = os.environ.get("ALGO_MNEMONIC")
     if not mnemonic_phrase:
         print("Error: ALGO_MNEMONIC environment variable not set")
@@ -85,8 +98,9 @@ def get_deployer_account() -> tuple[str, str]:
         sys.exit(1)
 
 
+@cache
 def compile_contract() -> tuple[str, str]:
-    """Compile the PyTeal contract and return approval/clear TEAL."""
+    """Compile the PyTeal contract and return approval/clear TEAL (memoized)."""
     try:
         from nft_sale import approval_program, clear_program
         from pyteal import Mode, compileTeal
@@ -102,9 +116,31 @@ def compile_contract() -> tuple[str, str]:
 
 
 def compile_teal(client: algod.AlgodClient, teal_source: str) -> bytes:
-    """Compile TEAL source to bytecode."""
-    response = client.compile(teal_source)
-    return base64.b64decode(response["result"])
+    """Compile TEAL source to bytecode, reusing earlier results for the same source."""
+    digest = hashlib.sha256(teal_source.encode()).digest()
+    if digest in _bytecode_cache:
+        return _bytecode_cache[digest]
+
+    cache_file = TEAL_CACHE_DIR / f"{digest.hex()}.bin"
+    if cache_file.exists():
+        bytecode = cache_file.read_bytes()
+    else:
+        response = client.compile(teal_source)
+        bytecode = base64.b64decode(response["result"])
+        TEAL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename, so an interrupted run never
+        # leaves a truncated .bin for a later deploy to ship
+        fd, tmp_path = tempfile.mkstemp(dir=TEAL_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(bytecode)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    _bytecode_cache[digest] = bytecode
+    return bytecode
 
 
 def deploy_contract(
@@ -114,6 +150,8 @@ def deploy_contract(
     network: str,
 ) -> dict:
     """Deploy the NFT sale contract."""
+    from algosdk import transaction
+
     print("\n" + "=" * 50)
     print("  DEPLOYING NFT SALE CONTRACT")
     print("=" * 50)
@@ -126,13 +164,16 @@ def deploy_contract(
     print(f"Approval program: {len(approval_teal)} bytes")
     print(f"Clear program: {len(clear_teal)} bytes")
 
-    # Compile to bytecode
+    # Compile to bytecode and get suggested params; the three algod calls
+    # are independent, so overlap them
     print("Compiling to bytecode...")
-    approval_program = compile_teal(client, approval_teal)
-    clear_program = compile_teal(client, clear_teal)
-
-    # Get suggested params
-    params = client.suggested_params()
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        approval_future = pool.submit(compile_teal, client, approval_teal)
+        clear_future = pool.submit(compile_teal, client, clear_teal)
+        params_future = pool.submit(client.suggested_params)
+        approval_program = approval_future.result()
+        clear_program = clear_future.result()
+        params = params_future.result()
 
     # Create application
     print("Creating application...")
@@ -186,88 +227,87 @@ def deploy_contract(
         sys.exit(1)
 
 
-def fund_contract(
-    client: algod.AlgodClient,
-    private_key: str,
+def fund_contract_txn(
+    params: transaction.SuggestedParams,
     sender_address: str,
     app_address: str,
     amount_algo: float = 1.0,
-) -> str:
-    """Fund the contract with ALGO for minimum balance and fees."""
-    print(f"\nFunding contract with {amount_algo} ALGO...")
+) -> transaction.PaymentTxn:
+    """Build the payment funding the contract with ALGO for minimum balance and fees."""
+    from algosdk import transaction
 
-    params = client.suggested_params()
-    txn = transaction.PaymentTxn(
+    print(f"Funding contract with {amount_algo} ALGO...")
+    return transaction.PaymentTxn(
         sender=sender_address,
         sp=params,
         receiver=app_address,
         amt=int(amount_algo * 1_000_000),
     )
 
-    signed_txn = txn.sign(private_key)
-    txid = client.send_transaction(signed_txn)
-    transaction.wait_for_confirmation(client, txid, 4)
-
-    print(f"✅ Funded contract: {txid}")
-    return txid
-
 
-def opt_contract_into_asa(
-    client: algod.AlgodClient,
-    private_key: str,
+def opt_in_asa_txn(
+    params: transaction.SuggestedParams,
     sender_address: str,
     app_id: int,
-    asa_id: int,
-) -> str:
-    """Call the contract to opt into an ASA."""
-    print(f"Opting contract into ASA {asa_id}...")
-
-    params = client.suggested_params()
-    # Cover fee for outer tx + inner tx (contract opt-in)
-    params.fee = 2000
+    asa_ids: list[int],
+) -> transaction.ApplicationNoOpTxn:
+    """Build a single contract call asking the contract to opt into every ASA."""
+    from algosdk import transaction
+
+    print(f"Opting contract into ASAs {asa_ids}...")
+
+    # Cover fee for outer tx + one inner tx (contract opt-in) per ASA
+    params = copy.copy(params)
+    params.fee = 1000 * (1 + len(asa_ids))
     params.flat_fee = True
-    txn = transaction.ApplicationNoOpTxn(
+    return transaction.ApplicationNoOpTxn(
         sender=sender_address,
         sp=params,
         index=app_id,
-        app_args=[b"opt_in_asa"],
-        foreign_assets=[asa_id],
+        app_args=[b"opt_in_all"],
+        foreign_assets=asa_ids,
     )
 
-    signed_txn = txn.sign(private_key)
-    txid = client.send_transaction(signed_txn)
-    transaction.wait_for_confirmation(client, txid, 4)
 
-    print(f"✅ Opted into ASA {asa_id}: {txid}")
-    return txid
+def transfer_nft_txns(
+    params: transaction.SuggestedParams,
+    sender_address: str,
+    app_address: str,
+    transfers: list[tuple[int, int]],
+) -> list[transaction.AssetTransferTxn]:
+    """Build one NFT transfer to the contract per (asa_id, amount)."""
+    from algosdk import transaction
+
+    txns = []
+    for asa_id, amount in transfers:
+        print(f"Transferring {amount} NFTs (ASA {asa_id}) to contract...")
+        txns.append(
+            transaction.AssetTransferTxn(
+                sender=sender_address,
+                sp=params,
+                receiver=app_address,
+                amt=amount,
+                index=asa_id,
+            )
+        )
+    return txns
 
 
-def transfer_nfts_to_contract(
+def send_group(
     client: algod.AlgodClient,
     private_key: str,
-    sender_address: str,
-    app_address: str,
-    asa_id: int,
-    amount: int,
-) -> str:
-    """Transfer NFTs to the contract for sale."""
-    print(f"Transferring {amount} NFTs (ASA {asa_id}) to contract...")
-
-    params = client.suggested_params()
-    txn = transaction.AssetTransferTxn(
-        sender=sender_address,
-        sp=params,
-        receiver=app_address,
-        amt=amount,
-        index=asa_id,
-    )
-
-    signed_txn = txn.sign(private_key)
-    txid = client.send_transaction(signed_txn)
-    transaction.wait_for_confirmation(client, txid, 4)
+    txns: list,
+) -> list[str]:
+    """Sign and submit transactions as one atomic group; wait for a single confirmation."""
+    from algosdk import transaction
 
-    print(f"✅ Transferred {amount} NFTs: {txid}")
-    return txid
+    txns = transaction.assign_group_id(txns)
+    signed_txns = [txn.sign(private_key) for txn in txns]
+    client.send_transactions(signed_txns)
+    txids = [txn.get_txid() for txn in txns]
+    # All transactions in a group are confirmed in the same round
+    transaction.wait_for_confirmation(client, txids[0], 4)
+    return txids
 
 
 def save_deployment_info(info: dict) -> None:
@@ -321,6 +361,17 @@ Environment Variables:
     )
 
     args = parser.parse_args()
+
+    try:
+        import algosdk  # noqa: F401
+    except ImportError:
+        print("Error: py-algorand-sdk not installed. Run: pip install py-algorand-sdk")
+        sys.exit(1)
+
+    # Load environment variables from .env file
+    from dotenv import load_dotenv
+    load_dotenv()
+
     network = "testnet" if args.testnet else "mainnet"
 
     print("\n" + "=" * 60)
@@ -368,38 +419,44 @@ Environment Variables:
     # Deploy contract
     deployment_info = deploy_contract(client, private_key, deployer_address, network)
 
-    # Fund contract (needed for minimum balance when holding ASAs)
+    # Fund, opt in, and transfer as one atomic group. Group members apply in
+    # order, so the opt-in sees the funding and the transfers see the opt-in,
+    # and the whole setup costs a single confirmation wait.
     if args.opt_in or args.fund_nfts:
+        print("\n" + "-" * 40)
+        print("Setting up contract holdings...")
+        params = client.suggested_params()
+        asa_ids = list(PICKAXE_ASAS.values())
+
         # Need ~0.5 ALGO for 3 ASA opt-ins + some extra for fees
-        fund_contract(client, private_key, deployer_address, deployment_info["app_address"], 1.0)
+        txns = [fund_contract_txn(params, deployer_address, deployment_info["app_address"], 1.0)]
+        txns.append(opt_in_asa_txn(params, deployer_address, deployment_info["app_id"], asa_ids))
 
-    # Opt into ASAs
-    if args.opt_in or args.fund_nfts:
-        print("\n" + "-" * 40)
-        print("Opting contract into pickaxe ASAs...")
-        for name, asa_id in PICKAXE_ASAS.items():
-            opt_contract_into_asa(
-                client, private_key, deployer_address, deployment_info["app_id"], asa_id
+        pending = []
+        if args.fund_nfts:
+            pending = [
+                (name, asa_id, amount)
+                for (name, asa_id), amount in zip(PICKAXE_ASAS.items(), nft_amounts)
+                if amount > 0
+            ]
+            txns += transfer_nft_txns(
+                params,
+                deployer_address,
+                deployment_info["app_address"],
+                [(asa_id, amount) for _, asa_id, amount in pending],
             )
-        deployment_info["opted_into_asas"] = list(PICKAXE_ASAS.values())
 
-    # Transfer NFTs
-    if args.fund_nfts:
-        print("\n" + "-" * 40)
-        print("Transferring NFTs to contract...")
-        transfers = {}
-        for (name, asa_id), amount in zip(PICKAXE_ASAS.items(), nft_amounts):
-            if amount > 0:
-                txid = transfer_nfts_to_contract(
-                    client,
-                    private_key,
-                    deployer_address,
-                    deployment_info["app_address"],
-                    asa_id,
-                    amount,
-                )
+        txids = send_group(client, private_key, txns)
+        print(f"✅ Funded contract: {txids[0]}")
+        print(f"✅ Opted into ASAs {asa_ids}: {txids[1]}")
+        deployment_info["opted_into_asas"] = asa_ids
+
+        if args.fund_nfts:
+            transfers = {}
+            for (name, asa_id, amount), txid in zip(pending, txids[2:]):
+                print(f"✅ Transferred {amount} NFTs: {txid}")
                 transfers[name] = {"asa_id": asa_id, "amount": amount, "txid": txid}
-        deployment_info["nft_transfers"] = transfers
+            deployment_info["nft_transfers"] = transfers
 
     # Save deployment info
     save_deployment_info(deployment_info)
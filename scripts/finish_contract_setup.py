@@ -5,15 +5,20 @@ Opts into ASAs and transfers NFTs.
 """
 
 import os
-from dotenv import load_dotenv
+from copy import copy
 from algosdk import account, mnemonic
+from algosdk.logic import get_application_address
 from algosdk.v2client import algod
-from algosdk.transaction import ApplicationNoOpTxn, AssetTransferTxn, wait_for_confirmation
-
-load_dotenv()
+from algosdk.transaction import (
+    ApplicationNoOpTxn,
+    AssetTransferTxn,
+    assign_group_id,
+    wait_for_confirmation,
+)
 
 # Configuration
 APP_ID = 3381223080
+APP_ADDRESS = get_application_address(APP_ID)
 ALGOD_ADDRESS = "https://mainnet-api.algonode.cloud"
 ALGOD_TOKEN = ""
 
@@ -31,12 +36,21 @@ NFT_AMOUNTS = {
     "bitcoin": 10
 }
 
-def get_app_address(app_id: int) -> str:
-    """Get the address for an application."""
-    from algosdk.logic import get_application_address
-    return get_application_address(app_id)
+def send_group(client, private_key, txns):
+    """Sign and send txns as one atomic group and wait for it to confirm."""
+    txns = assign_group_id(txns)
+    signed_txns = [txn.sign(private_key) for txn in txns]
+    client.send_transactions(signed_txns)
+    txid = txns[0].get_txid()
+    print(f"\n  Group transaction: {txid}")
+    wait_for_confirmation(client, txid, 4)
+
 
 def main():
+    # Load environment variables from .env file
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     # Load mnemonic
     mnemonic_phrase = os.getenv("ALGO_MNEMONIC")
     if not mnemonic_phrase:
@@ -49,14 +63,12 @@ def main():
     # Initialize client
     client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_ADDRESS)
     
-    app_address = get_app_address(APP_ID)
-    
     print(f"""
 ==========================================
   FINISH CONTRACT SETUP
 ==========================================
 App ID: {APP_ID}
-App Address: {app_address}
+App Address: {APP_ADDRESS}
 Deployer: {deployer_address}
 """)
     
@@ -65,69 +77,61 @@ Deployer: {deployer_address}
     balance = account_info.get("amount", 0) / 1_000_000
     print(f"Deployer balance: {balance:.6f} ALGO")
     
-    # Step 1: Opt contract into each ASA
+    params = client.suggested_params()
+    opt_in_params = copy(params)
+    opt_in_params.fee = 2000  # Cover outer + inner tx
+    opt_in_params.flat_fee = True
+    
+    # Step 1: Opt contract into each ASA it doesn't hold yet
+    # (the deployed app predates opt_in_all, so use one opt_in_asa call per ASA)
     print("\n--- Opting contract into ASAs ---")
     
+    held = {a["asset-id"] for a in client.account_info(APP_ADDRESS).get("assets", [])}
+    txns = []
     for name, asa_id in PICKAXE_ASAS.items():
-        print(f"\nOpting into {name} pickaxe (ASA {asa_id})...")
-        
+        if asa_id in held:
+            print(f"  ⚠️ Already opted in to {name}")
+            continue
+        print(f"Opting into {name} pickaxe (ASA {asa_id})...")
+        txns.append(ApplicationNoOpTxn(
+            sender=deployer_address,
+            sp=opt_in_params,
+            index=APP_ID,
+            app_args=[b"opt_in_asa"],
+            foreign_assets=[asa_id]
+        ))
+    
+    if txns:
         try:
-            params = client.suggested_params()
-            params.fee = 2000  # Cover outer + inner tx
-            params.flat_fee = True
-            
-            txn = ApplicationNoOpTxn(
-                sender=deployer_address,
-                sp=params,
-                index=APP_ID,
-                app_args=[b"opt_in_asa"],
-                foreign_assets=[asa_id]
-            )
-            
-            signed_txn = txn.sign(private_key)
-            txid = client.send_transaction(signed_txn)
-            print(f"  Transaction: {txid}")
-            
-            wait_for_confirmation(client, txid, 4)
-            print(f"  ✅ Opted into {name} pickaxe!")
-            
+            send_group(client, private_key, txns)
+            print(f"  ✅ Opted into {len(txns)} pickaxes!")
         except Exception as e:
-            if "already opted in" in str(e).lower():
-                print(f"  ⚠️ Already opted in to {name}")
-            else:
-                print(f"  ❌ Error: {e}")
+            print(f"  ❌ Error: {e}")
     
-    # Step 2: Transfer NFTs to contract
+    # Step 2: Transfer NFTs to contract, as one atomic group
     print("\n--- Transferring NFTs to contract ---")
     
+    txns = []
     for name, asa_id in PICKAXE_ASAS.items():
         amount = NFT_AMOUNTS[name]
-        print(f"\nTransferring {amount} {name} pickaxes...")
-        
-        try:
-            params = client.suggested_params()
-            
-            txn = AssetTransferTxn(
-                sender=deployer_address,
-                sp=params,
-                receiver=app_address,
-                amt=amount,
-                index=asa_id
-            )
-            
-            signed_txn = txn.sign(private_key)
-            txid = client.send_transaction(signed_txn)
-            print(f"  Transaction: {txid}")
-            
-            wait_for_confirmation(client, txid, 4)
-            print(f"  ✅ Transferred {amount} {name} pickaxes!")
-            
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
+        print(f"Transferring {amount} {name} pickaxes...")
+        txns.append(AssetTransferTxn(
+            sender=deployer_address,
+            sp=params,
+            receiver=APP_ADDRESS,
+            amt=amount,
+            index=asa_id
+        ))
+    
+    try:
+        send_group(client, private_key, txns)
+        print("  ✅ Transferred NFTs!")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
     
     # Verify final state
     print("\n--- Verification ---")
-    app_info = client.account_info(app_address)
+    app_info = client.account_info(APP_ADDRESS)
     
     print(f"\nContract holdings:")
     for asset in app_info.get("assets", []):
@@ -13,17 +13,19 @@ Environment:
   ALGO_MNEMONIC: 25-word mnemonic phrase for the creator account
 """
 
-import argparse
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
+# orjson is optional; stdlib json is used when it isn't installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 try:
     from algosdk import account, mnemonic, transaction
@@ -110,14 +112,13 @@ def check_balance(client: algod.AlgodClient, address: str) -> int:
         sys.exit(1)
 
 
-def mint_pickaxe_nft(
-    client: algod.AlgodClient,
-    private_key: str,
+def build_mint_txn(
+    params: transaction.SuggestedParams,
     creator_address: str,
     pickaxe_type: str,
     network: str,
-) -> dict:
-    """Mint a single pickaxe NFT and return the result."""
+) -> transaction.AssetConfigTxn:
+    """Build the asset creation transaction for one pickaxe NFT."""
     nft = PICKAXE_NFTS[pickaxe_type]
 
     print(f"\n{'='*50}")
@@ -127,11 +128,7 @@ def mint_pickaxe_nft(
     print(f"Unit: {nft['unit_name']}")
     print(f"{'='*50}")
 
-    # Get suggested parameters
-    params = client.suggested_params()
-
-    # Create the asset creation transaction
-    txn = transaction.AssetConfigTxn(
+    return transaction.AssetConfigTxn(
         sender=creator_address,
         sp=params,
         total=nft["total"],
@@ -146,26 +143,70 @@ def mint_pickaxe_nft(
         clawback=creator_address,
     )
 
+
+def mint_pickaxe_nfts(
+    client: algod.AlgodClient,
+    private_key: str,
+    creator_address: str,
+    pickaxe_types: list[str],
+    network: str,
+) -> dict:
+    """
+    Mint pickaxe NFTs in one atomic group and return the result per type.
+
+    One submission and one confirmation wait cover every type, and either
+    all of them are created or none are.
+    """
+    # Get suggested parameters
+    params = client.suggested_params()
+
+    txns = [
+        build_mint_txn(params, creator_address, pickaxe_type, network)
+        for pickaxe_type in pickaxe_types
+    ]
+
     # Sign and submit
-    signed_txn = txn.sign(private_key)
+    txns = transaction.assign_group_id(txns)
+    signed_txns = [txn.sign(private_key) for txn in txns]
+    txids = [txn.get_txid() for txn in txns]
 
     try:
-        txid = client.send_transaction(signed_txn)
-        print(f"Transaction ID: {txid}")
+        client.send_transactions(signed_txns)
+        for pickaxe_type, txid in zip(pickaxe_types, txids):
+            print(f"Transaction ID ({pickaxe_type}): {txid}")
         print("Waiting for confirmation...")
 
-        # Wait for confirmation
-        confirmed_txn = transaction.wait_for_confirmation(client, txid, 4)
-        asset_id = confirmed_txn.get("asset-index")
+        # All transactions in a group are confirmed in the same round
+        transaction.wait_for_confirmation(client, txids[0], 4)
 
-        print(f"✅ SUCCESS! Asset ID: {asset_id}")
+    except Exception as e:
+        print(f"❌ FAILED: {e}")
+        return {
+            pickaxe_type: {
+                "type": pickaxe_type,
+                "asset_name": PICKAXE_NFTS[pickaxe_type]["asset_name"],
+                "error": str(e),
+                "network": network,
+                "created_at": datetime.utcnow().isoformat() + "Z",
+            }
+            for pickaxe_type in pickaxe_types
+        }
+
+    explorer_base = "https://explorer.perawallet.app" if network == "mainnet" else "https://testnet.explorer.perawallet.app"
+    # Look up the new asset IDs side by side rather than one round trip at a time
+    with ThreadPoolExecutor(max_workers=len(txids)) as pool:
+        infos = list(pool.map(client.pending_transaction_info, txids))
 
-        # Build explorer URL
-        explorer_base = "https://explorer.perawallet.app" if network == "mainnet" else "https://testnet.explorer.perawallet.app"
+    results = {}
+    for pickaxe_type, txid, info in zip(pickaxe_types, txids, infos):
+        nft = PICKAXE_NFTS[pickaxe_type]
+        asset_id = info.get("asset-index")
         explorer_url = f"{explorer_base}/asset/{asset_id}"
+
+        print(f"✅ SUCCESS! {nft['asset_name']} Asset ID: {asset_id}")
         print(f"Explorer: {explorer_url}")
 
-        return {
+        results[pickaxe_type] = {
             "type": pickaxe_type,
             "asset_name": nft["asset_name"],
             "unit_name": nft["unit_name"],
@@ -177,23 +218,16 @@ def mint_pickaxe_nft(
             "metadata_url": nft["url"],
             "created_at": datetime.utcnow().isoformat() + "Z",
         }
-
-    except Exception as e:
-        print(f"❌ FAILED: {e}")
-        return {
-            "type": pickaxe_type,
-            "asset_name": nft["asset_name"],
-            "error": str(e),
-            "network": network,
-            "created_at": datetime.utcnow().isoformat() + "Z",
-        }
+    return results
 
 
 def load_existing_results() -> dict:
     """Load existing minted pickaxes results if file exists."""
     if OUTPUT_FILE.exists():
         try:
-            with open(OUTPUT_FILE, "r") as f:
+            if HAS_ORJSON:
+                return orjson.loads(OUTPUT_FILE.read_bytes())
+            with open(OUTPUT_FILE, "r", encoding="utf-8") as f:
                 return json.load(f)
         except Exception:
             pass
@@ -203,12 +237,22 @@ def load_existing_results() -> dict:
 def save_results(results: dict) -> None:
     """Save minting results to JSON file."""
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_FILE, "w") as f:
-        json.dump(results, f, indent=2)
+    if HAS_ORJSON:
+        OUTPUT_FILE.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        # Match orjson's output: UTF-8 text, non-ASCII left unescaped
+        with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
     print(f"\n📁 Results saved to: {OUTPUT_FILE}")
 
 
 def main():
+    import argparse
+    from dotenv import load_dotenv
+
+    # Load environment variables from .env file
+    load_dotenv()
+
     parser = argparse.ArgumentParser(
         description="Mint Pickaxe NFT Collections on Algorand",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -296,11 +340,9 @@ Environment Variables:
     # Load existing results and mint
     all_results = load_existing_results()
 
-    for pickaxe_type in types_to_mint:
-        result = mint_pickaxe_nft(
-            client, private_key, creator_address, pickaxe_type, network
-        )
-        all_results[network][pickaxe_type] = result
+    all_results[network].update(
+        mint_pickaxe_nfts(client, private_key, creator_address, types_to_mint, network)
+    )
 
     # Save results
     save_results(all_results)
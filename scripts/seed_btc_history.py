@@ -12,6 +12,14 @@ import sys
 import os
 import random
 from datetime import datetime, timedelta
+from itertools import accumulate, repeat
+
+# NumPy is optional; it draws the random walks in bulk when installed
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,6 +27,33 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.btc_history import BTCPriceHistory, BTCPriceSnapshot
 
 
+def _normal(std: float, size: int) -> list[float]:
+    """Draw `size` samples from N(0, std)."""
+    if HAS_NUMPY:
+        return np.random.default_rng().normal(0, std, size).tolist()
+    return [random.gauss(0, std) for _ in range(size)]
+
+
+def _spot_walk(base: float, volatility: float, size: int) -> list[float]:
+    """Multiplicative random walk starting from `base` (first step already applied)."""
+    if HAS_NUMPY:
+        changes = np.random.default_rng().normal(0, volatility, size)
+        return (base * np.cumprod(1 + changes)).tolist()
+    changes = _normal(volatility, size)
+    return list(accumulate(changes, lambda price, change: price * (1 + change), initial=base))[1:]
+
+
+def _mean_reverting_walk(mean: float, shocks: list[float], low: float, high: float) -> list[float]:
+    """Walk pulled 10% back toward `mean` each step, clamped to [low, high]."""
+    current = mean
+    walk = []
+    for shock in shocks:
+        current += (mean - current) * 0.1 + shock
+        current = max(low, min(high, current))
+        walk.append(current)
+    return walk
+
+
 def generate_seed_data(days: int = 7, points_per_day: int = 24) -> list[BTCPriceSnapshot]:
     """
     Generate realistic historical BTC price data.
@@ -30,8 +65,6 @@ def generate_seed_data(days: int = 7, points_per_day: int = 24) -> list[BTCPrice
     Returns:
         List of BTCPriceSnapshot objects
     """
-    snapshots = []
-
     # Base prices (approximate current values)
     base_spot = 94000.0
 
@@ -52,41 +85,42 @@ def generate_seed_data(days: int = 7, points_per_day: int = 24) -> list[BTCPrice
     wbtc_premium_mean = 0.2   # Average +0.2% premium
     wbtc_premium_std = 0.3    # Standard deviation
 
-    current_spot = base_spot
-    current_gobtc_premium = gobtc_premium_mean
-    current_wbtc_premium = wbtc_premium_mean
-
-    for i in range(total_points):
-        timestamp = start_time + timedelta(hours=i * interval_hours)
-
-        # Random walk for spot price
-        spot_change = random.gauss(0, spot_volatility)
-        current_spot *= (1 + spot_change)
-
-        # Mean-reverting random walk for premiums
-        gobtc_drift = (gobtc_premium_mean - current_gobtc_premium) * 0.1
-        current_gobtc_premium += gobtc_drift + random.gauss(0, gobtc_premium_std * 0.3)
-        current_gobtc_premium = max(-3.0, min(2.0, current_gobtc_premium))  # Clamp
-
-        wbtc_drift = (wbtc_premium_mean - current_wbtc_premium) * 0.1
-        current_wbtc_premium += wbtc_drift + random.gauss(0, wbtc_premium_std * 0.3)
-        current_wbtc_premium = max(-2.0, min(2.0, current_wbtc_premium))  # Clamp
-
-        # Calculate actual prices
-        gobtc_price = current_spot * (1 + current_gobtc_premium / 100)
-        wbtc_price = current_spot * (1 + current_wbtc_premium / 100)
-
-        snapshot = BTCPriceSnapshot(
+    # Random walk for spot price; mean-reverting random walks for premiums.
+    # The noise for every step is drawn up front.
+    spot_prices = _spot_walk(base_spot, spot_volatility, total_points)
+    gobtc_premiums = _mean_reverting_walk(
+        gobtc_premium_mean, _normal(gobtc_premium_std * 0.3, total_points), -3.0, 2.0
+    )
+    wbtc_premiums = _mean_reverting_walk(
+        wbtc_premium_mean, _normal(wbtc_premium_std * 0.3, total_points), -2.0, 2.0
+    )
+
+    # Evenly spaced timestamps, built by stepping one shared timedelta
+    timestamps = accumulate(
+        repeat(timedelta(hours=interval_hours), total_points - 1), initial=start_time
+    )
+
+    # Known length up front, so build the list in one pass
+    return [
+        BTCPriceSnapshot(
             timestamp=timestamp,
             spot_btc=round(current_spot, 2),
-            gobtc_price=round(gobtc_price, 2),
-            wbtc_price=round(wbtc_price, 2),
+            gobtc_price=round(current_spot * (1 + current_gobtc_premium / 100), 2),
+            wbtc_price=round(current_spot * (1 + current_wbtc_premium / 100), 2),
             gobtc_premium_pct=round(current_gobtc_premium, 2),
             wbtc_premium_pct=round(current_wbtc_premium, 2)
         )
-        snapshots.append(snapshot)
+        for timestamp, current_spot, current_gobtc_premium, current_wbtc_premium in zip(
+            timestamps, spot_prices, gobtc_premiums, wbtc_premiums
+        )
+    ]
 
-    return snapshots
+
+_INSERT_SQL = '''
+    INSERT INTO btc_price_history
+    (timestamp, spot_btc, gobtc_price, wbtc_price, gobtc_premium_pct, wbtc_premium_pct)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
 
 
 def seed_database(days: int = 7, clear_existing: bool = False):
@@ -108,23 +142,32 @@ def seed_database(days: int = 7, clear_existing: bool = False):
 
     print(f"Inserting {len(snapshots)} data points...")
 
-    # Bypass the duplicate check by inserting directly
+    # Bypass the duplicate check by inserting directly. BTCPriceHistory
+    # opens a connection per call, so there is none to reuse; open one in
+    # autocommit mode and make the whole insert a single explicit transaction.
     import sqlite3
-    with sqlite3.connect(history.db_path) as conn:
-        for snap in snapshots:
-            conn.execute('''
-                INSERT INTO btc_price_history
-                (timestamp, spot_btc, gobtc_price, wbtc_price, gobtc_premium_pct, wbtc_premium_pct)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                snap.timestamp.isoformat(),
-                snap.spot_btc,
-                snap.gobtc_price,
-                snap.wbtc_price,
-                snap.gobtc_premium_pct,
-                snap.wbtc_premium_pct
-            ))
-        conn.commit()
+    from contextlib import closing
+    rows = [
+        (
+            snap.timestamp.isoformat(),
+            snap.spot_btc,
+            snap.gobtc_price,
+            snap.wbtc_price,
+            snap.gobtc_premium_pct,
+            snap.wbtc_premium_pct
+        )
+        for snap in snapshots
+    ]
+    with closing(sqlite3.connect(history.db_path, isolation_level=None)) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(_INSERT_SQL, rows)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
 
     # Verify
     stats = history.get_stats(hours=days * 24)
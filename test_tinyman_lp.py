@@ -1,6 +1,7 @@
 import sys
 import os
 sys.path.append(os.getcwd())
+from functools import lru_cache
 
 from core.lp_parser import LPParser
 from core.pricing import get_asset_price
@@ -8,6 +9,8 @@ from core.pricing import get_asset_price
 def test_tinyman_lp():
     print("Testing Tinyman LP valuation...")
     parser = LPParser()
+    # Both pools price ALGO-family assets; look each one up only once
+    cached_price = lru_cache(maxsize=128)(get_asset_price)
     
     # Test xALGO/ALGO pool
     # Expected from Tinyman: $6,880.11
@@ -20,7 +23,7 @@ def test_tinyman_lp():
         lp_name="TinymanPool2.0 xALGO-ALGO",
         lp_amount=20563.221469,
         asset_id=1067294154,  # xALGO/ALGO LP token ID (you'll need to verify this)
-        get_price_fn=get_asset_price
+        get_price_fn=cached_price
     )
     
     if breakdown:
@@ -47,7 +50,7 @@ def test_tinyman_lp():
         lp_name="TinymanPool2.0 fUSDC-fALGO",
         lp_amount=1544.696742,
         asset_id=1067257070,  # fUSDC/fALGO LP token ID (you'll need to verify this)
-        get_price_fn=get_asset_price
+        get_price_fn=cached_price
     )
     
     if breakdown2:
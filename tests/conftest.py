@@ -0,0 +1,70 @@
+"""
+Shared pytest fixtures.
+"""
+import copy
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+from api.main import app
+from core.analyzer import AlgorandSovereigntyAnalyzer
+from core.history import HistoryManager
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path, monkeypatch):
+    """
+    Keep test runs out of the committed data files.
+
+    Snapshots go to a HistoryManager under tmp_path, and the analyzer's
+    sovereignty_analysis_*.json export, which is written to the working
+    directory, is made from inside tmp_path. Only the export changes
+    directory, since the classifier reads its CSV relative to the repo root.
+    """
+    monkeypatch.setattr("core.history._history_manager", HistoryManager(data_dir=tmp_path))
+
+    export_to_json = AlgorandSovereigntyAnalyzer.export_to_json
+
+    def export_to_tmp(self, *args, **kwargs):
+        with monkeypatch.context() as m:
+            m.chdir(tmp_path)
+            return export_to_json(self, *args, **kwargs)
+
+    monkeypatch.setattr(AlgorandSovereigntyAnalyzer, "export_to_json", export_to_tmp)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def _analyzer_proto():
+    """Analyzer built once per session with mocked node connection."""
+    with patch('core.analyzer.requests.get'):
+        return AlgorandSovereigntyAnalyzer(use_local_node=False)
+
+
+@pytest.fixture
+def analyzer(_analyzer_proto):
+    """Fresh copy of the prototype analyzer with empty state."""
+    a = copy.copy(_analyzer_proto)
+    a.last_categories = {}
+    a.last_address = ""
+    a.last_is_participating = False
+    a.last_hard_money_algo = 0.0
+    a.last_participation_info = {}
+    return a
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the session, so app startup runs once."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def make_response():
+    """Build a lightweight stand-in for a requests response returning `payload`."""
+    def _make(payload):
+        return SimpleNamespace(json=lambda: payload, raise_for_status=lambda: None)
+    return _make
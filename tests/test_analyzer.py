@@ -7,33 +7,64 @@ These tests cover:
 - Sovereignty score calculation
 """
 import pytest
-from unittest.mock import patch, MagicMock
+import requests
+from types import MappingProxyType
+from unittest.mock import patch
 from core.analyzer import AlgorandSovereigntyAnalyzer
 from core.models import AssetCategory
 
+# Read-only account payloads; tests pass a dict() copy to the analyzer
+_MOCK_ACCT_OFFLINE = MappingProxyType({
+    'amount': 100_000_000,  # 100 ALGO (microAlgos)
+    'status': 'Offline',
+    'assets': ()
+})
+_MOCK_ACCT_ONLINE = MappingProxyType({**_MOCK_ACCT_OFFLINE, 'status': 'Online'})  # Participating
+_MOCK_ACCT_EMPTY = MappingProxyType({**_MOCK_ACCT_OFFLINE, 'amount': 0})
+
+
+@pytest.fixture(autouse=True)
+def _patched_get():
+    """Patch requests.get for every test; tests set return_value/side_effect."""
+    with patch('core.analyzer.requests.get') as m:
+        yield m
+
+
+@pytest.fixture
+def algod_responses(_patched_get, make_response):
+    """
+    URL -> JSON payload (or exception to raise) served by the patched requests.get.
+
+    Requests for URLs that are not registered fail with ConnectionError.
+    """
+    responses = {}
+
+    def serve(url, *args, **kwargs):
+        if url not in responses:
+            raise requests.exceptions.ConnectionError(f"No response registered for {url}")
+        payload = responses[url]
+        if isinstance(payload, Exception):
+            raise payload
+        return make_response(payload)
+
+    _patched_get.side_effect = serve
+    return responses
+
 
 class TestAlgorandSovereigntyAnalyzer:
     """Tests for the main analyzer class."""
 
-    @pytest.fixture
-    def analyzer(self):
-        """Create analyzer instance with mocked node connection."""
-        with patch('core.analyzer.requests.get'):
-            return AlgorandSovereigntyAnalyzer(use_local_node=False)
-
     def test_initialization_public_node(self):
         """Analyzer should initialize with AlgoNode public API."""
-        with patch('core.analyzer.requests.get'):
-            analyzer = AlgorandSovereigntyAnalyzer(use_local_node=False)
-            assert "algonode.cloud" in analyzer.algod_address
-            assert analyzer.algod_token == ""
+        analyzer = AlgorandSovereigntyAnalyzer(use_local_node=False)
+        assert "algonode.cloud" in analyzer.algod_address
+        assert analyzer.algod_token == ""
 
     def test_initialization_local_node(self):
         """Analyzer should initialize with local node settings."""
-        with patch('core.analyzer.requests.get'):
-            analyzer = AlgorandSovereigntyAnalyzer(use_local_node=True)
-            assert "127.0.0.1" in analyzer.algod_address
-            assert analyzer.algod_token != ""
+        analyzer = AlgorandSovereigntyAnalyzer(use_local_node=True)
+        assert "127.0.0.1" in analyzer.algod_address
+        assert analyzer.algod_token != ""
 
     def test_dust_threshold_constant(self, analyzer):
         """Dust threshold should be $10 USD."""
@@ -47,11 +78,6 @@ class TestAlgorandSovereigntyAnalyzer:
 class TestDustAndNFTDetection:
     """Tests for _is_dust_or_nft method."""
 
-    @pytest.fixture
-    def analyzer(self):
-        with patch('core.analyzer.requests.get'):
-            return AlgorandSovereigntyAnalyzer(use_local_node=False)
-
     def test_nft_like_detection(self, analyzer):
         """Small integer holdings with no price should be flagged as NFT-like."""
         # Amount 1-10, integer, no price
@@ -122,45 +148,35 @@ class TestDustAndNFTDetection:
 class TestAccountData:
     """Tests for account data fetching."""
 
-    @pytest.fixture
-    def analyzer(self):
-        with patch('core.analyzer.requests.get'):
-            return AlgorandSovereigntyAnalyzer(use_local_node=False)
-
-    def test_get_account_assets_success(self, analyzer):
+    def test_get_account_assets_success(self, analyzer, algod_responses):
         """Should return account data on successful API call."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        algod_responses[f"{analyzer.algod_address}/v2/accounts/TEST_ADDRESS"] = {
             'amount': 1000000000,  # 1000 ALGO
             'status': 'Online',
             'assets': []
         }
-        mock_response.raise_for_status = MagicMock()
 
-        with patch('core.analyzer.requests.get', return_value=mock_response):
-            result = analyzer.get_account_assets("TEST_ADDRESS")
+        result = analyzer.get_account_assets("TEST_ADDRESS")
 
         assert result is not None
         assert result['amount'] == 1000000000
         assert result['status'] == 'Online'
 
-    def test_get_account_assets_failure(self, analyzer):
+    def test_get_account_assets_failure(self, analyzer, algod_responses):
         """Should return None on API failure."""
-        import requests
-
-        with patch('core.analyzer.requests.get') as mock_get:
-            mock_get.side_effect = requests.exceptions.RequestException("Network error")
-            result = analyzer.get_account_assets("TEST_ADDRESS")
+        algod_responses[f"{analyzer.algod_address}/v2/accounts/TEST_ADDRESS"] = (
+            requests.exceptions.RequestException("Network error")
+        )
+        result = analyzer.get_account_assets("TEST_ADDRESS")
 
         assert result is None
 
-    def test_get_account_assets_timeout(self, analyzer):
+    def test_get_account_assets_timeout(self, analyzer, algod_responses):
         """Should handle timeout gracefully."""
-        import requests
-
-        with patch('core.analyzer.requests.get') as mock_get:
-            mock_get.side_effect = requests.exceptions.Timeout("Timeout")
-            result = analyzer.get_account_assets("TEST_ADDRESS")
+        algod_responses[f"{analyzer.algod_address}/v2/accounts/TEST_ADDRESS"] = (
+            requests.exceptions.Timeout("Timeout")
+        )
+        result = analyzer.get_account_assets("TEST_ADDRESS")
 
         assert result is None
 
@@ -168,37 +184,28 @@ class TestAccountData:
 class TestAssetDetails:
     """Tests for asset detail fetching."""
 
-    @pytest.fixture
-    def analyzer(self):
-        with patch('core.analyzer.requests.get'):
-            return AlgorandSovereigntyAnalyzer(use_local_node=False)
-
-    def test_get_asset_details_success(self, analyzer):
+    def test_get_asset_details_success(self, analyzer, algod_responses):
         """Should return asset details on success."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        algod_responses[f"{analyzer.algod_address}/v2/assets/31566704"] = {
             'params': {
                 'name': 'USDC',
                 'unit-name': 'USDC',
                 'decimals': 6
             }
         }
-        mock_response.raise_for_status = MagicMock()
 
-        with patch('core.analyzer.requests.get', return_value=mock_response):
-            result = analyzer.get_asset_details(31566704)
+        result = analyzer.get_asset_details(31566704)
 
         assert result is not None
         assert result['params']['name'] == 'USDC'
         assert result['params']['decimals'] == 6
 
-    def test_get_asset_details_failure_silent(self, analyzer):
+    def test_get_asset_details_failure_silent(self, analyzer, algod_responses):
         """Should return None silently on failure."""
-        import requests
-
-        with patch('core.analyzer.requests.get') as mock_get:
-            mock_get.side_effect = requests.exceptions.RequestException("Error")
-            result = analyzer.get_asset_details(12345)
+        algod_responses[f"{analyzer.algod_address}/v2/assets/12345"] = (
+            requests.exceptions.RequestException("Error")
+        )
+        result = analyzer.get_asset_details(12345)
 
         assert result is None
 
@@ -206,11 +213,6 @@ class TestAssetDetails:
 class TestWalletAnalysis:
     """Tests for the main analyze_wallet method."""
 
-    @pytest.fixture
-    def analyzer(self):
-        with patch('core.analyzer.requests.get'):
-            return AlgorandSovereigntyAnalyzer(use_local_node=False)
-
     def test_analyze_wallet_no_account_data(self, analyzer):
         """Should return None when account data cannot be fetched."""
         with patch.object(analyzer, 'get_account_assets', return_value=None):
@@ -220,13 +222,7 @@ class TestWalletAnalysis:
 
     def test_analyze_wallet_basic_algo_only(self, analyzer):
         """Should categorize ALGO correctly."""
-        mock_account = {
-            'amount': 100_000_000,  # 100 ALGO (microAlgos)
-            'status': 'Offline',
-            'assets': []
-        }
-
-        with patch.object(analyzer, 'get_account_assets', return_value=mock_account):
+        with patch.object(analyzer, 'get_account_assets', return_value=dict(_MOCK_ACCT_OFFLINE)):
             with patch('core.analyzer.get_algo_price', return_value=0.35):
                 result = analyzer.analyze_wallet("TEST_ADDRESS")
 
@@ -238,13 +234,7 @@ class TestWalletAnalysis:
 
     def test_analyze_wallet_participating_flag(self, analyzer):
         """Should note participation status in ALGO name."""
-        mock_account = {
-            'amount': 100_000_000,
-            'status': 'Online',  # Participating
-            'assets': []
-        }
-
-        with patch.object(analyzer, 'get_account_assets', return_value=mock_account):
+        with patch.object(analyzer, 'get_account_assets', return_value=dict(_MOCK_ACCT_ONLINE)):
             with patch('core.analyzer.get_algo_price', return_value=0.35):
                 result = analyzer.analyze_wallet("TEST_ADDRESS")
 
@@ -252,13 +242,7 @@ class TestWalletAnalysis:
 
     def test_analyze_wallet_categories_initialized(self, analyzer):
         """Should always initialize all four categories."""
-        mock_account = {
-            'amount': 0,
-            'status': 'Offline',
-            'assets': []
-        }
-
-        with patch.object(analyzer, 'get_account_assets', return_value=mock_account):
+        with patch.object(analyzer, 'get_account_assets', return_value=dict(_MOCK_ACCT_EMPTY)):
             with patch('core.analyzer.get_algo_price', return_value=0.35):
                 result = analyzer.analyze_wallet("TEST_ADDRESS")
 
@@ -270,11 +254,6 @@ class TestWalletAnalysis:
 class TestStateStorage:
     """Tests for analyzer state storage."""
 
-    @pytest.fixture
-    def analyzer(self):
-        with patch('core.analyzer.requests.get'):
-            return AlgorandSovereigntyAnalyzer(use_local_node=False)
-
     def test_state_initialized_empty(self, analyzer):
         """State should be initialized empty."""
         assert analyzer.last_categories == {}
@@ -0,0 +1,325 @@
+"""
+Tests for the SQLite-backed sovereignty history tracker (core_history.py).
+"""
+
+import dataclasses
+import gc
+import json
+import sqlite3
+import threading
+import weakref
+
+import pytest
+
+import core_history
+from core_history import SovereigntyHistory
+
+
+@pytest.fixture
+def history(tmp_path):
+    """A history tracker backed by a fresh database file."""
+    tracker = SovereigntyHistory(db_path=str(tmp_path / "history.db"))
+    yield tracker
+    tracker.close()
+
+
+def _result(ratio=2.5, hard_money=100000, portfolio=125000):
+    """Build a minimal analysis result as returned by the analyzer."""
+    return {
+        "sovereignty": {
+            "sovereignty_ratio": ratio,
+            "sovereignty_status": "Fragile",
+            "hard_money_usd": hard_money,
+            "portfolio_usd": portfolio,
+            "annual_fixed_expenses": 48000,
+        },
+        "summary": {"total_algo": 50000},
+        "assets": {},
+    }
+
+
+def _insert(tracker, address, ratio, age):
+    """Insert a snapshot directly with a timestamp `age` (SQLite modifier) ago."""
+    conn = tracker._write_conn
+    conn.execute(
+        "INSERT INTO snapshots (address, timestamp, sovereignty_ratio) "
+        "VALUES (?, datetime('now', ?), ?)",
+        (address, age, ratio),
+    )
+
+
+class TestSnapshots:
+    """Tests for saving and reading snapshots."""
+
+    def test_save_and_read_back(self, history):
+        """A saved snapshot shows up in the address history."""
+        snapshot_id = history.save_snapshot("ADDR", _result())
+        assert snapshot_id is not None
+        rows = history.get_history("ADDR")
+        assert len(rows) == 1
+        assert rows[0]["id"] == snapshot_id
+        assert rows[0]["hard_money_pct"] == pytest.approx(80.0)
+
+    def test_iter_history_streams_in_batches(self, history, monkeypatch):
+        """iter_history yields every row across batches, newest first."""
+        monkeypatch.setattr("core_history.HISTORY_FETCH_SIZE", 2)
+        for days_ago in range(5, 0, -1):
+            _insert(history, "ADDR", float(days_ago), f"-{days_ago} days")
+        ratios = [row["sovereignty_ratio"] for row in history.iter_history("ADDR")]
+        assert ratios == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert history.get_history("ADDR") == list(history.iter_history("ADDR"))
+
+    def test_iter_history_pages_through_equal_timestamps(self, history, monkeypatch):
+        """Rows sharing a timestamp are neither skipped nor repeated across batches."""
+        monkeypatch.setattr("core_history.HISTORY_FETCH_SIZE", 2)
+        for ratio in range(5):
+            _insert(history, "ADDR", float(ratio), "-1 days")
+        ratios = [row["sovereignty_ratio"] for row in history.iter_history("ADDR")]
+        assert ratios == [4.0, 3.0, 2.0, 1.0, 0.0]
+
+    def test_abandoned_iter_history_returns_reader(self, history, monkeypatch):
+        """A half-consumed iterator does not keep a pooled reader checked out."""
+        monkeypatch.setattr("core_history.HISTORY_FETCH_SIZE", 2)
+        for days_ago in range(5, 0, -1):
+            _insert(history, "ADDR", float(days_ago), f"-{days_ago} days")
+        rows = history.iter_history("ADDR")
+        next(rows)
+        assert history._readers.qsize() == core_history.READER_POOL_SIZE
+
+    def test_read_times_out_when_pool_is_empty(self, history, monkeypatch):
+        """Waiting on an exhausted reader pool fails instead of blocking forever."""
+        monkeypatch.setattr("core_history.READER_TIMEOUT_SECONDS", 0.01)
+        borrowed = [history._readers.get() for _ in range(core_history.READER_POOL_SIZE)]
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                history.get_history("ADDR")
+        finally:
+            for conn in borrowed:
+                history._readers.put(conn)
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_asset_breakdown_stored_as_json(self, history, monkeypatch, has_orjson):
+        """The asset breakdown round-trips through JSON with either encoder."""
+        if has_orjson and not core_history.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(core_history, "HAS_ORJSON", has_orjson)
+        assets = {"hard_money": [{"ticker": "goBTC", "usd_value": 1.5}], "other": []}
+        result = dict(_result(), assets=assets)
+        snapshot_id = history.save_snapshot("ADDR", result)
+        stored = history._write_conn.execute(
+            "SELECT asset_breakdown FROM snapshots WHERE id = ?", (snapshot_id,)
+        ).fetchone()[0]
+        assert json.loads(stored) == assets
+
+    def test_recent_snapshot_is_deduplicated(self, history):
+        """A second save within the hour is skipped."""
+        assert history.save_snapshot("ADDR", _result()) is not None
+        assert history.save_snapshot("ADDR", _result(ratio=3.0)) is None
+        assert len(history.get_history("ADDR")) == 1
+
+    def test_delete_and_cleanup(self, history):
+        """delete_history and cleanup_old_data report deleted rows."""
+        _insert(history, "OLD", 1.0, "-400 days")
+        _insert(history, "OLD", 1.5, "-10 days")
+        assert history.cleanup_old_data(days_to_keep=365) == 1
+        assert history.delete_history("OLD") == 1
+
+    def test_cleanup_deletes_in_batches(self, history, monkeypatch):
+        """cleanup_old_data keeps deleting until a short batch is returned."""
+        monkeypatch.setattr(core_history, "CLEANUP_BATCH_SIZE", 2)
+        for days_ago in range(400, 405):
+            _insert(history, "OLD", 1.0, f"-{days_ago} days")
+        _insert(history, "OLD", 1.0, "-1 days")
+        assert history.cleanup_old_data(days_to_keep=365) == 5
+        assert len(history.get_history("OLD")) == 1
+
+
+class TestStatusCodes:
+    """Tests for the integer encoding of sovereignty_status."""
+
+    def test_known_status_stored_as_code(self, history):
+        """Analyzer statuses are stored as codes and decoded on read."""
+        result = _result()
+        result["sovereignty"]["sovereignty_status"] = "Robust 🟡"
+        history.save_snapshot("ADDR", result)
+        row = history._write_conn.execute(
+            "SELECT status_code, sovereignty_status FROM snapshots"
+        ).fetchone()
+        assert tuple(row) == (2, None)
+        assert history.get_history("ADDR")[0]["sovereignty_status"] == "Robust 🟡"
+
+    def test_unknown_status_keeps_text(self, history):
+        """Statuses outside STATUS_NAMES round-trip as text."""
+        history.save_snapshot("ADDR", _result())
+        assert history.get_history("ADDR")[0]["sovereignty_status"] == "Fragile"
+
+    def test_legacy_table_is_backfilled(self, tmp_path):
+        """A snapshots table without status_code gains it with codes filled in."""
+        path = tmp_path / "legacy.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE snapshots (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "address TEXT NOT NULL, timestamp DATETIME DEFAULT CURRENT_TIMESTAMP, "
+                "sovereignty_ratio REAL, sovereignty_status TEXT, hard_money_usd REAL, "
+                "total_portfolio_usd REAL, hard_money_pct REAL, algo_balance REAL, "
+                "annual_expenses REAL, asset_breakdown TEXT, "
+                "created_at DATETIME DEFAULT CURRENT_TIMESTAMP)"
+            )
+            conn.executemany(
+                "INSERT INTO snapshots (address, sovereignty_status) VALUES (?, ?)",
+                [("ADDR", "Antifragile 🟢"), ("ADDR", "Custom")],
+            )
+        tracker = SovereigntyHistory(db_path=str(path))
+        rows = tracker._write_conn.execute(
+            "SELECT status_code, sovereignty_status FROM snapshots ORDER BY id"
+        ).fetchall()
+        statuses = {row["sovereignty_status"] for row in tracker.get_history("ADDR")}
+        tracker.close()
+        assert [tuple(row) for row in rows] == [(3, None), (None, "Custom")]
+        assert statuses == {"Antifragile 🟢", "Custom"}
+
+
+class TestProgress:
+    """Tests for progress and all-time statistics."""
+
+    def test_progress_for_unknown_address(self, history):
+        """An address without snapshots reports a new trend."""
+        progress = history.get_progress("NOBODY")
+        assert progress.trend == "new"
+        assert progress.snapshots_count == 0
+
+    def test_progress_improving(self, history):
+        """A higher ratio than ~30 days ago is reported as improving."""
+        _insert(history, "ADDR", 2.0, "-40 days")
+        _insert(history, "ADDR", 2.5, "-1 days")
+        progress = history.get_progress("ADDR")
+        assert progress.previous_ratio == 2.0
+        assert progress.change_absolute == 0.5
+        assert progress.trend == "improving"
+        assert progress.snapshots_count == 2
+        assert progress.days_tracked >= 39
+        assert progress.projected_next_status["status"] == "Robust"
+
+    def test_all_time_stats(self, history):
+        """High, low and average cover every snapshot of the address."""
+        assert history.get_all_time_stats("ADDR") is None
+        for ratio, age in ((1.0, "-3 days"), (3.0, "-2 days"), (2.0, "-1 days")):
+            _insert(history, "ADDR", ratio, age)
+        stats = history.get_all_time_stats("ADDR")
+        assert (stats.high, stats.low, stats.average) == (3.0, 1.0, 2.0)
+
+    def test_all_time_stats_refresh_after_save(self, history):
+        """A new snapshot drops the cached stats for its address."""
+        _insert(history, "ADDR", 1.0, "-2 days")
+        assert history.get_all_time_stats("ADDR").high == 1.0
+        history.save_snapshot("ADDR", _result(ratio=4.0))
+        assert history.get_all_time_stats("ADDR").high == 4.0
+
+    def test_all_time_stats_cache_is_bounded(self, history, monkeypatch):
+        """Expired entries are evicted first, then the soonest to expire."""
+        monkeypatch.setattr(core_history, "STATS_CACHE_MAX_ENTRIES", 2)
+        for address in ("A", "B", "C"):
+            _insert(history, address, 1.0, "-1 days")
+        history.get_all_time_stats("A")
+        history.get_all_time_stats("B")
+        history.get_all_time_stats("C")
+        assert set(history._stats_cache) == {"B", "C"}
+
+        monkeypatch.setattr(core_history, "STATS_CACHE_TTL_SECONDS", -1)
+        history._stats_cache.clear()
+        history.get_all_time_stats("A")
+        history.get_all_time_stats("B")
+        monkeypatch.setattr(core_history, "STATS_CACHE_TTL_SECONDS", 60)
+        history.get_all_time_stats("C")
+        assert set(history._stats_cache) == {"C"}
+
+    def test_cached_all_time_stats_are_immutable(self, history):
+        """Callers share the cached instance, so it cannot be modified."""
+        _insert(history, "ADDR", 1.0, "-1 days")
+        stats = history.get_all_time_stats("ADDR")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            stats.high = 99.0
+        assert history.get_all_time_stats("ADDR").high == 1.0
+
+
+class TestConnections:
+    """Tests for the writer connection and the read-only pool."""
+
+    def test_connections_autocommit(self, history):
+        """No implicit transaction is left open by reads or writes."""
+        history.save_snapshot("ADDR", _result())
+        history.get_history("ADDR")
+        history.get_progress("ADDR")
+        assert history._write_conn.isolation_level is None
+        assert not history._write_conn.in_transaction
+        with history._read() as conn:
+            assert conn.isolation_level is None
+            assert not conn.in_transaction
+
+    def test_readers_are_read_only(self, history):
+        """Pooled readers reject writes."""
+        with history._read() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM snapshots")
+
+    def test_reads_run_while_writer_is_held(self, history):
+        """Readers see committed rows even while the writer lock is taken."""
+        history.save_snapshot("ADDR", _result())
+        seen = []
+        with history._write():
+            worker = threading.Thread(target=lambda: seen.append(history.get_history("ADDR")))
+            worker.start()
+            worker.join(timeout=5)
+        assert len(seen) == 1 and len(seen[0]) == 1
+
+    def test_analyze_after_many_inserts(self, history, monkeypatch):
+        """Planner statistics are collected once enough snapshots are saved."""
+        monkeypatch.setattr(core_history, "ANALYZE_EVERY_INSERTS", 2)
+        conn = history._write_conn
+        stat_rows = "SELECT COUNT(*) FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        history.save_snapshot("A", _result())
+        assert conn.execute(stat_rows).fetchone()[0] == 0
+        history.save_snapshot("B", _result())
+        assert conn.execute(stat_rows).fetchone()[0] == 1
+
+    def test_dropped_tracker_is_collected_and_closed(self, tmp_path):
+        """Nothing pins an unclosed tracker; collecting it closes its connections."""
+        tracker = SovereigntyHistory(db_path=str(tmp_path / "dropped.db"))
+        conn = tracker._write_conn
+        ref = weakref.ref(tracker)
+        del tracker
+        gc.collect()
+        assert ref() is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_close_is_idempotent(self, history):
+        """Closing twice is harmless."""
+        history.close()
+        history.close()
+
+
+class TestQueryPlans:
+    """Tests that hot lookups are served by idx_address_timestamp."""
+
+    @pytest.mark.parametrize("sql, params", [
+        ("SELECT * FROM snapshots WHERE address = ? "
+         "ORDER BY timestamp DESC LIMIT 1", ("ADDR",)),
+        ("SELECT * FROM snapshots WHERE address = ? "
+         "AND timestamp < ? "
+         "ORDER BY timestamp DESC LIMIT 1", ("ADDR", "2024-01-01 00:00:00")),
+    ])
+    def test_newest_first_lookup_needs_no_sort(self, history, sql, params):
+        """ORDER BY timestamp DESC is satisfied by the index, not a temp B-tree."""
+        conn = history._write_conn
+        plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+        assert any("idx_address_timestamp" in step for step in plan)
+        assert not any("TEMP B-TREE" in step for step in plan)
+
+    def test_all_time_stats_use_covering_index(self, history):
+        """The all-time aggregates are answered from idx_snapshots_agg alone."""
+        conn = history._write_conn
+        plan = [row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN " + core_history._SQL_ALL_TIME_STATS, ("ADDR",)
+        )]
+        assert plan == ["SEARCH snapshots USING COVERING INDEX idx_snapshots_agg (address=?)"]
@@ -0,0 +1,291 @@
+"""
+Tests for meld_pricing.py - Meld Gold/Silver arbitrage analysis
+
+These tests cover:
+- Premium/discount signal calculation
+- Concurrent fetching of Meld and spot prices
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+
+import pytest
+from unittest.mock import patch
+
+import meld_pricing
+from meld_pricing import (
+    MELD_GOLD_ASA,
+    MELD_SILVER_ASA,
+    GRAMS_PER_TROY_OZ,
+    calculate_arbitrage,
+    calculate_arbitrage_array,
+    get_meld_arbitrage_analysis,
+    get_meld_gold_price,
+    get_meld_prices,
+    get_meld_silver_price,
+    get_vestige_prices_batch,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_meld_cache(tmp_path, monkeypatch):
+    """Every test starts with an empty Meld price cache persisted under tmp_path."""
+    monkeypatch.setattr(meld_pricing, 'PRICE_CACHE_DB', str(tmp_path / 'meld_price_cache.db'))
+    monkeypatch.setattr(meld_pricing, '_persisted_loaded', False)
+    meld_pricing._meld_price_cache.clear()
+    meld_pricing._price_history.clear()
+    yield
+    meld_pricing._meld_price_cache.clear()
+    meld_pricing._price_history.clear()
+
+
+class TestPriceCache:
+    """Tests for the shared Meld price cache."""
+
+    def test_repeat_lookup_hits_cache(self):
+        with patch.object(meld_pricing, 'get_vestige_price', return_value=140.0) as fetch:
+            assert get_meld_gold_price() == 140.0
+            assert get_meld_gold_price() == 140.0
+        fetch.assert_called_once_with(MELD_GOLD_ASA)
+
+    def test_gold_and_silver_cached_separately(self):
+        prices = {MELD_GOLD_ASA: 140.0, MELD_SILVER_ASA: 1.1}
+        with patch.object(meld_pricing, 'get_vestige_price', side_effect=prices.get):
+            assert get_meld_gold_price() == 140.0
+            assert get_meld_silver_price() == 1.1
+
+    @pytest.mark.parametrize("failed", [None, 0.0])
+    def test_failed_fetch_cached_briefly(self, monkeypatch, failed):
+        with patch.object(meld_pricing, 'get_vestige_price', return_value=failed) as fetch:
+            assert get_meld_gold_price() is None
+            assert get_meld_gold_price() is None
+            assert fetch.call_count == 1
+
+            monkeypatch.setattr(meld_pricing, '_negative_ttl', 0.0)
+            meld_pricing._meld_price_cache.clear()
+            assert get_meld_gold_price() is None
+            assert get_meld_gold_price() is None
+            assert fetch.call_count == 3
+
+    def test_batch_fetches_concurrently_and_skips_failures(self):
+        # Each fetch waits for all three to be in flight, so a serial batch
+        # breaks the barrier instead of depending on wall-clock timing
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_vestige(asa_id):
+            barrier.wait()
+            return None if asa_id == 3 else float(asa_id)
+
+        with patch.object(meld_pricing, 'get_vestige_price', fake_vestige):
+            prices = get_vestige_prices_batch([1, 2, 3])
+
+        assert prices == {1: 1.0, 2: 2.0}
+
+    def test_meld_prices_served_from_cache(self):
+        meld_pricing._store_price(MELD_GOLD_ASA, 140.0)
+        meld_pricing._store_price(MELD_SILVER_ASA, 1.1)
+        with patch.object(meld_pricing, 'get_vestige_price') as fetch:
+            assert get_meld_prices() == {'gold': 140.0, 'silver': 1.1}
+        fetch.assert_not_called()
+
+    def test_meld_prices_inside_running_loop(self):
+        prices = {MELD_GOLD_ASA: 140.0, MELD_SILVER_ASA: 1.1}
+
+        async def handler():
+            return get_meld_prices()
+
+        with patch.object(meld_pricing, 'get_vestige_price', side_effect=prices.get):
+            assert asyncio.run(handler()) == {'gold': 140.0, 'silver': 1.1}
+
+    def test_concurrent_misses_share_one_fetch(self):
+        calls = []
+
+        def slow_fetch(asa_id):
+            calls.append(asa_id)
+            time.sleep(0.2)
+            return 140.0
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(get_meld_gold_price())
+
+        with patch.object(meld_pricing, 'get_vestige_price', slow_fetch):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert calls == [MELD_GOLD_ASA]
+        assert results == [140.0] * 8
+        assert meld_pricing._inflight == {}
+
+    def test_cache_survives_restart(self, monkeypatch):
+        with patch.object(meld_pricing, 'get_vestige_price', return_value=140.0):
+            assert get_meld_gold_price() == 140.0
+
+        # Simulate a fresh process: empty memory, cache file still on disk
+        meld_pricing._meld_price_cache.clear()
+        monkeypatch.setattr(meld_pricing, '_persisted_loaded', False)
+        with patch.object(meld_pricing, 'get_vestige_price') as fetch:
+            assert get_meld_gold_price() == 140.0
+        fetch.assert_not_called()
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(meld_pricing, '_cache_max_entries', 2)
+        for asa_id in (1, 2, 3):
+            meld_pricing._store_price(asa_id, 1.0)
+        assert sorted(meld_pricing._meld_price_cache) == [2, 3]
+
+
+class TestVestigeParsing:
+    """Tests for reading prices out of Vestige responses."""
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_parse_price(self, monkeypatch, has_orjson):
+        if has_orjson and not meld_pricing.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(meld_pricing, 'HAS_ORJSON', has_orjson)
+        assert meld_pricing._parse_price(b'{"price": 140.25, "asset_id": 1}') == 140.25
+        assert meld_pricing._parse_price(b'{}') == 0.0
+
+
+class TestAdaptiveTTL:
+    """Tests for the per-asset cache TTL."""
+
+    def test_single_price_uses_base_ttl(self):
+        assert meld_pricing._adaptive_ttl(deque([100.0])) == 300.0
+
+    def test_stable_prices_extend_ttl(self):
+        assert meld_pricing._adaptive_ttl(deque([100.0] * 8)) == 900.0
+
+    @pytest.mark.parametrize("spread, ttl", [(0.01, 300.0), (0.03, 180.0), (0.05, 60.0)])
+    def test_ttl_follows_spread(self, spread, ttl):
+        # Two prices at mean * (1 +/- spread) have a population stddev of exactly spread
+        prices = deque([100.0 * (1 - spread), 100.0 * (1 + spread)])
+        assert meld_pricing._adaptive_ttl(prices) == pytest.approx(ttl)
+
+    def test_volatile_prices_shrink_ttl(self):
+        assert meld_pricing._adaptive_ttl(deque([100.0, 120.0, 90.0])) == 60.0
+
+    def test_hit_near_expiry_refreshes_in_background(self):
+        now = time.monotonic()
+        meld_pricing._meld_price_cache[MELD_GOLD_ASA] = (140.0, now + 60, now - 1)
+        with patch.object(meld_pricing, 'get_vestige_price', return_value=141.0) as fetch:
+            assert get_meld_gold_price() == 140.0
+            for _ in range(100):
+                if meld_pricing._meld_price_cache[MELD_GOLD_ASA][0] == 141.0:
+                    break
+                time.sleep(0.01)
+        fetch.assert_called_once_with(MELD_GOLD_ASA)
+        assert get_meld_gold_price() == 141.0
+
+
+class TestArbitrage:
+    """Tests for calculate_arbitrage."""
+
+    def test_fair_price_holds(self):
+        result = calculate_arbitrage(3110.35, 100.0)
+        assert result['implied_per_gram'] == 100.0
+        assert result['premium_pct'] == 0.0
+        assert result['signal'] == 'HOLD'
+
+    @pytest.mark.parametrize("meld_price, signal", [
+        (112.0, 'STRONG_SELL'),
+        (107.0, 'SELL'),
+        (93.0, 'BUY'),
+        (88.0, 'STRONG_BUY'),
+    ])
+    def test_signals(self, meld_price, signal):
+        assert calculate_arbitrage(100.0 * GRAMS_PER_TROY_OZ, meld_price)['signal'] == signal
+
+    @pytest.mark.parametrize("premium_pct, signal", [
+        (-10.5, 'STRONG_BUY'), (-10, 'BUY'), (-5, 'HOLD'), (0, 'HOLD'),
+        (5, 'HOLD'), (10, 'SELL'), (10.5, 'STRONG_SELL'),
+    ])
+    def test_threshold_boundaries(self, premium_pct, signal):
+        assert meld_pricing._signal_for(premium_pct) == signal
+
+    def test_invalid_spot_is_error(self):
+        assert calculate_arbitrage(0, 100.0)['signal'] == 'ERROR'
+
+
+class TestArbitrageArray:
+    """Tests for the batch calculate_arbitrage_array."""
+
+    @pytest.mark.parametrize("has_numpy", [True, False])
+    def test_matches_scalar_path(self, monkeypatch, has_numpy):
+        if has_numpy and not meld_pricing.HAS_NUMPY:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(meld_pricing, 'HAS_NUMPY', has_numpy)
+        spot = [100.0 * GRAMS_PER_TROY_OZ] * 5 + [0.0]
+        meld = [130.0, 107.0, 100.0, 93.0, 70.0, 100.0]
+
+        batch = calculate_arbitrage_array(spot, meld)
+
+        for i, (s, m) in enumerate(zip(spot, meld)):
+            expected = calculate_arbitrage(s, m)
+            assert batch['signal'][i] == expected['signal']
+            for key in ('implied_per_gram', 'premium_pct', 'premium_usd', 'signal_strength'):
+                assert round(float(batch[key][i]), 4) == pytest.approx(expected[key], abs=0.1)
+
+
+class TestAnalysis:
+    """Tests for get_meld_arbitrage_analysis."""
+
+    def test_fetches_run_concurrently(self):
+        """Meld and spot lookups overlap instead of running back to back."""
+        meld = {MELD_GOLD_ASA: 140.0, MELD_SILVER_ASA: 1.1}
+        # All four lookups must be in flight at once to pass the barrier
+        barrier = threading.Barrier(4, timeout=5)
+
+        def fake_vestige(asa_id):
+            barrier.wait()
+            return meld[asa_id]
+
+        def spot(value):
+            barrier.wait()
+            return value
+
+        with patch.object(meld_pricing, 'get_vestige_price', fake_vestige), \
+             patch('core.pricing.get_gold_price_per_oz', lambda: spot(4300.0)), \
+             patch('core.pricing.get_silver_price_per_oz', lambda: spot(34.0)):
+            result = get_meld_arbitrage_analysis()
+
+        assert result['data_complete'] is True
+        assert result['gold']['meld_price'] == 140.0
+        assert result['silver']['spot_per_oz'] == 34.0
+
+    def test_sync_call_inside_running_loop(self):
+        """The blocking wrapper works when called from async code."""
+        async def handler():
+            return get_meld_arbitrage_analysis()
+
+        with patch.object(meld_pricing, 'get_vestige_price', return_value=140.0), \
+             patch('core.pricing.get_gold_price_per_oz', lambda: 4300.0), \
+             patch('core.pricing.get_silver_price_per_oz', lambda: 34.0):
+            result = asyncio.run(handler())
+
+        assert result['data_complete'] is True
+        assert result['gold']['meld_price'] == 140.0
+
+    def test_async_entry_point(self):
+        with patch.object(meld_pricing, 'get_vestige_price', return_value=140.0), \
+             patch('core.pricing.get_gold_price_per_oz', lambda: 4300.0), \
+             patch('core.pricing.get_silver_price_per_oz', lambda: 34.0):
+            result = asyncio.run(meld_pricing.get_meld_arbitrage_analysis_async())
+
+        assert result['data_complete'] is True
+
+    def test_missing_meld_price_is_reported(self):
+        with patch.object(meld_pricing, 'get_vestige_price', return_value=None), \
+             patch('core.pricing.get_gold_price_per_oz', lambda: 4300.0), \
+             patch('core.pricing.get_silver_price_per_oz', lambda: 34.0):
+            result = get_meld_arbitrage_analysis()
+
+        assert result['data_complete'] is False
+        assert result['gold']['meld_available'] is False
@@ -8,9 +8,9 @@ These tests cover:
 - Hardcoded price fallbacks
 """
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from datetime import datetime, timedelta
-import requests
+from requests.exceptions import RequestException, Timeout
 
 from core.pricing import (
     get_hardcoded_price,
@@ -23,45 +23,92 @@ from core.pricing import (
     get_silver_price,
     get_gold_price_per_oz,
     get_silver_price_per_oz,
+    get_meld_gold_price,
     get_asset_price,
     fetch_vestige_price,
     _meld_price_cache,
     MELD_CACHE_TTL_SECONDS,
+    GRAMS_PER_TROY_OZ,
 )
 
+# Expected per-gram prices for the mocked per-oz spot prices
+_GOLD_PER_G = 2650.0 / GRAMS_PER_TROY_OZ
+_SILVER_PER_G = 30.0 / GRAMS_PER_TROY_OZ
+
+# Vestige payloads shared by the fetch tests (never mutated)
+_VESTIGE_OK = [{'price': 0.35}]
+_VESTIGE_EMPTY = []
+_VESTIGE_ZERO = [{'price': 0}]
+
+# Every test in this module starts and ends with an empty price cache
+pytestmark = pytest.mark.usefixtures('clear_price_cache')
+
+FROZEN_NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin core.pricing's clock to FROZEN_NOW."""
+    monkeypatch.setattr('core.pricing.datetime', _FrozenDatetime)
+    return FROZEN_NOW
+
+
+def _reset_price_cache():
+    for key in _meld_price_cache:
+        _meld_price_cache[key] = {'price': None, 'expires': None}
+
+
+@pytest.fixture
+def clear_price_cache():
+    """Empty every price cache entry before and after the test."""
+    _reset_price_cache()
+    yield
+    _reset_price_cache()
+
+
+@pytest.fixture(autouse=True)
+def _nosleep(monkeypatch):
+    """Retry backoff in core.pricing never actually blocks."""
+    monkeypatch.setattr('core.pricing.time.sleep', lambda *a, **k: None)
+
+
+@pytest.fixture
+def patched_requests():
+    """Patch core.pricing's requests.get; tests set return_value/side_effect."""
+    with patch('core.pricing.requests.get') as m:
+        yield m
+
+
+STABLECOINS = ['USDC', 'USDT', 'DAI', 'STBL', 'FUSDC', 'FUSDT', 'FUSD']
+ALGO_TOKENS = ['ALGO', 'FALGO', 'XALGO']
+BTC_TOKENS = ['BTC', 'WBTC', 'GOBTC', 'FGOBTC']
+ETH_TOKENS = ['ETH', 'WETH', 'GOETH', 'FGOETH']
+
 
 class TestHardcodedPrices:
     """Tests for hardcoded fallback prices."""
 
-    def test_stablecoin_prices(self):
+    @pytest.mark.parametrize("coin", STABLECOINS)
+    def test_stablecoin_prices(self, coin):
         """Stablecoins should return $1."""
-        stablecoins = ['USDC', 'USDT', 'DAI', 'STBL', 'FUSDC', 'FUSDT', 'FUSD']
-        for coin in stablecoins:
-            assert get_hardcoded_price(coin) == 1.0
-
-    def test_algo_derivatives(self):
-        """ALGO and derivatives should have fallback price."""
-        algo_tokens = ['ALGO', 'FALGO', 'XALGO']
-        for token in algo_tokens:
-            price = get_hardcoded_price(token)
-            assert price is not None
-            assert price > 0
-
-    def test_bitcoin_tokens(self):
-        """Bitcoin tokens should have fallback price."""
-        btc_tokens = ['BTC', 'WBTC', 'GOBTC', 'FGOBTC']
-        for token in btc_tokens:
-            price = get_hardcoded_price(token)
-            assert price is not None
-            assert price > 50000  # BTC should be > $50k
-
-    def test_ethereum_tokens(self):
-        """Ethereum tokens should have fallback price."""
-        eth_tokens = ['ETH', 'WETH', 'GOETH', 'FGOETH']
-        for token in eth_tokens:
-            price = get_hardcoded_price(token)
-            assert price is not None
-            assert price > 1000  # ETH should be > $1k
+        assert get_hardcoded_price(coin) == 1.0
+
+    @pytest.mark.parametrize("token, floor", [
+        *[(token, 0) for token in ALGO_TOKENS],
+        *[(token, 50000) for token in BTC_TOKENS],  # BTC should be > $50k
+        *[(token, 1000) for token in ETH_TOKENS],   # ETH should be > $1k
+    ])
+    def test_token_fallback_price(self, token, floor):
+        """ALGO, Bitcoin and Ethereum tokens should have a fallback price."""
+        price = get_hardcoded_price(token)
+        assert price is not None
+        assert price > floor
 
     def test_precious_metals(self):
         """Gold and silver should have fallback prices."""
@@ -78,137 +125,114 @@ class TestHardcodedPrices:
         assert get_hardcoded_price('Algo') == get_hardcoded_price('ALGO')
 
 
+@pytest.mark.usefixtures("patched_requests")
 class TestCoinGeckoFetching:
     """Tests for CoinGecko price fetching."""
 
-    def test_algo_price_success(self):
-        """Should return price on successful API call."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {'algorand': {'usd': 0.42}}
-        mock_response.raise_for_status = MagicMock()
-
-        with patch('core.pricing.requests.get', return_value=mock_response):
-            price = get_algo_price()
-
-        assert price == 0.42
-
-    def test_algo_price_fallback_on_failure(self):
-        """Should fall back to hardcoded price on API failure."""
-        with patch('core.pricing.requests.get') as mock_get:
-            mock_get.side_effect = requests.exceptions.RequestException("Network error")
-            price = get_algo_price()
-
-        # Should return hardcoded fallback
-        assert price is not None
-        assert price > 0
-
-    def test_bitcoin_price_success(self):
+    @pytest.mark.parametrize("outcomes, expected, call_count", [
+        # Success on the first attempt
+        ([{'algorand': {'usd': 0.42}}], 0.42, 1),
+        # Retry succeeds after transient failures
+        ([Timeout("Timeout"),
+          RequestException("Network error"),
+          {'algorand': {'usd': 0.42}}], 0.42, 3),
+        # Persistent failure falls back to the hardcoded price
+        ([RequestException("Network error")] * 3,
+         get_hardcoded_price('ALGO'), 3),
+    ], ids=["success", "retry_success", "fallback"])
+    def test_algo_price(self, make_response, patched_requests, outcomes, expected, call_count):
+        """Should retry CoinGecko and fall back to the hardcoded price."""
+        patched_requests.side_effect = [
+            make_response(o) if isinstance(o, dict) else o for o in outcomes
+        ]
+        price = get_algo_price()
+
+        assert price == expected
+        assert patched_requests.call_count == call_count
+
+    def test_bitcoin_price_success(self, make_response, patched_requests):
         """Should return BTC price on success."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {'bitcoin': {'usd': 95000}}
-        mock_response.raise_for_status = MagicMock()
-
-        with patch('core.pricing.requests.get', return_value=mock_response):
-            price = get_bitcoin_price()
+        patched_requests.return_value = make_response({'bitcoin': {'usd': 95000}})
+        price = get_bitcoin_price()
 
         assert price == 95000
 
 
+@pytest.mark.usefixtures("patched_requests")
 class TestCoinbaseIntegration:
     """Tests for Coinbase BTC price fetching."""
 
-    def test_bitcoin_spot_price_success(self):
+    def test_bitcoin_spot_price_success(self, make_response, patched_requests):
         """Should return BTC spot price from Coinbase."""
-        # Clear cache first
-        _meld_price_cache['btc_spot'] = {'price': None, 'expires': None}
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {'data': {'amount': '98500.00'}}
-        mock_response.raise_for_status = MagicMock()
-
-        with patch('core.pricing.requests.get', return_value=mock_response):
-            price = get_bitcoin_spot_price()
+        patched_requests.return_value = make_response({'data': {'amount': '98500.00'}})
+        price = get_bitcoin_spot_price()
 
         assert price == 98500.0
 
-    def test_bitcoin_spot_caching(self):
+    def test_bitcoin_spot_caching(self, frozen_now):
         """Should use cached price within TTL."""
         cached_price = 97000.0
         _meld_price_cache['btc_spot'] = {
             'price': cached_price,
-            'expires': datetime.now() + timedelta(seconds=100)
+            'expires': datetime(2025, 1, 1, 12, 1, 40)
         }
 
         # Should not make API call, return cached value
         price = get_bitcoin_spot_price()
         assert price == cached_price
 
-    def test_bitcoin_spot_fallback_chain(self):
+    def test_bitcoin_spot_fallback_chain(self, patched_requests):
         """Should fall back to CoinGecko then hardcoded on Coinbase failure."""
-        _meld_price_cache['btc_spot'] = {'price': None, 'expires': None}
+        # Coinbase fails
+        patched_requests.side_effect = Timeout("Timeout")
 
-        with patch('core.pricing.requests.get') as mock_get:
-            # Coinbase fails
-            mock_get.side_effect = requests.exceptions.Timeout("Timeout")
+        # CoinGecko fallback fails too
+        with patch('core.pricing.get_bitcoin_price', return_value=None) as coingecko:
+            price = get_bitcoin_spot_price()
 
-            # Mock CoinGecko fallback
-            with patch('core.pricing.get_bitcoin_price', return_value=None):
-                price = get_bitcoin_spot_price()
+        coingecko.assert_called_once()
 
         # Should return hardcoded fallback
         assert price is not None
         assert price > 50000
 
 
+@pytest.mark.usefixtures("patched_requests")
 class TestVestigePricing:
     """Tests for Vestige API price fetching."""
 
-    def test_vestige_price_success(self):
+    def test_vestige_price_success(self, make_response, patched_requests):
         """Should return price from Vestige API."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = [{'price': 0.35}]
-        mock_response.raise_for_status = MagicMock()
-
-        with patch('core.pricing.requests.get', return_value=mock_response):
-            price = fetch_vestige_price(31566704)  # USDC ASA ID
+        patched_requests.return_value = make_response(_VESTIGE_OK)
+        price = fetch_vestige_price(31566704)  # USDC ASA ID
 
         assert price == 0.35
 
-    def test_vestige_timeout_handling(self):
+    def test_vestige_timeout_handling(self, patched_requests):
         """Should handle timeout gracefully."""
-        with patch('core.pricing.requests.get') as mock_get:
-            mock_get.side_effect = requests.exceptions.Timeout("Timeout")
-            price = fetch_vestige_price(12345)
+        patched_requests.side_effect = Timeout("Timeout")
+        price = fetch_vestige_price(12345)
 
         assert price is None
 
-    def test_vestige_network_error_handling(self):
+    def test_vestige_network_error_handling(self, patched_requests):
         """Should handle network errors gracefully."""
-        with patch('core.pricing.requests.get') as mock_get:
-            mock_get.side_effect = requests.exceptions.RequestException("Network error")
-            price = fetch_vestige_price(12345)
+        patched_requests.side_effect = RequestException("Network error")
+        price = fetch_vestige_price(12345)
 
         assert price is None
 
-    def test_vestige_empty_response(self):
+    def test_vestige_empty_response(self, make_response, patched_requests):
         """Should handle empty response."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = []
-        mock_response.raise_for_status = MagicMock()
-
-        with patch('core.pricing.requests.get', return_value=mock_response):
-            price = fetch_vestige_price(12345)
+        patched_requests.return_value = make_response(_VESTIGE_EMPTY)
+        price = fetch_vestige_price(12345)
 
         assert price is None
 
-    def test_vestige_zero_price(self):
+    def test_vestige_zero_price(self, make_response, patched_requests):
         """Should handle zero price as invalid."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = [{'price': 0}]
-        mock_response.raise_for_status = MagicMock()
-
-        with patch('core.pricing.requests.get', return_value=mock_response):
-            price = fetch_vestige_price(12345)
+        patched_requests.return_value = make_response(_VESTIGE_ZERO)
+        price = fetch_vestige_price(12345)
 
         assert price is None
 
@@ -218,8 +242,6 @@ class TestGoBTCPricing:
 
     def test_gobtc_vestige_success(self):
         """Should use Vestige price when available."""
-        _meld_price_cache['gobtc'] = {'price': None, 'expires': None}
-
         with patch('core.pricing.fetch_vestige_price', return_value=97500.0):
             price = get_gobtc_price()
 
@@ -227,20 +249,18 @@ class TestGoBTCPricing:
 
     def test_gobtc_fallback_to_spot(self):
         """Should fall back to BTC spot price on Vestige failure."""
-        _meld_price_cache['gobtc'] = {'price': None, 'expires': None}
-
-        with patch('core.pricing.fetch_vestige_price', return_value=None):
-            with patch('core.pricing.get_bitcoin_spot_price', return_value=98000.0):
-                price = get_gobtc_price()
+        with patch('core.pricing.fetch_vestige_price', return_value=None), \
+             patch('core.pricing.get_bitcoin_spot_price', return_value=98000.0):
+            price = get_gobtc_price()
 
         assert price == 98000.0
 
-    def test_gobtc_caching(self):
+    def test_gobtc_caching(self, frozen_now):
         """Should cache goBTC price."""
         cached_price = 96000.0
         _meld_price_cache['gobtc'] = {
             'price': cached_price,
-            'expires': datetime.now() + timedelta(seconds=100)
+            'expires': datetime(2025, 1, 1, 12, 1, 40)
         }
 
         price = get_gobtc_price()
@@ -256,16 +276,14 @@ class TestYahooFinancePricing:
             price = get_gold_price()
 
         # Should convert oz to gram
-        expected = 2650.0 / 31.1035
-        assert abs(price - expected) < 0.01
+        assert price == pytest.approx(_GOLD_PER_G, abs=0.01)
 
     def test_silver_price_success(self):
         """Should return silver price per gram."""
         with patch('core.pricing.get_silver_price_per_oz', return_value=30.0):
             price = get_silver_price()
 
-        expected = 30.0 / 31.1035
-        assert abs(price - expected) < 0.01
+        assert price == pytest.approx(_SILVER_PER_G, abs=0.01)
 
     def test_gold_oz_fallback(self):
         """Should fall back to hardcoded price on API failure."""
@@ -288,12 +306,11 @@ class TestYahooFinancePricing:
 class TestAssetPriceRouter:
     """Tests for the main get_asset_price router function."""
 
-    def test_stablecoin_no_api_call(self):
+    @pytest.mark.parametrize("coin", STABLECOINS)
+    def test_stablecoin_no_api_call(self, coin, patched_requests):
         """Stablecoins should return $1 without API call."""
-        stablecoins = ['USDC', 'USDT', 'DAI', 'STBL']
-        for coin in stablecoins:
-            price = get_asset_price(coin)
-            assert price == 1.0
+        assert get_asset_price(coin) == 1.0
+        patched_requests.assert_not_called()
 
     def test_vestige_priority_with_asset_id(self):
         """Should try Vestige first when asset_id is provided."""
@@ -310,14 +327,11 @@ class TestAssetPriceRouter:
 
         assert price == 0.40
 
-    def test_gold_routing(self):
+    @pytest.mark.parametrize("token", ['GOLD$', 'XAUT', 'PAXG'])
+    def test_gold_routing(self, token):
         """Should route gold tokens to gold price."""
-        gold_tokens = ['GOLD$', 'XAUT', 'PAXG']
-
         with patch('core.pricing.get_gold_price', return_value=85.0):
-            for token in gold_tokens:
-                price = get_asset_price(token)
-                assert price == 85.0
+            assert get_asset_price(token) == 85.0
 
     def test_silver_routing(self):
         """Should route SILVER$ to silver price."""
@@ -341,20 +355,30 @@ class TestCacheTTL:
         """Cache TTL should be 5 minutes (300 seconds)."""
         assert MELD_CACHE_TTL_SECONDS == 300
 
-    def test_expired_cache_triggers_refresh(self):
+    def test_expired_cache_triggers_refresh(self, frozen_now):
         """Expired cache should trigger API call."""
         _meld_price_cache['gold'] = {
             'price': 80.0,
-            'expires': datetime.now() - timedelta(seconds=1)  # Expired
+            'expires': datetime(2025, 1, 1, 11, 59, 59)  # Expired
         }
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = [{'price': 85.0}]
-        mock_response.raise_for_status = MagicMock()
-
         with patch('core.pricing.fetch_vestige_price', return_value=85.0):
-            from core.pricing import get_meld_gold_price
             price = get_meld_gold_price()
 
         # Should get new price, not cached
         assert price == 85.0
+
+    def test_fresh_price_expires_after_exactly_ttl(self, frozen_now):
+        """A fetched price should be cached for exactly MELD_CACHE_TTL_SECONDS."""
+        with patch('core.pricing.fetch_vestige_price', return_value=85.0):
+            get_meld_gold_price()
+
+        expires = _meld_price_cache['gold']['expires']
+        assert expires == frozen_now + timedelta(seconds=MELD_CACHE_TTL_SECONDS)
+
+    def test_cache_expires_at_boundary(self, frozen_now):
+        """An entry whose expiry is exactly now is stale."""
+        _meld_price_cache['gold'] = {'price': 80.0, 'expires': frozen_now}
+
+        with patch('core.pricing.fetch_vestige_price', return_value=85.0):
+            assert get_meld_gold_price() == 85.0
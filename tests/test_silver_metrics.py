@@ -0,0 +1,252 @@
+"""
+Tests for core/silver_metrics.py - SQLite storage for silver miner reports
+
+These tests cover:
+- Initial seeding and reseeding
+- Duplicate detection on create
+- Latest-per-company and sector aggregate queries
+"""
+import sqlite3
+import threading
+
+import pytest
+
+import core.silver_metrics as silver_metrics
+from core.silver_metrics import SilverMetricsDB, SilverMinerMetric
+from core.silver_seed import SEED_ROWS, SEED_COUNT
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Fresh database seeded from SEED_ROWS."""
+    db = SilverMetricsDB(db_path=str(tmp_path / 'silver_metrics.db'))
+    yield db
+    db.close()
+
+
+def _metric(ticker='TEST', period='2030-Q1', **overrides):
+    fields = dict(
+        id=None, company='Test Silver', ticker=ticker, period=period,
+        aisc=20.0, production=1.0, revenue=0.1, fcf=0.01,
+        dividend_yield=1.0, market_cap=1.0, tier1=50, tier2=50, tier3=0,
+    )
+    fields.update(overrides)
+    return SilverMinerMetric(**fields)
+
+
+class TestSeeding:
+    """Tests for initial population and reseed."""
+
+    def test_seeds_all_rows(self, db):
+        assert len(db.get_all_metrics(limit=500)) == len(SEED_ROWS)
+
+    def test_reopen_does_not_reseed(self, db):
+        again = SilverMetricsDB(db_path=db.db_path)
+        assert len(again.get_all_metrics(limit=500)) == len(SEED_ROWS)
+        again.close()
+
+    def test_reseed_discards_added_rows(self, db):
+        assert db.create_metric(_metric()) is not None
+        assert db.reseed() == SEED_COUNT
+        assert db.get_metrics_by_ticker('TEST') == []
+        assert len(db.get_all_metrics(limit=500)) == len(SEED_ROWS)
+
+    def test_in_memory_database(self):
+        db = SilverMetricsDB(db_path=':memory:')
+        assert len(db.get_all_metrics(limit=500)) == len(SEED_ROWS)
+        assert db.create_metric(_metric()) is not None
+        assert len(db.get_metrics_by_ticker('TEST')) == 1
+        db.close()
+
+
+class TestQueries:
+    """Tests for read paths."""
+
+    def test_create_duplicate_returns_none(self, db):
+        assert db.create_metric(_metric()) is not None
+        assert db.create_metric(_metric()) is None
+
+    def test_connections_autocommit(self, db):
+        db.create_metric(_metric())
+        db.get_all_metrics()
+        assert db._write_conn.isolation_level is None
+        assert not db._write_conn.in_transaction
+        with db._read() as conn:
+            assert conn.isolation_level is None
+            assert not conn.in_transaction
+
+    def test_read_after_close_raises(self, tmp_path):
+        closed = SilverMetricsDB(db_path=str(tmp_path / 'closed.db'))
+        closed.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            closed.get_all_metrics()
+
+    def test_read_times_out_when_pool_is_empty(self, db, monkeypatch):
+        monkeypatch.setattr(silver_metrics, 'READER_TIMEOUT_SECONDS', 0.01)
+        borrowed = [db._readers.get() for _ in range(silver_metrics.READER_POOL_SIZE)]
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                db.get_all_metrics()
+        finally:
+            for conn in borrowed:
+                db._readers.put(conn)
+
+    def test_create_metrics_batch_skips_duplicates(self, db):
+        assert db.create_metric(_metric(period='2030-Q1')) is not None
+        batch = [_metric(period=p) for p in ('2030-Q1', '2030-Q2', '2030-Q3')]
+        assert db.create_metrics(batch) == 2
+        assert db.create_metrics([]) == 0
+        assert [m.period for m in db.get_metrics_by_ticker('TEST')] == ['2030-Q3', '2030-Q2', '2030-Q1']
+
+    def test_create_metrics_renames_company(self, db):
+        assert db.create_metric(_metric(period='2030-Q1')) is not None
+        assert db.create_metrics([_metric(period='2030-Q2', company='Renamed Silver')]) == 1
+        assert {m.company for m in db.get_metrics_by_ticker('TEST')} == {'Renamed Silver'}
+
+    def test_metrics_by_ticker_newest_first(self, db):
+        metrics = db.get_metrics_by_ticker('PAAS')
+        periods = [m.period for m in metrics]
+        assert periods == sorted(periods, reverse=True)
+        assert metrics[0].company == 'Pan American Silver'
+
+    def test_metrics_between_periods(self, db):
+        metrics = db.get_metrics_between('2024-Q2', '2024-Q4')
+        expected = [row for row in SEED_ROWS if '2024-Q2' <= row[2] <= '2024-Q4']
+        assert len(metrics) == len(expected)
+        assert metrics[0].period == '2024-Q4'
+        assert metrics[-1].period == '2024-Q2'
+
+    def test_latest_by_company(self, db):
+        latest = db.get_latest_by_company()
+        tickers = {row[1] for row in SEED_ROWS}
+        assert {m.ticker for m in latest} == tickers
+        for m in latest:
+            newest = max(row[2] for row in SEED_ROWS if row[1] == m.ticker)
+            assert m.period == newest
+        assert [m.aisc for m in latest] == sorted(m.aisc for m in latest)
+
+    def test_latest_per_ticker_matches_latest_by_company(self, db):
+        per_ticker = db.get_latest_per_ticker()
+        assert [m.ticker for m in per_ticker] == sorted(m.ticker for m in per_ticker)
+        assert set(per_ticker) == set(db.get_latest_by_company())
+
+    def test_sector_stats(self, db):
+        latest = db.get_latest_by_company()
+        stats = db.get_sector_stats()
+        assert stats['company_count'] == len(latest)
+        assert stats['avg_aisc'] == round(sum(m.aisc for m in latest) / len(latest), 2)
+        assert stats['total_production'] == round(sum(m.production for m in latest), 1)
+
+    def test_sector_stats_cache_cleared_on_write(self, db):
+        before = db.get_sector_stats()
+        assert db.get_sector_stats() == before
+        db.create_metric(_metric(ticker='NEWCO', production=100.0))
+        after = db.get_sector_stats()
+        assert after['company_count'] == before['company_count'] + 1
+        assert after['total_production'] == round(before['total_production'] + 100.0, 1)
+
+    def test_period_rollups_track_writes(self, db):
+        def rollup(period):
+            return next(r for r in db.get_period_rollups(limit=500) if r['period'] == period)
+
+        rows = [row for row in SEED_ROWS if row[2] == '2025-Q3']
+        before = rollup('2025-Q3')
+        assert before['n_companies'] == len(rows)
+        assert before['total_production'] == pytest.approx(sum(row[4] for row in rows))
+        assert before['avg_aisc'] == pytest.approx(sum(row[3] for row in rows) / len(rows))
+
+        db.create_metric(_metric(period='2025-Q3', production=2.0))
+        after = rollup('2025-Q3')
+        assert after['n_companies'] == len(rows) + 1
+        assert after['total_production'] == pytest.approx(before['total_production'] + 2.0)
+
+        db.create_metric(_metric(period='2031-Q1'))
+        assert rollup('2031-Q1')['n_companies'] == 1
+
+    def test_to_dict_serializes_timestamp(self, db):
+        d = db.get_all_metrics(limit=1)[0].to_dict()
+        assert d['ticker'] and d['period']
+        assert isinstance(d['timestamp'], str)
+
+    def test_timestamp_parsed_lazily(self, db):
+        metric = db.get_all_metrics(limit=1)[0]
+        assert isinstance(metric.recorded_at, str)
+        assert metric.timestamp.isoformat() == metric.recorded_at.replace(' ', 'T')
+        assert _metric(recorded_at='not a timestamp').timestamp is None
+        assert _metric().timestamp is None
+
+
+class TestMigration:
+    """Tests for upgrading databases created by older schema versions."""
+
+    def test_legacy_flat_table_is_migrated(self, tmp_path):
+        path = str(tmp_path / 'legacy.db')
+        with sqlite3.connect(path) as conn:
+            conn.execute('''
+                CREATE TABLE silver_metrics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    company TEXT NOT NULL,
+                    ticker TEXT NOT NULL,
+                    period TEXT NOT NULL,
+                    aisc REAL NOT NULL,
+                    production REAL NOT NULL,
+                    revenue REAL NOT NULL,
+                    fcf REAL NOT NULL,
+                    dividend_yield REAL NOT NULL,
+                    market_cap REAL NOT NULL,
+                    tier1 INTEGER NOT NULL DEFAULT 0,
+                    tier2 INTEGER NOT NULL DEFAULT 0,
+                    tier3 INTEGER NOT NULL DEFAULT 0,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(ticker, period)
+                )
+            ''')
+            conn.execute('''
+                INSERT INTO silver_metrics
+                (id, company, ticker, period, aisc, production, revenue, fcf,
+                 dividend_yield, market_cap, tier1, tier2, tier3, timestamp)
+                VALUES (7, 'Legacy Silver', 'LEG', '2024-Q2', 19.25, 1.5, 0.125,
+                        -0.015, 0.5, 0.75, 10, 80, 10, '2024-07-01 12:00:00')
+            ''')
+
+        db = SilverMetricsDB(db_path=path)
+        [metric] = db.get_metrics_by_ticker('LEG')
+        db.close()
+
+        assert metric.id == 7
+        assert metric.company == 'Legacy Silver'
+        assert (metric.aisc, metric.production, metric.revenue, metric.fcf) == (19.25, 1.5, 0.125, -0.015)
+        assert (metric.dividend_yield, metric.market_cap) == (0.5, 0.75)
+        assert (metric.tier1, metric.tier2, metric.tier3) == (10, 80, 10)
+        assert metric.timestamp.isoformat() == '2024-07-01T12:00:00'
+
+
+class TestSingleton:
+    """Tests for the module-level get_silver_metrics_db factory."""
+
+    def test_concurrent_first_calls_share_one_instance(self, tmp_path, monkeypatch):
+        created = []
+
+        class CountingDB(SilverMetricsDB):
+            def __init__(self):
+                created.append(self)
+                super().__init__(db_path=str(tmp_path / 'singleton.db'))
+
+        monkeypatch.setattr(silver_metrics, '_silver_db', None)
+        monkeypatch.setattr(silver_metrics, 'SilverMetricsDB', CountingDB)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(silver_metrics.get_silver_metrics_db())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        created[0].close()
+
+        assert len(created) == 1
+        assert all(db is created[0] for db in results)